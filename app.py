@@ -5,19 +5,33 @@ import numpy as np
 import pickle
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, confusion_matrix, classification_report
-from sklearn.model_selection import train_test_split
 import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-import re
 import warnings
-from sklearn.metrics import roc_curve, auc
-from sklearn.preprocessing import label_binarize
-import string
-from io import StringIO
-import csv
-import requests
+import os
+import tempfile
+from sentiment.cleaning import clean_text
+from sentiment.stopwords import get_stopwords, filter_tokens
+from sentiment.stemming import get_stemming_service
+from sentiment.slang import NOTEBOOK_SLANGWORDS, SlangNormalizer
+from sentiment.tokenizer import TOKENIZER_MODES, DEFAULT_TOKENIZER_MODE, tokenize
+from sentiment.pipeline import FUSED_COLUMNS, PIPELINE_COLUMNS, NotebookPipeline
+from sentiment.labeling import get_lexicon_scorer
+from sentiment.cache import DEFAULT_PREPROCESS_CACHE_PATH, config_fingerprint, get_prediction_cache, get_preprocess_cache
+from sentiment.parallel import DEFAULT_CHUNK_SIZE, ParallelPreprocessor, default_workers, parallel_preprocess
+from sentiment.ingest import DEFAULT_INGEST_CHUNK_SIZE, read_csv_columns, stream_preprocess
+from sentiment.artifacts import artifacts_stale, load_artifacts, model_version
+from sentiment.folding import FoldedLinearPipeline
+from sentiment.primal import PrimalLinearSVC
+from sentiment.predict import DEFAULT_PREDICT_BATCH_SIZE, BatchPredictor, preprocess_fingerprint, preprocess_text
+from sentiment.evaluation import (
+    EVALUATION_MODEL_NAMES, class_metrics_frame, dataset_fingerprint, evaluate_models, evaluation_key,
+    EVAL_TEST_SIZE, get_evaluation_cache, metrics_dict, read_report, report_stale,
+)
+from sentiment.streaming_eval import STREAMING_EVAL_MIN_ROWS, evaluate_models_streaming
+from sentiment.batching import MicroBatcher
+from sentiment.features import HASHING_N_FEATURES, active_feature_count, make_vectorizer
+from sentiment.figures import figure_key, get_figure_cache
+from sentiment.dataset import LABELLED_CSV_PATH, load_labelled_dataset
 warnings.filterwarnings('ignore')
 
 # Download required NLTK data
@@ -35,114 +49,36 @@ except LookupError:
     nltk.download('punkt_tab')
 
 # ===== PREPROCESSING FUNCTIONS FROM NOTEBOOK =====
-def remove_noise(text):
-    """Remove URLs, mentions, hashtags, retweets, special characters"""
-    text = str(text)
-    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-    text = re.sub(r'@\w+|#\w+', '', text)
-    text = re.sub(r'RT[\s]+', '', text)
-    text = re.sub(r'[^\w\s]', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
-
 def to_lowercase(text):
     """Convert to lowercase"""
     return str(text).lower()
 
-def tokenize_words(text):
-    """Tokenize text into words"""
-    return word_tokenize(text)
+def tokenize_words(text, mode=DEFAULT_TOKENIZER_MODE):
+    """Tokenize text into words (mode: 'nltk', 'regex', atau 'split')"""
+    return tokenize(text, mode)
 
 def remove_stopwords(tokens):
     """Remove Indonesian stopwords"""
-    list_stopwords = set(stopwords.words('indonesian'))
-    list_stopwords.update(['iya', 'yaa', 'gak', 'nya', 'na', 'sih', 'ku', 'di', 'ga', 'ya', 'gaa', 'loh', 'kah', 'woi', 'woii', 'woy'])
-    filtered = [token for token in tokens if token not in list_stopwords]
-    return filtered
+    return filter_tokens(tokens, 'notebook')
 
 def stemmingText(text):
-    """Apply stemming (not used in current pipeline but available)"""
-    from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
-    factory = StemmerFactory()
-    stemmer = factory.create_stemmer()
-    words = text.split()
-    stemmed_words = [stemmer.stem(word) for word in words]
-    return ' '.join(stemmed_words)
+    """Apply stemming (optional step in the Upload CSV pipeline)"""
+    # Satu stemmer bersama + cache per kata (LRU memori & SQLite)
+    return get_stemming_service().stem_text(text)
 
 def reconstruct_text(list_words):
     """Convert list of words back to sentence"""
     return ' '.join(word for word in list_words)
 
-# Slang dictionary from notebook
-slangwords_notebook = {
-    "gk": "tidak", "ga": "tidak", "gak": "tidak", "ngga": "tidak", "nggak": "tidak",
-    "udah": "sudah", "udh": "sudah", "dah": "sudah",
-    "tp": "tapi", "tapi": "tetapi",
-    "bgt": "banget", "banget": "sangat",
-    "bgus": "bagus", "bgs": "bagus",
-    "jelek": "buruk", "jlek": "buruk",
-    "mantap": "bagus", "mantul": "bagus",
-    "keren": "bagus", "ok": "oke", "oke": "baik",
-    "thx": "terima kasih", "thanks": "terima kasih", "makasih": "terima kasih",
-    "plz": "tolong", "pls": "tolong",
-    "yg": "yang", "dgn": "dengan", "utk": "untuk", "sdh": "sudah",
-    "hrs": "harus", "tdk": "tidak", "blm": "belum", "krn": "karena",
-    "gmn": "bagaimana", "gimana": "bagaimana",
-    "knp": "kenapa", "knapa": "kenapa",
-    "emg": "memang", "emang": "memang",
-    "cuma": "hanya", "cm": "hanya",
-    "sih": "", "nih": "", "dong": "", "deh": "", "lah": "", "kah": "",
-    "@": "di", "abis": "habis", "wtb": "beli", "masi": "masih", "wts": "jual", "wtt": "tukar",
-    "maks": "maksimal", "plisss": "tolong", "bgttt": "banget", "indo": "indonesia", "bgtt": "banget",
-    "ad": "ada", "rv": "redvelvet", "plis": "tolong", "pls": "tolong", "cr": "sumber",
-    "cod": "bayar ditempat", "adlh": "adalah", "afaik": "as far as i know", "ahaha": "haha",
-    "aj": "saja", "ajep-ajep": "dunia gemerlap", "ak": "saya", "akika": "aku", "akkoh": "aku",
-    "akuwh": "aku", "alay": "norak", "alow": "halo", "ambilin": "ambilkan", "ancur": "hancur",
-    "anjrit": "anjing", "anter": "antar", "ap2": "apa-apa", "apasih": "apa sih", "apes": "sial",
-    "aps": "apa", "aq": "saya", "aquwh": "aku", "asbun": "asal bunyi", "aseekk": "asyik",
-    "asekk": "asyik", "asem": "asam", "astul": "asal tulis", "ato": "atau",
-    "au ah": "tidak mau tahu", "awak": "saya", "ay": "sayang", "ayank": "sayang",
-    "b4": "sebelum", "bakalan": "akan", "bangedh": "banget", "begajulan": "nakal",
-    "beliin": "belikan", "bencong": "banci", "bentar": "sebentar", "ber3": "bertiga",
-    "beresin": "membereskan", "bete": "bosan", "beud": "banget", "bg": "abang",
-    "bgmn": "bagaimana", "bijimane": "bagaimana", "bkl": "akan", "bknnya": "bukannya",
-    "blegug": "bodoh", "blh": "boleh", "bln": "bulan", "blum": "belum", "bnci": "benci",
-    "bnran": "yang benar", "bodor": "lucu", "bokap": "ayah", "boker": "buang air besar",
-    "bokis": "bohong", "boljug": "boleh juga", "boyeh": "boleh", "br": "baru",
-    "brg": "bareng", "bro": "saudara laki-laki", "bru": "baru", "bs": "bisa",
-    "bsen": "bosan", "bt": "buat", "btw": "ngomong-ngomong", "buaya": "tidak setia",
-    "bubbu": "tidur", "bubu": "tidur", "bw": "bawa", "bwt": "buat", "byk": "banyak",
-    "byrin": "bayarkan", "cabal": "sabar", "cadas": "keren", "can": "belum",
-    "capcus": "pergi", "caper": "cari perhatian", "ce": "cewek", "cemen": "penakut",
-    "cengengesan": "tertawa", "cepet": "cepat", "cew": "cewek", "chuyunk": "sayang",
-    "cimeng": "ganja", "ciyh": "sih", "ckepp": "cakep", "ckp": "cakep",
-    "cmiiw": "correct me if i'm wrong", "cmpur": "campur", "cong": "banci",
-    "cowwyy": "maaf", "cp": "siapa", "cpe": "capek", "cppe": "capek", "cucok": "cocok",
-    "cuex": "cuek", "cumi": "Cuma miscall", "cups": "culun", "cwek": "cewek",
-    "cyin": "cinta", "d": "di", "dah": "deh", "dapet": "dapat", "de": "adik",
-    "dek": "adik", "demen": "suka", "deyh": "deh", "dgn": "dengan", "diancurin": "dihancurkan",
-    "dimaafin": "dimaafkan", "dimintak": "diminta", "disono": "di sana", "dket": "dekat",
-    "dkk": "dan kawan-kawan", "dll": "dan lain-lain", "dlu": "dulu", "dngn": "dengan",
-    "dodol": "bodoh", "doku": "uang", "dongs": "dong", "dpt": "dapat", "dri": "dari",
-    "drmn": "darimana", "drtd": "dari tadi", "dst": "dan seterusnya", "dtg": "datang",
-    "duh": "aduh", "duren": "durian", "ed": "edisi", "egp": "emang gue pikirin",
-    "eke": "aku", "elu": "kamu", "emangnya": "memangnya", "emng": "memang", "endak": "tidak",
-    "enggak": "tidak", "envy": "iri", "ex": "mantan", "fax": "facsimile",
-    "fifo": "first in first out", "folbek": "follow back", "fyi": "sebagai informasi",
-    "gaada": "tidak ada uang", "gag": "tidak", "gaje": "tidak jelas", "gak papa": "tidak apa-apa",
-    "gan": "juragan", "gaptek": "gagap teknologi", "gatek": "gagap teknologi", "gawe": "kerja",
-    "gbs": "tidak bisa", "gebetan": "orang yang disuka", "geje": "tidak jelas",
-    "gile": "gila", "gino": "gigi nongol", "githu": "gitu", "gj": "tidak jelas",
-    "gmana": "bagaimana", "gn": "begini", "goblok": "bodoh", "gowes": "mengayuh sepeda",
-    "gpny": "tidak punya", "gr": "gede rasa", "gretongan": "gratisan", "gtau": "tidak tahu",
-    "gua": "saya", "guoblok": "goblok", "gw": "saya"
-}
+# Slang dictionary from notebook (lihat sentiment/slang.py)
+slangwords_notebook = NOTEBOOK_SLANGWORDS
+
+# Dikompilasi sekali menjadi token-trie (key multi-kata seperti "au ah" ikut diganti)
+slang_normalizer_notebook = SlangNormalizer(slangwords_notebook)
 
 def normalize_slang_notebook(text):
     """Normalize slang words - notebook version"""
-    words = text.split()
-    fixed_words = [slangwords_notebook.get(word.lower(), word) for word in words]
-    return ' '.join(fixed_words)
+    return slang_normalizer_notebook.normalize(text)
 # ===== END PREPROCESSING FUNCTIONS =====
 
 # Set page config
@@ -577,88 +513,69 @@ from pathlib import Path
 # ========================================
 
 def remove_noise(text):
-    """Hapus noise seperti URL, mention, hashtag, emoticon"""
-    if pd.isna(text):
-        return ""
-    text = str(text)
-    # Hapus URL
-    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-    # Hapus mention (@username)
-    text = re.sub(r'@\w+', '', text)
-    # Hapus hashtag (#)
-    text = re.sub(r'#\w+', '', text)
-    # Hapus email
-    text = re.sub(r'\S+@\S+', '', text)
-    # Hapus angka
-    text = re.sub(r'\d+', '', text)
-    # Hapus karakter khusus dan punctuation
-    text = text.translate(str.maketrans('', '', string.punctuation))
-    # Hapus whitespace berlebih
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    """Hapus noise seperti URL, mention, hashtag, email, angka, punctuation"""
+    # Pola regex sudah dikompilasi sekali di sentiment.cleaning
+    return clean_text(text)
 
 def to_lowercase(text):
     """Convert text ke lowercase"""
     return str(text).lower()
 
-def tokenize_words_custom(text):
-    """Tokenisasi kata"""
-    return word_tokenize(text)
+def tokenize_words_custom(text, mode=DEFAULT_TOKENIZER_MODE):
+    """Tokenisasi kata (mode: 'nltk', 'regex', atau 'split')"""
+    return tokenize(text, mode)
 
 def remove_stopwords_custom(tokens):
     """Hapus stopwords Indonesia dan Inggris"""
-    # Stopwords Indonesia
-    indonesian_stopwords = set([
-        'yang', 'untuk', 'pada', 'ke', 'para', 'namun', 'menurut', 'antara', 'dia', 'dua',
-        'ia', 'seperti', 'jika', 'jika', 'sehingga', 'kembali', 'dan', 'tidak', 'ini', 'karena',
-        'oleh', 'itu', 'dalam', 'dari', 'dengan', 'di', 'ada', 'akan', 'sudah', 'bisa', 'dapat',
-        'saat', 'hanya', 'atau', 'juga', 'setelah', 'mereka', 'saya', 'kamu', 'kami', 'kita'
-    ])
-    
-    # Stopwords English
-    english_stopwords = set(stopwords.words('english'))
-    
-    # Gabungkan
-    all_stopwords = indonesian_stopwords.union(english_stopwords)
+    # Stopwords Indonesia manual + Inggris (dibangun sekali di registry)
+    all_stopwords = get_stopwords('custom')
     
     # Filter tokens
     filtered = [token for token in tokens if token.lower() not in all_stopwords and len(token) > 2]
     return filtered
 
+# Kamus slang untuk full_preprocess_pipeline (dibuat sekali di level modul)
+slang_dict = {
+    'gk': 'tidak', 'ga': 'tidak', 'gak': 'tidak', 'ngga': 'tidak', 'nggak': 'tidak',
+    'udah': 'sudah', 'udh': 'sudah', 'dah': 'sudah',
+    'tp': 'tapi', 'tapi': 'tetapi',
+    'bgt': 'banget', 'banget': 'sangat',
+    'bgus': 'bagus', 'bgs': 'bagus',
+    'jelek': 'buruk', 'jlek': 'buruk',
+    'mantap': 'bagus', 'mantul': 'bagus',
+    'keren': 'bagus', 'ok': 'oke', 'oke': 'baik',
+    'thx': 'terima kasih', 'thanks': 'terima kasih', 'makasih': 'terima kasih',
+    'plz': 'tolong', 'pls': 'tolong',
+    'yg': 'yang', 'dgn': 'dengan', 'utk': 'untuk', 'sdh': 'sudah',
+    'hrs': 'harus', 'tdk': 'tidak', 'blm': 'belum', 'krn': 'karena',
+    'gmn': 'bagaimana', 'gimana': 'bagaimana',
+    'knp': 'kenapa', 'knapa': 'kenapa',
+    'emg': 'memang', 'emang': 'memang',
+    'cuma': 'hanya', 'cm': 'hanya',
+    'sih': '', 'nih': '', 'dong': '', 'deh': '', 'lah': '', 'kah': '',
+}
+slang_normalizer = SlangNormalizer(slang_dict)
+
 def normalize_slang(text):
     """Normalisasi slang words Indonesia"""
-    slang_dict = {
-        'gk': 'tidak', 'ga': 'tidak', 'gak': 'tidak', 'ngga': 'tidak', 'nggak': 'tidak',
-        'udah': 'sudah', 'udh': 'sudah', 'dah': 'sudah',
-        'tp': 'tapi', 'tapi': 'tetapi',
-        'bgt': 'banget', 'banget': 'sangat',
-        'bgus': 'bagus', 'bgs': 'bagus',
-        'jelek': 'buruk', 'jlek': 'buruk',
-        'mantap': 'bagus', 'mantul': 'bagus',
-        'keren': 'bagus', 'ok': 'oke', 'oke': 'baik',
-        'thx': 'terima kasih', 'thanks': 'terima kasih', 'makasih': 'terima kasih',
-        'plz': 'tolong', 'pls': 'tolong',
-        'yg': 'yang', 'dgn': 'dengan', 'utk': 'untuk', 'sdh': 'sudah',
-        'hrs': 'harus', 'tdk': 'tidak', 'blm': 'belum', 'krn': 'karena',
-        'gmn': 'bagaimana', 'gimana': 'bagaimana',
-        'knp': 'kenapa', 'knapa': 'kenapa',
-        'emg': 'memang', 'emang': 'memang',
-        'cuma': 'hanya', 'cm': 'hanya',
-        'sih': '', 'nih': '', 'dong': '', 'deh': '', 'lah': '', 'kah': '',
-    }
-    
-    words = text.split()
-    normalized_words = [slang_dict.get(word.lower(), word) for word in words]
-    return ' '.join(normalized_words)
+    return slang_normalizer.normalize(text)
 
 def reconstruct_text(tokens):
     """Gabungkan tokens kembali jadi text"""
     return ' '.join(tokens)
 
+# Hasil per teks mentah di-cache; fingerprint ikut berubah jika slang/stopword/tokenizer berubah
+full_preprocess_cache = get_preprocess_cache(
+    config_fingerprint('full_preprocess_pipeline', slang_dict, get_stopwords('custom'), DEFAULT_TOKENIZER_MODE)
+)
+
 def full_preprocess_pipeline(text):
     """Pipeline preprocessing lengkap"""
     if pd.isna(text) or text == '':
         return ""
+    return full_preprocess_cache.get_or_compute(text, _full_preprocess_uncached)
+
+def _full_preprocess_uncached(text):
     text = remove_noise(text)
     text = to_lowercase(text)
     text = normalize_slang(text)
@@ -668,112 +585,119 @@ def full_preprocess_pipeline(text):
     return text
 
 # Lexicon Scoring - SAMA SEPERTI MODEL.PY
-@st.cache_data
-def load_lexicon():
-    """Load lexicon dari GitHub (sama seperti Model.py)"""
-    import csv
-    import requests
-    from io import StringIO
-    
-    # Load positive lexicon
-    lexicon_positive = dict()
-    try:
-        response = requests.get('https://raw.githubusercontent.com/angelmetanosaa/dataset/main/lexicon_positive.csv')
-        if response.status_code == 200:
-            reader = csv.reader(StringIO(response.text), delimiter=',')
-            for row in reader:
-                if len(row) >= 2:
-                    lexicon_positive[row[0]] = int(row[1])
-    except Exception as e:
-        st.warning(f"⚠️ Gagal load positive lexicon: {e}")
-    
-    # Load negative lexicon
-    lexicon_negative = dict()
+def load_lexicon_scorer():
+    """Scorer lexicon batch (matriks sparse) dari store data/lexicon; None jika lexicon tidak tersedia"""
     try:
-        response = requests.get('https://raw.githubusercontent.com/angelmetanosaa/dataset/main/lexicon_negative.csv')
-        if response.status_code == 200:
-            reader = csv.reader(StringIO(response.text), delimiter=',')
-            for row in reader:
-                if len(row) >= 2:
-                    lexicon_negative[row[0]] = int(row[1])
-    except Exception as e:
-        st.warning(f"⚠️ Gagal load negative lexicon: {e}")
-    
-    return lexicon_positive, lexicon_negative
-
-def sentiment_analysis_lexicon_indonesia(tokens, lexicon_positive, lexicon_negative):
-    """Hitung sentiment score berdasarkan lexicon Indonesia (sama seperti Model.py)"""
-    score = 0
-    
-    # Hitung score dari positive words
-    for word in tokens:
-        if word in lexicon_positive:
-            score = score + lexicon_positive[word]
-    
-    # Hitung score dari negative words  
-    for word in tokens:
-        if word in lexicon_negative:
-            score = score + lexicon_negative[word]
-    
-    # Tentukan polarity
-    if score > 0:
-        polarity = 'positive'
-    elif score < 0:
-        polarity = 'negative'
-    else:
-        polarity = 'neutral'
-    
-    return score, polarity
+        return get_lexicon_scorer()
+    except (OSError, ValueError) as e:
+        # tanpa lexicon semua ulasan akan berlabel neutral: hentikan labeling
+        st.error(f"❌ Gagal load lexicon: {e}")
+        return None
 
 # Load data dan models
 @st.cache_resource
-def load_data():
+def load_data(columns=None):
+    """Dataset berlabel; `columns` membatasi kolom yang dibaca (Parquet kolumnar, lihat sentiment/dataset.py)"""
     try:
-        df = pd.read_csv('data/ulasan_aplikasi_labelled.csv')
-        return df
+        return load_labelled_dataset(LABELLED_CSV_PATH, columns=columns)
     except FileNotFoundError:
         st.error("Data tidak ditemukan! Pastikan file 'data/ulasan_aplikasi_labelled.csv' ada.")
         return None
 
-@st.cache_resource
-def load_models():
-    base = Path(__file__).parent
-    model_dir = base / "model"
-
-    files = {
-        "svm": model_dir / "svm_model.pkl",
-        "tfidf": model_dir / "tfidf_vectorizer.pkl",
-        "pipeline": model_dir / "pipeline_best.pkl",
-        "le": model_dir / "label_encoder.pkl",
-    }
+MODEL_DIR = Path(__file__).parent / "model"
+MODEL_FILES = {
+    "svm": MODEL_DIR / "svm_model.pkl",
+    "tfidf": MODEL_DIR / "tfidf_vectorizer.pkl",
+    "pipeline": MODEL_DIR / "pipeline_best.pkl",
+    "le": MODEL_DIR / "label_encoder.pkl",
+}
+
+def load_model_file(name):
+    """Load satu artefak model dari MODEL_FILES; None (dengan pesan error) jika gagal"""
+    path = MODEL_FILES[name]
 
     # cek eksistensi dan ukuran file
-    for name, path in files.items():
-        if not path.exists():
-            st.error(f"Model file not found: {path}")
-            return None, None, None, None
-        if path.stat().st_size == 0:
-            st.error(f"Model file appears empty/corrupt: {path}")
-            return None, None, None, None
-
-    def safe_load(path):
-        # coba joblib.load dulu
+    if not path.exists():
+        st.error(f"Model file not found: {path}")
+        return None
+    if path.stat().st_size == 0:
+        st.error(f"Model file appears empty/corrupt: {path}")
+        return None
+
+    # coba joblib.load dulu
+    try:
+        return joblib.load(path)
+    except Exception as e_joblib:
+        # fallback ke pickle sebagai opsi terakhir
         try:
-            return joblib.load(path)
-        except Exception as e_joblib:
-            # fallback ke pickle sebagai opsi terakhir
-            try:
-                with open(path, "rb") as f:
-                    return pickle.load(f)
-            except Exception as e_pickle:
-                # tampilkan kedua error untuk debugging
-                st.error(f"Failed to load {path} with joblib ({e_joblib}) and pickle ({e_pickle})")
-                return None
-
-    svm_model = safe_load(files["svm"])
-    tfidf_vectorizer = safe_load(files["tfidf"])
-    pipeline_model = safe_load(files["pipeline"])
-    label_encoder = safe_load(files["le"])
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e_pickle:
+            # tampilkan kedua error untuk debugging
+            st.error(f"Failed to load {path} with joblib ({e_joblib}) and pickle ({e_pickle})")
+            return None
+
+@st.cache_resource(show_spinner=False)
+def load_model_artifacts():
+    """Artefak model memory-mapped (model/artifacts); None jika belum diekspor atau basi"""
+    try:
+        artifacts = load_artifacts()
+    except FileNotFoundError:
+        return None
+    except ValueError as e:
+        st.warning(f"⚠️ Artefak model tidak valid, memakai pickle: {e}")
+        return None
+    if artifacts_stale(artifacts.manifest):
+        st.warning("⚠️ Artefak model lebih lama dari pickle, memakai pickle. Jalankan `python -m sentiment.artifacts export`.")
+        return None
+    return artifacts
+
+# Setiap handle di-cache terpisah dan baru dimuat saat halaman membutuhkannya,
+# sehingga Dashboard / Data Overview / Upload CSV tidak memuat pickle model sama sekali.
+@st.cache_resource(show_spinner="📦 Memuat model SVM...")
+def load_svm_models():
+    """SVM + TF-IDF vectorizer"""
+    artifacts = load_model_artifacts()
+    if artifacts is not None:
+        # Bobot primal: satu perkalian matriks, tanpa support vector
+        return artifacts.svm_model(), artifacts.tfidf_vectorizer()
+    svm_model = load_model_file("svm")
+    tfidf_vectorizer = load_model_file("tfidf")
+    if svm_model is None or tfidf_vectorizer is None:
+        return None, None
+    try:
+        svm_model = PrimalLinearSVC.from_svc(svm_model)
+    except (AttributeError, ValueError):
+        pass  # kernel non-linear: pakai SVC asli
+    return svm_model, tfidf_vectorizer
+
+@st.cache_resource(show_spinner="📦 Memuat model Logistic Regression...")
+def load_pipeline_model():
+    """Pipeline TF-IDF -> SelectKBest -> SVD -> Logistic Regression"""
+    artifacts = load_model_artifacts()
+    if artifacts is not None:
+        return artifacts.pipeline_model()
+    pipeline_model = load_model_file("pipeline")
+    if pipeline_model is None:
+        return None
+    # Tahap linear dilipat jadi satu perkalian matriks; pipeline asli dipakai jika tidak didukung
+    try:
+        return FoldedLinearPipeline.from_pipeline(pipeline_model)
+    except (AttributeError, ValueError):
+        return pipeline_model
+
+@st.cache_resource(show_spinner=False)
+def load_label_encoder():
+    artifacts = load_model_artifacts()
+    if artifacts is not None:
+        return artifacts.label_encoder()
+    return load_model_file("le")
+
+def load_models():
+    """Semua model sekaligus (untuk halaman yang membutuhkan kedua model)"""
+    svm_model, tfidf_vectorizer = load_svm_models()
+    pipeline_model = load_pipeline_model()
+    label_encoder = load_label_encoder()
 
     # jika salah satu gagal, kembalikan None agar app menampilkan error
     if any(x is None for x in [svm_model, tfidf_vectorizer, pipeline_model, label_encoder]):
@@ -782,28 +706,65 @@ def load_models():
 
     return svm_model, tfidf_vectorizer, pipeline_model, label_encoder
 
-# Text preprocessing function
-def preprocess_text(text):
-    if isinstance(text, float):
-        return ""
-    # Convert to lowercase
-    text = str(text).lower()
-    # Remove URLs
-    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-    # Remove email addresses
-    text = re.sub(r'\S+@\S+', '', text)
-    # Remove special characters
-    text = re.sub(r'[^a-zA-Z\s]', '', text)
-    # Tokenize
-    tokens = word_tokenize(text)
-    # Remove stopwords
-    stop_words = set(stopwords.words('english'))
-    tokens = [token for token in tokens if token not in stop_words and len(token) > 2]
-    return ' '.join(tokens)
+@st.cache_resource(show_spinner=False)
+def load_model_version(*names):
+    """Versi model (sha256 pickle sumber) untuk kunci cache prediksi"""
+    artifacts = load_model_artifacts()
+    return model_version(names, artifacts.manifest if artifacts is not None else None)
+
+# Cache prediksi bersama untuk semua sesi: (model, versi model, teks hasil preprocessing)
+prediction_cache = get_prediction_cache()
+# Cache hasil evaluasi (memori + .cache/evaluation): (dataset, checksum model, seed split)
+evaluation_cache = get_evaluation_cache()
+# Cache chart yang sudah di-render (bytes PNG), kunci: nama chart + parameter + data
+figure_cache = get_figure_cache()
+
+def show_figure(key, draw):
+    """Tampilkan chart dari cache; `draw()` (mengembalikan Figure) hanya dipanggil saat miss"""
+    st.image(figure_cache.get_or_render(key, draw), use_container_width=True)
+
+def draw_confusion_matrix(cm, labels, cmap, title=None, axis_labels=False):
+    fig, ax = plt.subplots(figsize=(6, 5))
+    sns.heatmap(
+        cm, annot=True, fmt='d', cmap=cmap,
+        xticklabels=labels,
+        yticklabels=labels,
+        ax=ax
+    )
+    if title:
+        ax.set_title(title)
+    if axis_labels:
+        ax.set_ylabel('True Label')
+        ax.set_xlabel('Predicted Label')
+    return fig
 
-# Load data and models
-df = load_data()
-svm_model, tfidf_vectorizer, pipeline_model, label_encoder = load_models()
+def make_predictor(model_choice, label_encoder):
+    """BatchPredictor untuk model pilihan di halaman Prediksi; None jika model gagal dimuat"""
+    if model_choice == "SVM + TF-IDF":
+        svm_model, tfidf_vectorizer = load_svm_models()
+        if svm_model is None:
+            return None
+        return BatchPredictor(
+            svm_model, label_encoder, vectorizer=tfidf_vectorizer, preprocess=preprocess_text,
+            cache=prediction_cache, model_id="svm", model_version=load_model_version("svm", "tfidf"),
+        )
+    pipeline_model = load_pipeline_model()
+    if pipeline_model is None:
+        return None
+    return BatchPredictor(
+        pipeline_model, label_encoder, preprocess=preprocess_text,
+        cache=prediction_cache, model_id="pipeline", model_version=load_model_version("pipeline"),
+    )
+
+@st.cache_resource(show_spinner=False)
+def get_micro_batcher(model_id, model_version, _predictor):
+    """MicroBatcher bersama semua sesi: prediksi tunggal yang bersamaan dijalankan satu batch"""
+    return MicroBatcher(_predictor.predict_rows)
+
+# Text preprocessing function (dipakai bersama server HTTP, lihat sentiment/predict.py)
+# Data dan model dimuat lazy per halaman, hanya kolom yang dipakai halaman tersebut
+DASHBOARD_COLUMNS = ('content', 'polarity')
+EVALUATION_COLUMNS = ('final_text', 'polarity')
 
 # Initialize session state for accuracy variables
 if 'svm_accuracy' not in st.session_state:
@@ -853,6 +814,7 @@ if page == "📊 Dashboard":
     """, unsafe_allow_html=True)
     
     # Metrics Section
+    df = load_data(DASHBOARD_COLUMNS)
     if df is not None:
         col1, col2, col3 = st.columns(3)
         
@@ -969,51 +931,95 @@ elif page == "🔍 Evaluasi Model":
         </div>
     """, unsafe_allow_html=True)
     
-    if df is not None and svm_model is not None and pipeline_model is not None:
-        # ======================
-        # 1. Siapkan data uji
-        # ======================
-        X = df['final_text'].fillna('').apply(preprocess_text)
-        y = df['polarity']
-        
-        # Encode labels ke numerik
-        y_encoded = label_encoder.transform(y)
-        
-        # Split data (konsisten di semua evaluasi)
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y_encoded,
-            test_size=0.2,
-            random_state=42,
-            stratify=y_encoded
-        )
+    # ======================
+    # 1. Hasil evaluasi: laporan training (default), lalu cache / hitung ulang dari data
+    # ======================
+    try:
+        eval_model_checksum = load_model_version(*EVALUATION_MODEL_NAMES)
+    except FileNotFoundError:
+        eval_model_checksum = None
+    evaluation_report = read_report()
+    report_usable = (
+        evaluation_report is not None and eval_model_checksum is not None
+        and not report_stale(evaluation_report, eval_model_checksum)
+    )
+    recompute_evaluation = st.session_state.get('evaluation_recompute', False)
+    # Dataset hanya dibaca jika laporan training tidak dipakai
+    df = None if report_usable and not recompute_evaluation else load_data(EVALUATION_COLUMNS)
+
+    evaluation = None
+    evaluation_cached = False
+    if report_usable and not recompute_evaluation:
+        evaluation = evaluation_report
+    elif df is not None:
+        if eval_model_checksum is not None:
+            eval_key = evaluation_key(
+                dataset_fingerprint(df['final_text'], df['polarity'], preprocess_fingerprint()),
+                eval_model_checksum,
+            )
+            evaluation = evaluation_cache.get(eval_key)
+            evaluation_cached = evaluation is not None
+        if evaluation is None:
+            svm_model, tfidf_vectorizer, pipeline_model, label_encoder = load_models()
+            if svm_model is not None and pipeline_model is not None:
+                eval_args = (
+                    df['final_text'], label_encoder.transform(df['polarity']),
+                    svm_model, tfidf_vectorizer, pipeline_model, label_encoder,
+                )
+                if len(df) * EVAL_TEST_SIZE > STREAMING_EVAL_MIN_ROWS:
+                    # Data uji besar: prediksi per chunk, metrik diakumulasi (memori konstan)
+                    eval_progress = st.progress(0.0, text="🔄 Mengevaluasi model per chunk...")
+                    evaluation = evaluate_models_streaming(
+                        *eval_args, preprocess=preprocess_text,
+                        progress_callback=lambda done, total: eval_progress.progress(
+                            done / total, text=f"🔄 Mengevaluasi model per chunk... {done:,}/{total:,} baris"
+                        ),
+                    )
+                    eval_progress.empty()
+                else:
+                    with st.spinner("🔄 Mengevaluasi model..."):
+                        # Preprocess hanya baris data uji; split sama dengan train_test_split(stratify=y, seed 42)
+                        evaluation = evaluate_models(*eval_args, preprocess=preprocess_text)
+                if eval_model_checksum is not None:
+                    evaluation_cache.put(eval_key, evaluation)
+
+    if report_usable:
+        if recompute_evaluation:
+            if st.button("📄 Tampilkan laporan training", key="evaluation_use_report"):
+                st.session_state.evaluation_recompute = False
+                st.rerun()
+        else:
+            st.caption(
+                f"📄 Dari laporan evaluasi training (model/evaluation_report.npz, dibuat {evaluation_report['created_at']}, "
+                f"{len(evaluation_report['test_index']):,} data uji)"
+            )
+            if st.button("🔄 Hitung ulang dari data", key="evaluation_recompute_button"):
+                st.session_state.evaluation_recompute = True
+                st.rerun()
+    elif evaluation_report is not None:
+        st.info("ℹ️ Laporan evaluasi training dibuat untuk model lain; hasil dihitung dari data.")
+
+    if evaluation is not None:
+        class_names = evaluation['label_classes']
+        svm_metrics = metrics_dict(evaluation, 'svm')
+        pipeline_metrics = metrics_dict(evaluation, 'pipeline')
+        svm_accuracy, svm_precision, svm_recall, svm_f1 = svm_metrics.values()
+        pipeline_accuracy, pipeline_precision, pipeline_recall, pipeline_f1 = pipeline_metrics.values()
+        st.session_state.svm_accuracy = svm_accuracy
+        st.session_state.pipeline_accuracy = pipeline_accuracy
+        if evaluation_cached:
+            st.caption("⚡ Hasil evaluasi diambil dari cache (dataset, model, dan seed split tidak berubah)")
+        if 'n_test' in evaluation:
+            st.caption(
+                f"🌊 Evaluasi streaming: {int(evaluation['n_test']):,} data uji diprediksi per chunk; "
+                "ROC/AUC dihitung dari histogram skor"
+            )
         
         # ======================
         # 2. Evaluasi Kedua Model (Kiri-Kanan)
         # ======================
         st.markdown("<div class='section-container'>", unsafe_allow_html=True)
         
-        # Transform test data dengan TF-IDF untuk SVM
-        X_test_tfidf = tfidf_vectorizer.transform(X_test)
-        svm_pred = svm_model.predict(X_test_tfidf)
-        
-        # Metrik SVM
-        svm_accuracy = accuracy_score(y_test, svm_pred)
-        st.session_state.svm_accuracy = svm_accuracy
-        svm_precision = precision_score(y_test, svm_pred, average='weighted', zero_division=0)
-        svm_recall = recall_score(y_test, svm_pred, average='weighted', zero_division=0)
-        svm_f1 = f1_score(y_test, svm_pred, average='weighted', zero_division=0)
-        
-        # Pipeline prediksi untuk Logistic Regression
-        pipeline_pred = pipeline_model.predict(X_test)
-        pipeline_pred_encoded = label_encoder.transform(pipeline_pred) if isinstance(pipeline_pred[0], str) else pipeline_pred
-        
-        # Metrik Logistic Regression
-        pipeline_accuracy = accuracy_score(y_test, pipeline_pred_encoded)
-        st.session_state.pipeline_accuracy = pipeline_accuracy
-        pipeline_precision = precision_score(y_test, pipeline_pred_encoded, average='weighted', zero_division=0)
-        pipeline_recall = recall_score(y_test, pipeline_pred_encoded, average='weighted', zero_division=0)
-        pipeline_f1 = f1_score(y_test, pipeline_pred_encoded, average='weighted', zero_division=0)
-        
         # Layout Kiri-Kanan
         left_col, right_col = st.columns(2)
         
@@ -1027,21 +1033,16 @@ elif page == "🔍 Evaluasi Model":
             st.metric("Precision", f"{svm_precision:.4f}")
             st.metric("Recall", f"{svm_recall:.4f}")
             st.metric("F1-Score", f"{svm_f1:.4f}")
+            with st.expander("📋 Metrik per kelas"):
+                st.dataframe(class_metrics_frame(evaluation, 'svm'), use_container_width=True)
             
             # Confusion Matrix SVM
             st.markdown("<h3 style='color: #2c3e50; margin-top: 1.5rem;'>📊 Confusion Matrix</h3>", unsafe_allow_html=True)
-            svm_cm = confusion_matrix(y_test, svm_pred, labels=range(len(label_encoder.classes_)))
-            fig_svm, ax_svm = plt.subplots(figsize=(6, 5))
-            sns.heatmap(
-                svm_cm, annot=True, fmt='d', cmap='Blues',
-                xticklabels=label_encoder.classes_,
-                yticklabels=label_encoder.classes_,
-                ax=ax_svm
+            svm_cm = evaluation['svm_cm']
+            show_figure(
+                figure_key('confusion_matrix', svm_cm, class_names, cmap='Blues', axis_labels=True),
+                lambda: draw_confusion_matrix(svm_cm, class_names, 'Blues', axis_labels=True),
             )
-            ax_svm.set_ylabel('True Label')
-            ax_svm.set_xlabel('Predicted Label')
-            st.pyplot(fig_svm)
-            plt.close()
         
         # ===== KOLOM KANAN: LOGISTIC REGRESSION =====
         with right_col:
@@ -1053,21 +1054,16 @@ elif page == "🔍 Evaluasi Model":
             st.metric("Precision", f"{pipeline_precision:.4f}")
             st.metric("Recall", f"{pipeline_recall:.4f}")
             st.metric("F1-Score", f"{pipeline_f1:.4f}")
+            with st.expander("📋 Metrik per kelas"):
+                st.dataframe(class_metrics_frame(evaluation, 'pipeline'), use_container_width=True)
             
             # Confusion Matrix Logistic Regression
             st.markdown("<h3 style='color: #2c3e50; margin-top: 1.5rem;'>📊 Confusion Matrix</h3>", unsafe_allow_html=True)
-            pipeline_cm = confusion_matrix(y_test, pipeline_pred_encoded, labels=range(len(label_encoder.classes_)))
-            fig_pipeline, ax_pipeline = plt.subplots(figsize=(6, 5))
-            sns.heatmap(
-                pipeline_cm, annot=True, fmt='d', cmap='Greens',
-                xticklabels=label_encoder.classes_,
-                yticklabels=label_encoder.classes_,
-                ax=ax_pipeline
+            pipeline_cm = evaluation['pipeline_cm']
+            show_figure(
+                figure_key('confusion_matrix', pipeline_cm, class_names, cmap='Greens', axis_labels=True),
+                lambda: draw_confusion_matrix(pipeline_cm, class_names, 'Greens', axis_labels=True),
             )
-            ax_pipeline.set_ylabel('True Label')
-            ax_pipeline.set_xlabel('Predicted Label')
-            st.pyplot(fig_pipeline)
-            plt.close()
         
         st.markdown("</div>", unsafe_allow_html=True)
         
@@ -1088,20 +1084,23 @@ elif page == "🔍 Evaluasi Model":
         comparison_df = pd.DataFrame(comparison_data)
         st.dataframe(comparison_df, use_container_width=True)
         
-        fig_comp, ax_comp = plt.subplots(figsize=(10, 6))
-        x = np.arange(len(comparison_data['Metrik']))
-        width = 0.35
-        ax_comp.bar(x - width/2, comparison_data['SVM'], width, label='SVM', alpha=0.8)
-        ax_comp.bar(x + width/2, comparison_data['Logistic Regression'], width, label='Logistic Regression', alpha=0.8)
-        ax_comp.set_xlabel('Metrik')
-        ax_comp.set_ylabel('Score')
-        ax_comp.set_title('Perbandingan Performa Model')
-        ax_comp.set_xticks(x)
-        ax_comp.set_xticklabels(comparison_data['Metrik'])
-        ax_comp.legend()
-        ax_comp.set_ylim([0, 1.1])
-        plt.tight_layout()
-        st.pyplot(fig_comp)
+        def draw_comparison():
+            fig_comp, ax_comp = plt.subplots(figsize=(10, 6))
+            x = np.arange(len(comparison_data['Metrik']))
+            width = 0.35
+            ax_comp.bar(x - width/2, comparison_data['SVM'], width, label='SVM', alpha=0.8)
+            ax_comp.bar(x + width/2, comparison_data['Logistic Regression'], width, label='Logistic Regression', alpha=0.8)
+            ax_comp.set_xlabel('Metrik')
+            ax_comp.set_ylabel('Score')
+            ax_comp.set_title('Perbandingan Performa Model')
+            ax_comp.set_xticks(x)
+            ax_comp.set_xticklabels(comparison_data['Metrik'])
+            ax_comp.legend()
+            ax_comp.set_ylim([0, 1.1])
+            fig_comp.tight_layout()
+            return fig_comp
+
+        show_figure(figure_key('model_comparison', comparison_data), draw_comparison)
         st.markdown("</div>", unsafe_allow_html=True)
         
         st.markdown("<br>", unsafe_allow_html=True)
@@ -1114,62 +1113,32 @@ elif page == "🔍 Evaluasi Model":
                 <h2 style='color: #2c3e50; margin-bottom: 1.5rem;'>📉 ROC Curve: SVM vs Logistic Regression</h2>
         """, unsafe_allow_html=True)
 
-        try:
-            # ===========================
-            # SVM: pakai kelas svm_model
-            # ===========================
-            classes_svm = svm_model.classes_  # contoh: array([0, 1, 2])
-            y_test_bin_svm = label_binarize(y_test, classes=classes_svm)
-
-            # score SVM (decision_function) di data uji yang sudah di-TFIDF
-            svm_scores = svm_model.decision_function(X_test_tfidf)
-            # kalau binary, bentuknya (n_samples,), kita jadikan (n_samples, 1)
-            if svm_scores.ndim == 1:
-                svm_scores = svm_scores.reshape(-1, 1)
-
-            # ROC micro-average (flatten semua kelas)
-            fpr_svm, tpr_svm, _ = roc_curve(y_test_bin_svm.ravel(),
-                                            svm_scores.ravel())
-            auc_svm = auc(fpr_svm, tpr_svm)
-
-            # ==========================================
-            # Logistic Regression: pakai kelas pipeline
-            # ==========================================
-            lr_proba = pipeline_model.predict_proba(X_test)
-            classes_lr = pipeline_model.classes_  # bisa string / angka
-
-            # Samakan tipe y_test dengan classes_lr
-            if isinstance(classes_lr[0], str):
-                # y_test awalnya angka (hasil label_encoder) -> balik ke label string
-                y_test_lr = label_encoder.inverse_transform(y_test)
-            else:
-                # sudah angka, langsung pakai
-                y_test_lr = y_test
-
-            y_test_bin_lr = label_binarize(y_test_lr, classes=classes_lr)
-
-            fpr_lr, tpr_lr, _ = roc_curve(y_test_bin_lr.ravel(),
-                                          lr_proba.ravel())
-            auc_lr = auc(fpr_lr, tpr_lr)
+        # ROC micro-average (flatten semua kelas): SVM dari decision_function, LR dari predict_proba
+        roc_error = str(evaluation['svm_roc_error']) or str(evaluation['pipeline_roc_error'])
+        if roc_error:
+            st.warning(f"⚠️ Gagal menghitung ROC Curve: {roc_error}")
+        else:
+            fpr_svm, tpr_svm, auc_svm = evaluation['svm_roc_fpr'], evaluation['svm_roc_tpr'], float(evaluation['svm_auc'])
+            fpr_lr, tpr_lr, auc_lr = evaluation['pipeline_roc_fpr'], evaluation['pipeline_roc_tpr'], float(evaluation['pipeline_auc'])
 
             # ===========================
             # Plot ROC comparison
             # ===========================
-            fig_roc, ax_roc = plt.subplots(figsize=(8, 6))
-            ax_roc.plot(fpr_svm, tpr_svm, label=f"SVM (AUC = {auc_svm:.3f})")
-            ax_roc.plot(fpr_lr, tpr_lr, label=f"Logistic Regression (AUC = {auc_lr:.3f})")
-            ax_roc.plot([0, 1], [0, 1], 'k--', label="Random")
+            def draw_roc():
+                fig_roc, ax_roc = plt.subplots(figsize=(8, 6))
+                ax_roc.plot(fpr_svm, tpr_svm, label=f"SVM (AUC = {auc_svm:.3f})")
+                ax_roc.plot(fpr_lr, tpr_lr, label=f"Logistic Regression (AUC = {auc_lr:.3f})")
+                ax_roc.plot([0, 1], [0, 1], 'k--', label="Random")
 
-            ax_roc.set_xlabel("False Positive Rate")
-            ax_roc.set_ylabel("True Positive Rate")
-            ax_roc.set_title("ROC Curve Comparison: SVM vs Logistic Regression")
-            ax_roc.legend(loc="lower right")
+                ax_roc.set_xlabel("False Positive Rate")
+                ax_roc.set_ylabel("True Positive Rate")
+                ax_roc.set_title("ROC Curve Comparison: SVM vs Logistic Regression")
+                ax_roc.legend(loc="lower right")
 
-            plt.tight_layout()
-            st.pyplot(fig_roc)
+                fig_roc.tight_layout()
+                return fig_roc
 
-        except Exception as e:
-            st.warning(f"⚠️ Gagal menghitung ROC Curve: {e}")
+            show_figure(figure_key('roc', fpr_svm, tpr_svm, auc_svm, fpr_lr, tpr_lr, auc_lr), draw_roc)
 
         st.markdown("</div>", unsafe_allow_html=True)
         # ======================
@@ -1202,7 +1171,8 @@ elif page == "🎲 Prediksi Sentimen":
         </div>
     """, unsafe_allow_html=True)
     
-    if svm_model is not None and pipeline_model is not None:
+    label_encoder = load_label_encoder()
+    if label_encoder is not None:
         # Input Section dengan styling modern
         st.markdown("""
             <div class='section-container' style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 2rem; border-radius: 15px; margin-top: 1.5rem;'>
@@ -1232,6 +1202,11 @@ elif page == "🎲 Prediksi Sentimen":
             help="SVM umumnya lebih akurat untuk dataset kecil, Logistic Regression lebih cepat untuk dataset besar"
         )
         
+        # Hanya model yang dipilih yang dimuat
+        predictor = make_predictor(model_choice, label_encoder)
+        batcher = get_micro_batcher(predictor.model_id, predictor.model_version, predictor) if predictor is not None else None
+        model_ready = predictor is not None
+        
         st.markdown("<br>", unsafe_allow_html=True)
         
         # Button dengan styling modern
@@ -1244,7 +1219,7 @@ elif page == "🎲 Prediksi Sentimen":
                 type="primary"
             )
         
-        if predict_clicked:
+        if predict_clicked and model_ready:
             if review_input.strip() == "":
                 st.markdown("""
                     <div style='background: linear-gradient(135deg, #f5af19 0%, #f12711 100%); 
@@ -1255,25 +1230,13 @@ elif page == "🎲 Prediksi Sentimen":
             else:
                 # Loading animation
                 with st.spinner('🔄 Sedang menganalisis sentimen...'):
-                    import time
-                    time.sleep(0.5)
-                    
-                    # Preprocess input
-                    processed_review = preprocess_text(review_input)
+                    # Preprocess + prediksi lewat micro-batch (digabung dengan sesi lain yang bersamaan);
+                    # teks yang sama (setelah preprocessing) diambil dari cache.
+                    # SVM: probabilitas = softmax dari decision_function
+                    label_index, probabilities = batcher.predict(review_input)
+                    prediction = predictor.labels[label_index]
                 
                 if model_choice == "SVM + TF-IDF":
-                    # SVM Prediction
-                    X_input_tfidf = tfidf_vectorizer.transform([processed_review])
-                    prediction_encoded = svm_model.predict(X_input_tfidf)[0]
-                    prediction = label_encoder.inverse_transform([prediction_encoded])[0]
-                    
-                    # Get decision scores
-                    decision_scores = svm_model.decision_function(X_input_tfidf)[0]
-                    
-                    # Softmax to get probabilities
-                    exp_scores = np.exp(decision_scores - np.max(decision_scores))
-                    probabilities = exp_scores / exp_scores.sum()
-                    
                     # Determine sentiment color and emoji
                     sentiment_config = {
                         'positive': {'color': '#2ecc71', 'gradient': 'linear-gradient(135deg, #11998e 0%, #38ef7d 100%)', 'emoji': '😊', 'icon': '✅'},
@@ -1298,7 +1261,7 @@ elif page == "🎲 Prediksi Sentimen":
                     
                     # Show probabilities for each class
                     prob_data = {
-                        'Sentimen': label_encoder.classes_,
+                        'Sentimen': predictor.labels,
                         'Probability': probabilities
                     }
                     prob_df = pd.DataFrame(prob_data)
@@ -1359,12 +1322,6 @@ elif page == "🎲 Prediksi Sentimen":
                 
                 else:
                     # Logistic Regression Pipeline Prediction
-                    prediction_encoded = pipeline_model.predict([processed_review])[0]
-                    probabilities = pipeline_model.predict_proba([processed_review])[0]
-                    
-                    # Decode prediction from numeric to categorical label
-                    prediction = label_encoder.inverse_transform([prediction_encoded])[0]
-                    
                     # Determine sentiment color and emoji
                     sentiment_config = {
                         'positive': {'color': '#2ecc71', 'gradient': 'linear-gradient(135deg, #11998e 0%, #38ef7d 100%)', 'emoji': '😊', 'icon': '✅'},
@@ -1387,8 +1344,8 @@ elif page == "🎲 Prediksi Sentimen":
                         </div>
                     """, unsafe_allow_html=True)
                     
-                    # Get categorical class names from label_encoder
-                    class_names = label_encoder.classes_
+                    # Nama kelas kategorikal sesuai urutan probabilitas
+                    class_names = predictor.labels
                     
                     # Show probabilities for each class
                     prob_data = {
@@ -1450,6 +1407,93 @@ elif page == "🎲 Prediksi Sentimen":
                     plt.tight_layout()
                     st.pyplot(fig_bar)
                     plt.close()
+
+        # ===== Prediksi dari File (batch) =====
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown("""
+            <div class='section-container' style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 2rem; border-radius: 15px; margin-top: 1.5rem;'>
+                <h2 style='color: white; margin: 0 0 0.5rem 0; font-size: 1.5rem;'>📂 Prediksi dari File</h2>
+                <p style='color: white; margin: 0; opacity: 0.9;'>Upload CSV, semua baris diprediksi per batch dengan model yang dipilih di atas</p>
+            </div>
+        """, unsafe_allow_html=True)
+
+        batch_file = st.file_uploader("Pilih file CSV", type=["csv"], key="csv_batch_predict")
+        batch_columns = None
+        if batch_file is not None:
+            try:
+                batch_columns = read_csv_columns(batch_file)
+            except pd.errors.EmptyDataError:
+                st.warning("⚠️ File CSV kosong: tidak ada header maupun baris untuk diprediksi.")
+        if batch_columns is not None:
+            default_column = next(
+                (batch_columns.index(c) for c in ('Review', 'review', 'content', 'ulasan', 'text') if c in batch_columns), 0
+            )
+            col_batch1, col_batch2 = st.columns([2, 1])
+            with col_batch1:
+                text_column = st.selectbox("Kolom teks ulasan", batch_columns, index=default_column, key="batch_text_column")
+            with col_batch2:
+                predict_batch_size = st.number_input(
+                    "Ukuran batch", min_value=100, max_value=200_000, value=DEFAULT_PREDICT_BATCH_SIZE, step=1000,
+                    help="Jumlah baris yang di-preprocess, di-vektorisasi, dan diprediksi sekaligus"
+                )
+
+            batch_key = (batch_file.name, batch_file.size, text_column, model_choice)
+            if st.button("🚀 Prediksi Semua Baris", key="predict_file_button") and model_ready:
+                batch_status = st.empty()
+                def report_batch_progress(done):
+                    batch_status.info(f"🔄 {done:,} baris selesai diprediksi...")
+
+                batch_file.seek(0)
+                chunks = pd.read_csv(batch_file, chunksize=int(predict_batch_size), dtype={text_column: object})
+                # Hasil ditulis per chunk ke file sementara; session state hanya menyimpan path-nya
+                previous_result = st.session_state.pop('batch_predictions', None)
+                if previous_result is not None and os.path.exists(previous_result['path']):
+                    os.remove(previous_result['path'])
+                with st.spinner("🔄 Memprediksi file..."):
+                    with tempfile.NamedTemporaryFile(
+                        'w', encoding='utf-8', newline='', prefix='prediksi_', suffix='.csv', delete=False
+                    ) as output_file:
+                        has_rows = False
+                        for csv_part in predictor.iter_predict_csv(chunks, text_column, report_batch_progress):
+                            output_file.write(csv_part)
+                            has_rows = True
+                batch_status.empty()
+                st.session_state['batch_predictions'] = {
+                    'key': batch_key,
+                    'path': output_file.name,
+                    'preview': pd.read_csv(output_file.name, nrows=20) if has_rows else pd.DataFrame(),
+                }
+
+            batch_result = st.session_state.get('batch_predictions')
+            if batch_result is not None and batch_result['key'] == batch_key:
+                preview = batch_result['preview']
+                if preview.empty:
+                    st.warning("⚠️ File tidak berisi baris untuk diprediksi.")
+                else:
+                    st.success(f"✅ Prediksi selesai dengan model {model_choice}")
+                    st.dataframe(preview, use_container_width=True)
+                    with open(batch_result['path'], 'rb') as prediction_file:
+                        st.download_button(
+                            label="📥 Download Hasil Prediksi (CSV)",
+                            data=prediction_file,
+                            file_name=f"prediksi_{batch_file.name}",
+                            mime="text/csv",
+                            key="download_batch_predictions"
+                        )
+
+        cache_stats = prediction_cache.stats()
+        st.caption(
+            f"⚡ Cache prediksi: {cache_stats['hits']} hit / {cache_stats['misses']} miss "
+            f"(hit rate {cache_stats['hit_rate']:.1%}, {cache_stats['size']:,}/{cache_stats['maxsize']:,} entri, "
+            f"TTL {cache_stats['ttl'] // 60} menit)"
+        )
+        if batcher is not None:
+            batch_stats = batcher.stats()
+            st.caption(
+                f"🧺 Micro-batch: {batch_stats['batch_size']['count']:,} batch, ukuran p50/p99 "
+                f"{batch_stats['batch_size']['p50']:g}/{batch_stats['batch_size']['p99']:g}, antre p50/p99 "
+                f"{batch_stats['queue_latency_ms']['p50']:.2f}/{batch_stats['queue_latency_ms']['p99']:.2f} ms"
+            )
     else:
         st.markdown("""
             <div style='background: linear-gradient(135deg, #f5af19 0%, #f12711 100%); 
@@ -1470,6 +1514,7 @@ elif page == "📈 Data Overview":
         </div>
     """, unsafe_allow_html=True)
     
+    df = load_data()
     if df is not None:
         # Dataset info
         col1, col2, col3 = st.columns(3)
@@ -1519,24 +1564,31 @@ elif page == "📈 Data Overview":
             with col1:
                 # Count plot
                 sentiment_counts = df['polarity'].value_counts()
-                fig, ax = plt.subplots(figsize=(8, 6))
-                colors = plt.cm.Set2(np.linspace(0, 1, len(sentiment_counts)))
-                sentiment_counts.plot(kind='bar', ax=ax, color=colors)
-                ax.set_title('Distribusi Sentimen (Count)')
-                ax.set_xlabel('Sentimen')
-                ax.set_ylabel('Jumlah Review')
-                ax.set_xticklabels(ax.get_xticklabels(), rotation=45)
-                plt.tight_layout()
-                st.pyplot(fig)
+
+                def draw_counts():
+                    fig, ax = plt.subplots(figsize=(8, 6))
+                    colors = plt.cm.Set2(np.linspace(0, 1, len(sentiment_counts)))
+                    sentiment_counts.plot(kind='bar', ax=ax, color=colors)
+                    ax.set_title('Distribusi Sentimen (Count)')
+                    ax.set_xlabel('Sentimen')
+                    ax.set_ylabel('Jumlah Review')
+                    ax.set_xticklabels(ax.get_xticklabels(), rotation=45)
+                    fig.tight_layout()
+                    return fig
+
+                show_figure(figure_key('polarity_bar', sentiment_counts), draw_counts)
             
             with col2:
                 # Pie chart
-                fig, ax = plt.subplots(figsize=(8, 6))
-                colors = plt.cm.Set2(np.linspace(0, 1, len(sentiment_counts)))
-                ax.pie(sentiment_counts.values, labels=sentiment_counts.index, autopct='%1.1f%%', colors=colors)
-                ax.set_title('Distribusi Sentimen (Persentase)')
-                plt.tight_layout()
-                st.pyplot(fig)
+                def draw_pie():
+                    fig, ax = plt.subplots(figsize=(8, 6))
+                    colors = plt.cm.Set2(np.linspace(0, 1, len(sentiment_counts)))
+                    ax.pie(sentiment_counts.values, labels=sentiment_counts.index, autopct='%1.1f%%', colors=colors)
+                    ax.set_title('Distribusi Sentimen (Persentase)')
+                    fig.tight_layout()
+                    return fig
+
+                show_figure(figure_key('polarity_pie', sentiment_counts), draw_pie)
             
             # Detailed statistics
             st.markdown("<h3 style='color: #2c3e50; margin-top: 2rem;'>📊 Statistik Detail</h3>", unsafe_allow_html=True)
@@ -1558,13 +1610,16 @@ elif page == "📈 Data Overview":
         """, unsafe_allow_html=True)
         df['review_length'] = df['content'].fillna('').apply(lambda x: len(str(x).split()))
         
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.hist(df['review_length'], bins=50, color='#667eea', edgecolor='#764ba2', alpha=0.7)
-        ax.set_xlabel('Panjang Review (Jumlah Kata)')
-        ax.set_ylabel('Frekuensi')
-        ax.set_title('Distribusi Panjang Review')
-        plt.tight_layout()
-        st.pyplot(fig)
+        def draw_lengths():
+            fig, ax = plt.subplots(figsize=(10, 6))
+            ax.hist(df['review_length'], bins=50, color='#667eea', edgecolor='#764ba2', alpha=0.7)
+            ax.set_xlabel('Panjang Review (Jumlah Kata)')
+            ax.set_ylabel('Frekuensi')
+            ax.set_title('Distribusi Panjang Review')
+            fig.tight_layout()
+            return fig
+
+        show_figure(figure_key('review_length_hist', df['review_length'].to_numpy(), bins=50), draw_lengths)
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -1613,120 +1668,207 @@ elif page == "📂 Upload CSV":
     st.markdown("<p>Upload CSV dengan kolom <code>content</code>. Sistem akan menjalankan full pipeline preprocessing dan modeling seperti di notebook.</p>", unsafe_allow_html=True)
     
     uploaded_file = st.file_uploader("Pilih file CSV", type=["csv"], key="csv_full_notebook")
+    use_stemming = st.checkbox(
+        "🌱 Gunakan stemming (Sastrawi)",
+        value=False,
+        help="Stem token hasil filtering sebelum labeling & modeling. Hasil stem di-cache per kata."
+    )
+    tokenizer_mode = st.selectbox(
+        "✂️ Mode tokenizer",
+        TOKENIZER_MODES,
+        index=TOKENIZER_MODES.index(DEFAULT_TOKENIZER_MODE),
+        help="'nltk' = word_tokenize (default). 'regex' dan 'split' jauh lebih cepat untuk teks yang sudah dibersihkan."
+    )
+    keep_intermediate = st.checkbox(
+        "🔬 Simpan kolom intermediate (cleaned/lowercased/normalized/tokens)",
+        value=False,
+        help="Aktifkan untuk menginspeksi atau mendownload hasil tiap langkah. "
+             "Jika nonaktif, hanya filtered_tokens & final_text yang disimpan (jauh lebih hemat memori)."
+    )
+    use_hashing = st.checkbox(
+        "#️⃣ Gunakan HashingVectorizer (tanpa vocabulary)",
+        value=False,
+        help=f"Fitur di-hash ke {HASHING_N_FEATURES:,} kolom: tidak ada vocabulary yang di-fit atau disimpan, "
+             "jadi hemat memori dan setiap chunk bisa di-featurize sendiri. Tanpa bobot idf."
+    )
+    with st.expander("⚙️ Pengaturan preprocessing paralel"):
+        n_workers = st.number_input(
+            "Jumlah worker (proses)",
+            min_value=1, max_value=256, value=min(default_workers(), 256),
+            help="1 = tanpa process pool"
+        )
+        chunk_size = st.number_input(
+            "Ukuran chunk (baris)",
+            min_value=100, max_value=1_000_000, value=DEFAULT_CHUNK_SIZE, step=1000
+        )
+        stream_upload = st.checkbox(
+            "📦 Baca file per chunk (streaming)",
+            value=False,
+            help="Untuk file besar: hanya kolom content (dan at) yang dibaca, duplikat dibuang lintas chunk, "
+                 "dan setiap chunk langsung di-preprocess & dilabel."
+        )
+        ingest_chunk_size = st.number_input(
+            "Ukuran chunk baca CSV (baris)",
+            min_value=1000, max_value=5_000_000, value=DEFAULT_INGEST_CHUNK_SIZE, step=10_000
+        )
+        disk_cache = st.checkbox(
+            "💾 Simpan cache preprocessing ke disk",
+            value=False,
+            help="Hasil preprocessing per ulasan selalu di-cache di memori; opsi ini juga menyimpannya ke .cache/ agar tetap ada setelah restart."
+        )
     
     if uploaded_file is not None:
         try:
             # =======================
             # LOAD DATA
             # =======================
-            ajaib_reviews_df = pd.read_csv(uploaded_file)
-            
-            st.success("✅ File berhasil diupload!")
-            
-            jumlah_ulasan, jumlah_kolom = ajaib_reviews_df.shape
-            st.info(f"📊 Jumlah baris: {jumlah_ulasan} | Kolom: {jumlah_kolom}")
-            
-            with st.expander("👁️ Preview 5 baris pertama"):
-                st.dataframe(ajaib_reviews_df.head(), use_container_width=True)
-            
-            # Pastikan kolom content ada
-            if 'content' not in ajaib_reviews_df.columns:
-                st.error("⚠️ Kolom 'content' tidak ditemukan!")
+            if stream_upload:
+                # Mode streaming: cukup baca header, isi file dibaca per chunk saat preprocessing
+                upload_columns = read_csv_columns(uploaded_file)
+                st.success("✅ File berhasil diupload!")
+                st.info(f"📦 Mode streaming | Kolom: {len(upload_columns)} | Ukuran chunk baca: {int(ingest_chunk_size)} baris")
             else:
-                # =======================
-                # DROP KOLOM TIDAK PERLU
-                # =======================
-                cols_to_drop = [
-                    'reviewId', 'userName', 'userImage', 'score', 'thumbsUpCount', 
-                    'reviewCreatedVersion', 'at', 'replyContent', 'repliedAt', 'appVersion'
-                ]
-                existing_cols = [c for c in cols_to_drop if c in ajaib_reviews_df.columns]
-                if existing_cols:
-                    ajaib_reviews_df.drop(columns=existing_cols, inplace=True)
-                    st.info(f"🗑️ Dropped columns: {', '.join(existing_cols)}")
+                ajaib_reviews_df = pd.read_csv(uploaded_file)
+                upload_columns = list(ajaib_reviews_df.columns)
                 
-                # Cleaning dasar
-                initial_count = len(ajaib_reviews_df)
-                ajaib_reviews_df = ajaib_reviews_df.dropna()
-                ajaib_reviews_df = ajaib_reviews_df.drop_duplicates()
-                cleaned_count = len(ajaib_reviews_df)
+                st.success("✅ File berhasil diupload!")
                 
-                st.success(f"✅ Data cleaning: {initial_count} → {cleaned_count} baris")
+                jumlah_ulasan, jumlah_kolom = ajaib_reviews_df.shape
+                st.info(f"📊 Jumlah baris: {jumlah_ulasan} | Kolom: {jumlah_kolom}")
                 
+                with st.expander("👁️ Preview 5 baris pertama"):
+                    st.dataframe(ajaib_reviews_df.head(), use_container_width=True)
+            
+            # Pastikan kolom content ada
+            if 'content' not in upload_columns:
+                st.error("⚠️ Kolom 'content' tidak ditemukan!")
+            else:
                 # =======================
-                # PREPROCESSING TEKS
+                # LOAD LEXICON
                 # =======================
-                with st.spinner("⚙️ Running full preprocessing pipeline..."):
-                    ajaib_reviews_df['cleaned_text'] = ajaib_reviews_df['content'].apply(remove_noise)
-                    ajaib_reviews_df['lowercased_text'] = ajaib_reviews_df['cleaned_text'].apply(to_lowercase)
-                    ajaib_reviews_df['normalized_text'] = ajaib_reviews_df['lowercased_text'].apply(normalize_slang_notebook)
-                    ajaib_reviews_df['tokens'] = ajaib_reviews_df['normalized_text'].apply(tokenize_words)
-                    ajaib_reviews_df['filtered_tokens'] = ajaib_reviews_df['tokens'].apply(remove_stopwords)
-                    ajaib_reviews_df['final_text'] = ajaib_reviews_df['filtered_tokens'].apply(reconstruct_text)
-                
-                st.success("✅ Preprocessing complete!")
-                
-                with st.expander("🔍 Sample Result"):
-                    st.dataframe(ajaib_reviews_df.head(2), use_container_width=True)
+                # Dimuat sebelum preprocessing karena mode streaming melabel setiap chunk langsung
+                with st.spinner("📚 Loading lexicon..."):
+                    # Skor seluruh batch sekaligus: matriks dokumen-term sparse @ bobot lexicon
+                    lexicon_scorer = load_lexicon_scorer()
+                if lexicon_scorer is None:
+                    st.stop()
+                label_reviews = lexicon_scorer.label_frame
                 
-                # =======================
-                # PELABELAN LEXICON
-                # =======================
-                st.markdown("### 🏷️ Lexicon-Based Labeling")
+                # remove_noise -> lowercase -> slang -> tokenize -> stopwords -> (stemming) -> final_text
+                notebook_pipeline = NotebookPipeline(
+                    slangwords_notebook,
+                    stopword_list='notebook',
+                    tokenizer_mode=tokenizer_mode,
+                    use_stemming=use_stemming,
+                    columns=PIPELINE_COLUMNS if keep_intermediate else FUSED_COLUMNS
+                )
+                preprocess_cache = get_preprocess_cache(
+                    notebook_pipeline.fingerprint(),
+                    cache_path=DEFAULT_PREPROCESS_CACHE_PATH if disk_cache else None
+                )
+                cache_stats_before = preprocess_cache.stats()
                 
-                with st.spinner("📚 Loading lexicon..."):
-                    import csv as _csv
-                    from io import StringIO
+                if stream_upload:
+                    # =======================
+                    # STREAMING: BACA -> DEDUPE -> PREPROCESS -> LABEL PER CHUNK
+                    # =======================
+                    with st.spinner("⚙️ Streaming preprocessing & labeling..."):
+                        ingest_progress = st.progress(0.0, text="Membaca chunk pertama...")
+                        
+                        def report_ingest(rows_read, fraction):
+                            ingest_progress.progress(fraction or 0.0, text=f"{rows_read} baris dibaca")
+                        
+                        with ParallelPreprocessor(
+                            notebook_pipeline, workers=int(n_workers), chunk_size=int(chunk_size), cache=preprocess_cache
+                        ) as preprocessor:
+                            ajaib_reviews_df, ingest_stats = stream_preprocess(
+                                uploaded_file,
+                                preprocessor,
+                                label_fn=label_reviews,
+                                chunk_size=int(ingest_chunk_size),
+                                progress_callback=report_ingest
+                            )
+                        ingest_progress.progress(1.0, text=f"{ingest_stats['rows_read']} baris dibaca")
                     
-                    lexicon_positive = {}
-                    try:
-                        rpos = requests.get(
-                            'https://raw.githubusercontent.com/angelmetanosaa/dataset/main/lexicon_positive.csv',
-                            timeout=10
-                        )
-                        rpos.raise_for_status()
-                        reader = _csv.reader(StringIO(rpos.text))
-                        for row in reader:
-                            if len(row) >= 2:
-                                lexicon_positive[row[0]] = int(row[1])
-                    except Exception as e:
-                        st.warning(f"Failed to load positive lexicon: {e}")
+                    st.success(
+                        f"✅ Data cleaning: {ingest_stats['rows_read']} → {ingest_stats['rows_kept']} baris "
+                        f"({ingest_stats['rows_empty']} kosong, {ingest_stats['rows_duplicate']} duplikat, "
+                        f"{ingest_stats['chunks']} chunk)"
+                    )
+                    if ajaib_reviews_df.empty:
+                        st.warning("⚠️ Tidak ada ulasan tersisa: semua baris kosong atau duplikat.")
+                        st.stop()
+                    st.success("✅ Preprocessing complete!")
+                    cache_stats = preprocess_cache.stats(since=cache_stats_before)
+                    st.caption(f"🗃️ Cache preprocessing: hit rate {cache_stats['hit_rate']:.1%} "
+                               f"({cache_stats['hits']} memori, {cache_stats['disk_hits']} disk, {cache_stats['misses']} miss, "
+                               f"{cache_stats['batch_dedup']} duplikat dalam batch)")
                     
-                    lexicon_negative = {}
-                    try:
-                        rneg = requests.get(
-                            'https://raw.githubusercontent.com/angelmetanosaa/dataset/main/lexicon_negative.csv',
-                            timeout=10
-                        )
-                        rneg.raise_for_status()
-                        reader = _csv.reader(StringIO(rneg.text))
-                        for row in reader:
-                            if len(row) >= 2:
-                                lexicon_negative[row[0]] = int(row[1])
-                    except Exception as e:
-                        st.warning(f"Failed to load negative lexicon: {e}")
+                    with st.expander("🔍 Sample Result"):
+                        st.dataframe(ajaib_reviews_df.head(2), use_container_width=True)
                     
-                    def sentiment_analysis_lexicon_indonesia(text):
-                        score = 0
-                        for word in text:
-                            if word in lexicon_positive:
-                                score += lexicon_positive[word]
-                        for word in text:
-                            if word in lexicon_negative:
-                                score += lexicon_negative[word]
+                    st.markdown("### 🏷️ Lexicon-Based Labeling")
+                else:
+                    # =======================
+                    # DROP KOLOM TIDAK PERLU
+                    # =======================
+                    cols_to_drop = [
+                        'reviewId', 'userName', 'userImage', 'score', 'thumbsUpCount', 
+                        'reviewCreatedVersion', 'at', 'replyContent', 'repliedAt', 'appVersion'
+                    ]
+                    existing_cols = [c for c in cols_to_drop if c in ajaib_reviews_df.columns]
+                    if existing_cols:
+                        ajaib_reviews_df.drop(columns=existing_cols, inplace=True)
+                        st.info(f"🗑️ Dropped columns: {', '.join(existing_cols)}")
+                    
+                    # Cleaning dasar
+                    initial_count = len(ajaib_reviews_df)
+                    ajaib_reviews_df = ajaib_reviews_df.dropna()
+                    ajaib_reviews_df = ajaib_reviews_df.drop_duplicates()
+                    cleaned_count = len(ajaib_reviews_df)
+                    
+                    st.success(f"✅ Data cleaning: {initial_count} → {cleaned_count} baris")
+                    if ajaib_reviews_df.empty:
+                        st.warning("⚠️ Tidak ada ulasan tersisa: semua baris kosong atau duplikat.")
+                        st.stop()
+                    
+                    # =======================
+                    # PREPROCESSING TEKS
+                    # =======================
+                    with st.spinner("⚙️ Running full preprocessing pipeline..."):
+                        preprocess_progress = st.progress(0.0, text="Preprocessing chunk 0")
+                        
+                        def report_chunk(done, total):
+                            preprocess_progress.progress(done / total, text=f"Preprocessing chunk {done}/{total}")
                         
-                        if score > 0:
-                            polarity = 'positive'
-                        elif score < 0:
-                            polarity = 'negative'
-                        else:
-                            polarity = 'neutral'
-                        return score, polarity
+                        preprocessed = parallel_preprocess(
+                            ajaib_reviews_df['content'],
+                            notebook_pipeline,
+                            workers=int(n_workers),
+                            chunk_size=int(chunk_size),
+                            progress_callback=report_chunk,
+                            cache=preprocess_cache
+                        )
+                        for column_name, column_values in preprocessed.items():
+                            ajaib_reviews_df[column_name] = column_values
+                        preprocess_progress.progress(1.0, text="Preprocessing selesai")
+                    
+                    st.success("✅ Preprocessing complete!")
+                    cache_stats = preprocess_cache.stats(since=cache_stats_before)
+                    st.caption(f"🗃️ Cache preprocessing: hit rate {cache_stats['hit_rate']:.1%} "
+                               f"({cache_stats['hits']} memori, {cache_stats['disk_hits']} disk, {cache_stats['misses']} miss, "
+                               f"{cache_stats['batch_dedup']} duplikat dalam batch)")
+                    
+                    with st.expander("🔍 Sample Result"):
+                        st.dataframe(ajaib_reviews_df.head(2), use_container_width=True)
                     
-                    results = ajaib_reviews_df['filtered_tokens'].apply(sentiment_analysis_lexicon_indonesia)
-                    results = list(zip(*results))
-                    ajaib_reviews_df['polarity_score'] = results[0]
-                    ajaib_reviews_df['polarity'] = results[1]
+                    # =======================
+                    # PELABELAN LEXICON
+                    # =======================
+                    st.markdown("### 🏷️ Lexicon-Based Labeling")
+                    
+                    with st.spinner("🏷️ Labeling..."):
+                        ajaib_reviews_df = label_reviews(ajaib_reviews_df)
                 
                 st.success("✅ Labeling complete!")
                 
@@ -1745,19 +1887,21 @@ elif page == "📂 Upload CSV":
                     )
                 
                 with col2:
-                    fig, ax = plt.subplots(figsize=(6, 4))
-                    colors_map = {'positive': '#2ecc71', 'negative': '#e74c3c', 'neutral': '#3498db'}
-                    plot_colors = [colors_map.get(x, '#95a5a6') for x in polarity_counts.index]
-                    ax.pie(
-                        polarity_counts.values,
-                        labels=polarity_counts.index,
-                        autopct='%1.1f%%',
-                        colors=plot_colors,
-                        startangle=90
-                    )
-                    ax.set_title('Sentiment Distribution')
-                    st.pyplot(fig)
-                    plt.close()
+                    def draw_polarity():
+                        fig, ax = plt.subplots(figsize=(6, 4))
+                        colors_map = {'positive': '#2ecc71', 'negative': '#e74c3c', 'neutral': '#3498db'}
+                        plot_colors = [colors_map.get(x, '#95a5a6') for x in polarity_counts.index]
+                        ax.pie(
+                            polarity_counts.values,
+                            labels=polarity_counts.index,
+                            autopct='%1.1f%%',
+                            colors=plot_colors,
+                            startangle=90
+                        )
+                        ax.set_title('Sentiment Distribution')
+                        return fig
+
+                    show_figure(figure_key('upload_polarity_pie', polarity_counts), draw_polarity)
                 
                 # =======================
                 # MODELING
@@ -1767,7 +1911,6 @@ elif page == "📂 Upload CSV":
                 with st.spinner("🔄 Training models..."):
                     from sklearn.model_selection import train_test_split, GridSearchCV
                     from sklearn.preprocessing import LabelEncoder
-                    from sklearn.feature_extraction.text import TfidfVectorizer
                     from sklearn.svm import LinearSVC
                     from sklearn.calibration import CalibratedClassifierCV
                     from sklearn.linear_model import LogisticRegression
@@ -1796,7 +1939,8 @@ elif page == "📂 Upload CSV":
                     # 1) SVM + TF-IDF (BUFFED)
                     # ============================
                     svm_pipe = Pipeline([
-                        ("tfidf", TfidfVectorizer(
+                        ("tfidf", make_vectorizer(
+                            use_hashing,             # hashing: tanpa vocab, parameter TF-IDF diabaikan
                             max_features=12000,      # banyak fitur → kaya informasi
                             ngram_range=(1, 3),      # unigram + bigram + trigram
                             analyzer="word",
@@ -1840,13 +1984,15 @@ elif page == "📂 Upload CSV":
                     # ==============================================
                     # 2) Logistic Regression(TF-IDF + SelectKBest + SVD + LR)
                     # ==============================================
-                    temp_vect = TfidfVectorizer(
+                    temp_vect = make_vectorizer(
+                        use_hashing,
                         max_features=3000,
                         ngram_range=(1, 2),
                         min_df=2
                     )
                     temp_X = temp_vect.fit_transform(X_train)
-                    n_features = temp_X.shape[1]
+                    # hashing: hanya kolom yang benar-benar terisi yang dihitung sebagai fitur
+                    n_features = active_feature_count(temp_X) if use_hashing else temp_X.shape[1]
                     
                     st.info(f"📐 Dataset features (for pipeline): {n_features}")
                     
@@ -1878,7 +2024,8 @@ elif page == "📂 Upload CSV":
                         k_options = [safe_k(800), safe_k(1500)]
                         svd_options = [safe_svd(150), safe_svd(300)]
                     
-                    vectorizer = TfidfVectorizer(
+                    vectorizer = make_vectorizer(
+                        use_hashing,
                         max_features=3000,
                         ngram_range=(1, 2),
                         min_df=2
@@ -1958,35 +2105,17 @@ elif page == "📂 Upload CSV":
                 
                 with cc1:
                     cm_svm = confusion_matrix(y_test_enc, y_pred_svm)
-                    fig1, ax1 = plt.subplots(figsize=(6, 5))
-                    sns.heatmap(
-                        cm_svm,
-                        annot=True,
-                        fmt='d',
-                        cmap='Blues',
-                        xticklabels=le.classes_,
-                        yticklabels=le.classes_,
-                        ax=ax1
+                    show_figure(
+                        figure_key('confusion_matrix', cm_svm, le.classes_, cmap='Blues', title="SVM"),
+                        lambda: draw_confusion_matrix(cm_svm, le.classes_, 'Blues', title="SVM"),
                     )
-                    ax1.set_title("SVM")
-                    st.pyplot(fig1)
-                    plt.close()
                 
                 with cc2:
                     cm_pipe = confusion_matrix(y_test_enc, y_pred_pipe)
-                    fig2, ax2 = plt.subplots(figsize=(6, 5))
-                    sns.heatmap(
-                        cm_pipe,
-                        annot=True,
-                        fmt='d',
-                        cmap='Greens',
-                        xticklabels=le.classes_,
-                        yticklabels=le.classes_,
-                        ax=ax2
+                    show_figure(
+                        figure_key('confusion_matrix', cm_pipe, le.classes_, cmap='Greens', title="Logistic Regression"),
+                        lambda: draw_confusion_matrix(cm_pipe, le.classes_, 'Greens', title="Logistic Regression"),
                     )
-                    ax2.set_title("Logistic Regression")
-                    st.pyplot(fig2)
-                    plt.close()
                 
                 # =======================
                 # DOWNLOAD HASIL (Hanya Data yang Sudah Dilabeli)
@@ -2015,6 +2144,8 @@ elif page == "📂 Upload CSV":
                     use_container_width=True
                 )
                 
+        except pd.errors.EmptyDataError:
+            st.warning("⚠️ File CSV kosong: tidak ada header maupun baris untuk diproses.")
         except Exception as e:
             st.error(f"❌ Error: {e}")
             import traceback
@@ -0,0 +1 @@
+"""Modul pendukung preprocessing dan inferensi untuk aplikasi analisis sentimen."""
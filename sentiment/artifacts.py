@@ -0,0 +1,315 @@
+"""Ekspor/impor bagian numerik model ke array yang bisa di-memory-map.
+
+`joblib.load` selalu men-deserialisasi pickle penuh, sehingga setiap proses Streamlit di
+satu host memegang salinan sendiri dari vocabulary TF-IDF, komponen SVD, dan bobot
+classifier. Di sini bagian numerik model disimpan sebagai file `.npy` di
+`model/artifacts/`:
+    - `<model>.idf.npy`           : vektor idf TF-IDF (float64)
+    - `<model>.vocab.npy`         : vocabulary ringkas; term UTF-8 urut indeks kolom,
+                                    digabung '\\n' (array uint8)
+                                    (vectorizer hashing tidak punya vocab/idf; cukup
+                                    parameternya di manifest, lihat `sentiment.features`)
+    - `pipeline.select_mask.npy`  : mask SelectKBest (bool)
+    - `pipeline.svd_components.npy`: `components_` TruncatedSVD
+    - `pipeline.coef.npy` / `pipeline.intercept.npy` / `pipeline.classes.npy`
+    - `svm.coef.npy` / `svm.intercept.npy` / `svm.classes.npy` : bobot primal one-vs-one
+                                    SVC linear (lihat `sentiment.primal`)
+ditambah `manifest.json` berisi checksum sha256, shape, dtype, parameter vectorizer,
+kelas label encoder, dan sha256 pickle sumber (untuk mendeteksi artefak yang basi).
+
+Array dimuat dengan `mmap_mode='r'` sehingga load hanya butuh beberapa milidetik dan
+halaman memorinya dipakai bersama antar proses lewat page cache OS.
+
+    python -m sentiment.artifacts export   # dari model/*.pkl
+    python -m sentiment.artifacts info
+"""
+import datetime
+import hashlib
+import json
+import os
+
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
+from sklearn.preprocessing import LabelEncoder, normalize
+
+from sentiment.features import HASHING_PARAMS, is_hashing
+from sentiment.folding import FoldedLinearPipeline
+from sentiment.primal import PrimalLinearSVC, collapse_linear_svc
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_DIR = os.path.join(BASE_DIR, 'model')
+DEFAULT_ARTIFACT_DIR = os.path.join(MODEL_DIR, 'artifacts')
+MANIFEST_NAME = 'manifest.json'
+# Naikkan jika layout artefak berubah
+ARTIFACT_FORMAT_VERSION = 3
+
+SOURCE_FILES = {
+    'svm': 'svm_model.pkl',
+    'tfidf': 'tfidf_vectorizer.pkl',
+    'pipeline': 'pipeline_best.pkl',
+    'le': 'label_encoder.pkl',
+}
+# Parameter TfidfVectorizer yang dibutuhkan untuk transform
+VECTORIZER_PARAMS = (
+    'analyzer', 'binary', 'decode_error', 'encoding', 'input', 'lowercase', 'ngram_range',
+    'norm', 'smooth_idf', 'strip_accents', 'sublinear_tf', 'token_pattern', 'use_idf',
+)
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _encode_terms(terms):
+    return np.frombuffer('\n'.join(terms).encode('utf-8'), dtype=np.uint8)
+
+
+def _decode_terms(array):
+    raw = np.asarray(array).tobytes().decode('utf-8')
+    return raw.split('\n') if raw else []
+
+
+def _vectorizer_arrays(prefix, vectorizer):
+    """Array + parameter untuk TfidfVectorizer ber-vocabulary atau HashingVectorizer"""
+    params = vectorizer.get_params()
+    for name in ('preprocessor', 'tokenizer', 'stop_words'):
+        if params.get(name) is not None:
+            raise ValueError(f"Vectorizer dengan {name} kustom tidak bisa diekspor ke artefak")
+    if not isinstance(params['analyzer'], str):
+        raise ValueError("Vectorizer dengan analyzer kustom tidak bisa diekspor ke artefak")
+    if is_hashing(vectorizer):
+        config = {name: params[name] for name in HASHING_PARAMS}
+        config['ngram_range'] = list(config['ngram_range'])
+        return {}, {'kind': 'hashing', **config}
+    terms = [None] * len(vectorizer.vocabulary_)
+    for term, index in vectorizer.vocabulary_.items():
+        if '\n' in term:
+            raise ValueError(f"Term mengandung newline, tidak bisa diekspor: {term!r}")
+        terms[index] = term
+    arrays = {f'{prefix}.vocab': _encode_terms(terms)}
+    if params['use_idf']:
+        arrays[f'{prefix}.idf'] = np.asarray(vectorizer.idf_, dtype=np.float64)
+    config = {name: params[name] for name in VECTORIZER_PARAMS}
+    config['ngram_range'] = list(config['ngram_range'])
+    return arrays, {'kind': 'tfidf', **config}
+
+
+def read_manifest(artifact_dir=DEFAULT_ARTIFACT_DIR):
+    """Manifest artefak (dict), atau None jika belum diekspor"""
+    path = os.path.join(artifact_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def export_artifacts(model_dir=MODEL_DIR, artifact_dir=DEFAULT_ARTIFACT_DIR):
+    """Ekspor model/*.pkl ke artefak .npy + manifest; mengembalikan manifest"""
+    import joblib
+
+    sources = {name: os.path.join(model_dir, filename) for name, filename in SOURCE_FILES.items()}
+    svm = joblib.load(sources['svm'])
+    tfidf = joblib.load(sources['tfidf'])
+    pipeline = joblib.load(sources['pipeline'])
+    label_encoder = joblib.load(sources['le'])
+
+    steps = dict(pipeline.steps)
+    if list(steps) != ['vect', 'select', 'svd', 'clf']:
+        raise ValueError(f"Pipeline tidak didukung untuk ekspor: {list(steps)}")
+
+    arrays, vectorizers = {}, {}
+    for prefix, vectorizer in (('tfidf', tfidf), ('pipeline', steps['vect'])):
+        vectorizer_arrays, config = _vectorizer_arrays(prefix, vectorizer)
+        arrays.update(vectorizer_arrays)
+        vectorizers[prefix] = config
+    arrays['pipeline.select_mask'] = np.asarray(steps['select'].get_support(), dtype=bool)
+    arrays['pipeline.svd_components'] = np.ascontiguousarray(steps['svd'].components_, dtype=np.float64)
+    arrays['pipeline.coef'] = np.ascontiguousarray(steps['clf'].coef_, dtype=np.float64)
+    arrays['pipeline.intercept'] = np.asarray(steps['clf'].intercept_, dtype=np.float64)
+    arrays['pipeline.classes'] = np.asarray(steps['clf'].classes_)
+    if arrays['pipeline.classes'].dtype == object:
+        raise ValueError("Kelas pipeline harus numerik (hasil LabelEncoder)")
+    svm_weights = collapse_linear_svc(svm)
+    for name in ('coef', 'intercept', 'classes'):
+        arrays[f'svm.{name}'] = svm_weights.pop(name)
+    if arrays['svm.classes'].dtype == object:
+        raise ValueError("Kelas SVM harus numerik (hasil LabelEncoder)")
+
+    os.makedirs(artifact_dir, exist_ok=True)
+    entries = {}
+    for name, array in arrays.items():
+        filename = f'{name}.npy'
+        path = os.path.join(artifact_dir, filename)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.save(f, array, allow_pickle=False)
+        os.replace(tmp_path, path)
+        entries[name] = {
+            'file': filename,
+            'sha256': _sha256(path),
+            'shape': list(array.shape),
+            'dtype': array.dtype.str,
+        }
+
+    manifest = {
+        'format_version': ARTIFACT_FORMAT_VERSION,
+        'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'sources': {name: {'file': os.path.basename(path), 'sha256': _sha256(path)}
+                    for name, path in sources.items()},
+        'vectorizers': vectorizers,
+        'svm': svm_weights,
+        'label_classes': [str(label) for label in label_encoder.classes_],
+        'arrays': entries,
+    }
+    with open(os.path.join(artifact_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+    return manifest
+
+
+def artifacts_stale(manifest, model_dir=MODEL_DIR, names=None):
+    """True jika pickle sumber (semua, atau hanya `names`) berubah sejak ekspor"""
+    for name, source in manifest['sources'].items():
+        if names is not None and name not in names:
+            continue
+        path = os.path.join(model_dir, source['file'])
+        if os.path.exists(path) and _sha256(path) != source['sha256']:
+            return True
+    return False
+
+
+def model_version(names, manifest=None, model_dir=MODEL_DIR):
+    """Versi model (gabungan sha256 pickle sumber `names`) untuk kunci cache prediksi.
+
+    Dengan `manifest`, sha256 diambil dari manifest artefak tanpa membaca pickle.
+    """
+    digests = []
+    for name in names:
+        if manifest is not None:
+            digests.append(manifest['sources'][name]['sha256'])
+        else:
+            digests.append(_sha256(os.path.join(model_dir, SOURCE_FILES[name])))
+    return '-'.join(digest[:16] for digest in digests)
+
+
+class ModelArtifacts:
+    """Array artefak (read-only, memory-mapped) beserta manifest-nya"""
+
+    def __init__(self, manifest, arrays):
+        self.manifest = manifest
+        self.arrays = arrays
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def __contains__(self, name):
+        return name in self.arrays
+
+    def tfidf_vectorizer(self, prefix='tfidf'):
+        """Vectorizer model `prefix`; HashingVectorizer jika model dilatih dengan mode hashing"""
+        config = self.manifest['vectorizers'][prefix]
+        if config['kind'] == 'hashing':
+            params = {name: config[name] for name in HASHING_PARAMS}
+            params['ngram_range'] = tuple(params['ngram_range'])
+            return HashingVectorizer(**params)
+        return ArtifactTfidfVectorizer(
+            self.manifest['vectorizers'][prefix],
+            _decode_terms(self.arrays[f'{prefix}.vocab']),
+            self.arrays.get(f'{prefix}.idf'),
+        )
+
+    def pipeline_model(self):
+        # Tahap linear dilipat menjadi satu matriks bobot (lihat `sentiment.folding`)
+        return FoldedLinearPipeline.from_arrays(
+            self.tfidf_vectorizer('pipeline'),
+            self.arrays['pipeline.select_mask'],
+            self.arrays['pipeline.svd_components'],
+            self.arrays['pipeline.coef'],
+            self.arrays['pipeline.intercept'],
+            self.arrays['pipeline.classes'],
+        )
+
+    def svm_model(self):
+        return PrimalLinearSVC(
+            self.arrays['svm.coef'],
+            self.arrays['svm.intercept'],
+            self.arrays['svm.classes'],
+            **self.manifest['svm'],
+        )
+
+    def label_encoder(self):
+        label_encoder = LabelEncoder()
+        label_encoder.classes_ = np.array(self.manifest['label_classes'], dtype=object)
+        return label_encoder
+
+
+def load_artifacts(artifact_dir=DEFAULT_ARTIFACT_DIR, mmap=True, verify=True):
+    """Muat artefak dari disk; checksum setiap array dicocokkan dengan manifest"""
+    manifest = read_manifest(artifact_dir)
+    if manifest is None:
+        raise FileNotFoundError(
+            f"Artefak model tidak ditemukan di {artifact_dir}. Jalankan `python -m sentiment.artifacts export`."
+        )
+    if manifest.get('format_version') != ARTIFACT_FORMAT_VERSION:
+        raise ValueError(f"Versi format artefak tidak didukung: {manifest.get('format_version')}")
+
+    arrays = {}
+    for name, entry in manifest['arrays'].items():
+        path = os.path.join(artifact_dir, entry['file'])
+        if verify and _sha256(path) != entry['sha256']:
+            raise ValueError(f"Checksum artefak tidak cocok dengan {MANIFEST_NAME}: {path}")
+        array = np.load(path, mmap_mode='r' if mmap else None, allow_pickle=False)
+        if list(array.shape) != entry['shape'] or array.dtype.str != entry['dtype']:
+            raise ValueError(f"Shape/dtype artefak tidak cocok dengan {MANIFEST_NAME}: {path}")
+        arrays[name] = array
+    return ModelArtifacts(manifest, arrays)
+
+
+class ArtifactTfidfVectorizer:
+    """Pengganti `TfidfVectorizer.transform` yang memakai idf dari artefak"""
+
+    def __init__(self, config, terms, idf=None):
+        self.config = config
+        self.vocabulary_ = {term: index for index, term in enumerate(terms)}
+        self.idf_ = idf
+        self._counter = CountVectorizer(
+            vocabulary=self.vocabulary_,
+            dtype=np.float64,
+            ngram_range=tuple(config['ngram_range']),
+            **{name: config[name] for name in (
+                'analyzer', 'binary', 'decode_error', 'encoding', 'input',
+                'lowercase', 'strip_accents', 'token_pattern',
+            )},
+        )
+
+    def transform(self, raw_documents):
+        X = self._counter.transform(raw_documents)
+        if self.config['sublinear_tf']:
+            np.log(X.data, X.data)
+            X.data += 1.0
+        if self.idf_ is not None:
+            X.data *= self.idf_[X.indices]
+        if self.config['norm'] is not None:
+            X = normalize(X, norm=self.config['norm'], copy=False)
+        return X
+
+
+if __name__ == '__main__':
+    import sys
+
+    command = sys.argv[1] if len(sys.argv) > 1 else 'info'
+    if command == 'export':
+        manifest = export_artifacts()
+        print(json.dumps({name: entry['shape'] for name, entry in manifest['arrays'].items()}, indent=2))
+    elif command == 'info':
+        manifest = read_manifest()
+        print(json.dumps(manifest, indent=2))
+        if manifest is not None and artifacts_stale(manifest):
+            print("⚠️ Artefak basi: pickle sumber berubah sejak ekspor")
+    else:
+        print("Pemakaian: python -m sentiment.artifacts [info | export]")
+        sys.exit(1)
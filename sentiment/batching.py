@@ -0,0 +1,175 @@
+"""Micro-batching: gabungkan request prediksi tunggal yang datang bersamaan.
+
+Prediksi satu baris didominasi overhead per panggilan (validasi input sklearn, membangun
+matriks sparse), bukan hitungannya. `MicroBatcher` menampung request tunggal selama
+jendela singkat (default 2 ms atau 256 item, mana yang lebih dulu), menjalankannya
+sebagai satu batch tervektorisasi, lalu mengembalikan hasil masing-masing ke pemanggil.
+
+    batcher = MicroBatcher(predictor.predict_rows)
+    label_index, probabilities = batcher.predict("aplikasi bagus")
+
+Jendela dihitung dari request pertama dalam batch, jadi request yang sudah antre selama
+batch sebelumnya berjalan tidak ditahan lebih lama. Statistik ukuran batch dan latensi
+antrean (waktu dari submit sampai batch mulai dijalankan) tersedia lewat `stats()`.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_MAX_WAIT = 0.002  # detik
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+QUEUE_LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 1000)
+
+_STOP = object()
+
+
+class Histogram:
+    """Histogram bucket tetap (batas atas inklusif) + jumlah, total, dan maksimum"""
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        for index, bound in enumerate(self.bounds):
+            if value <= bound:
+                break
+        else:
+            index = len(self.bounds)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """Perkiraan kuantil: batas atas bucket tempat kuantil jatuh"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def snapshot(self):
+        labels = [f'<={bound:g}' for bound in self.bounds] + [f'>{self.bounds[-1]:g}']
+        return {
+            'buckets': dict(zip(labels, self.counts)),
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.quantile(0.5),
+            'p99': self.quantile(0.99),
+            'max': self.max,
+        }
+
+
+class _Request:
+    __slots__ = ('item', 'future', 'enqueued_at')
+
+    def __init__(self, item):
+        self.item = item
+        self.future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class MicroBatcher:
+    """Penjadwal micro-batch untuk fungsi `predict_batch(list_item) -> list_hasil`"""
+
+    def __init__(self, predict_batch, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait=DEFAULT_MAX_WAIT):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size minimal 1")
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_latency_ms = Histogram(QUEUE_LATENCY_BUCKETS_MS)
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("MicroBatcher sudah ditutup")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+                self._thread.start()
+
+    def submit(self, item):
+        """Antrekan satu item; mengembalikan Future berisi hasilnya"""
+        self._ensure_started()
+        request = _Request(item)
+        self._queue.put(request)
+        return request.future
+
+    def predict(self, item, timeout=None):
+        """Hasil untuk satu item (menunggu batch-nya selesai)"""
+        return self.submit(item).result(timeout)
+
+    def close(self):
+        """Hentikan thread setelah request yang sudah antre selesai"""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _collect(self, first):
+        batch = [first]
+        deadline = first.enqueued_at + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is _STOP:
+                return batch, True
+            batch.append(request)
+        return batch, False
+
+    def _run(self):
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch, stop = self._collect(first)
+            self._execute(batch)
+
+    def _execute(self, batch):
+        started_at = time.monotonic()
+        with self._lock:
+            self.batch_sizes.observe(len(batch))
+            for request in batch:
+                self.queue_latency_ms.observe((started_at - request.enqueued_at) * 1000)
+        try:
+            results = self.predict_batch([request.item for request in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"predict_batch mengembalikan {len(results)} hasil untuk {len(batch)} item")
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+        for request, result in zip(batch, results):
+            request.future.set_result(result)
+
+    def stats(self):
+        """Histogram ukuran batch dan latensi antrean (ms)"""
+        with self._lock:
+            return {
+                'max_batch_size': self.max_batch_size,
+                'max_wait_ms': self.max_wait * 1000,
+                'batch_size': self.batch_sizes.snapshot(),
+                'queue_latency_ms': self.queue_latency_ms.snapshot(),
+            }
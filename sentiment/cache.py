@@ -0,0 +1,344 @@
+"""Cache hasil preprocessing per review berdasarkan hash konten.
+
+Ulasan Play Store sangat berulang ("mantap", "bagus", "aplikasi error"), jadi hasil
+preprocessing disimpan per teks mentah. Kunci cache adalah hash dari:
+    - fingerprint konfigurasi pipeline (versi pipeline, kamus slang, stopword, tokenizer, ...)
+    - teks mentah
+sehingga perubahan kamus slang atau daftar stopword otomatis memakai kunci baru.
+
+Dua tingkat cache:
+    - LRU di memori (dibatasi jumlah entri),
+    - SQLite di disk (opsional) agar tetap ada setelah restart.
+
+`PredictionCache` menyimpan hasil prediksi per (model, versi model, teks hasil
+preprocessing) di memori dengan batas ukuran dan TTL.
+"""
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from sentiment.stemming import CACHE_DIR
+
+# Naikkan jika logika preprocessing berubah tanpa perubahan konfigurasi
+PIPELINE_VERSION = 1
+
+DEFAULT_MAXSIZE = 100_000
+# Jumlah maksimum cache (konfigurasi pipeline berbeda) yang disimpan bersamaan per proses
+MAX_CACHES = 4
+SQLITE_TIMEOUT = 30
+DEFAULT_PREPROCESS_CACHE_PATH = os.path.join(CACHE_DIR, 'preprocess_cache.sqlite3')
+# Jumlah entri baru yang dikumpulkan sebelum ditulis ke disk
+FLUSH_EVERY = 1_000
+
+DEFAULT_PREDICTION_MAXSIZE = 50_000
+# Umur entri cache prediksi (detik)
+DEFAULT_PREDICTION_TTL = 3_600
+
+# Penanda nilai kosong (None/NaN/pd.NA) di kunci cache; byte 0xff tidak pernah muncul
+# di teks UTF-8 sehingga tidak bertabrakan dengan teks "nan"/"None"
+_MISSING_KEY = b'\xff'
+
+
+def _canonical(value):
+    """Representasi stabil untuk dict/set agar fingerprint tidak bergantung urutan"""
+    if isinstance(value, dict):
+        return '{' + ','.join(f'{_canonical(k)}:{_canonical(v)}' for k, v in sorted(value.items(), key=repr)) + '}'
+    if isinstance(value, (set, frozenset)):
+        return '{' + ','.join(sorted(_canonical(v) for v in value)) + '}'
+    if isinstance(value, (list, tuple)):
+        return '[' + ','.join(_canonical(v) for v in value) + ']'
+    return repr(value)
+
+
+def _is_missing(value):
+    return value is None or value is pd.NA or (isinstance(value, float) and value != value)
+
+
+def config_fingerprint(*parts):
+    """Hash konfigurasi pipeline (selalu menyertakan PIPELINE_VERSION)"""
+    payload = _canonical((PIPELINE_VERSION,) + parts).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class PreprocessCache:
+    """Cache hasil preprocessing per teks: LRU memori + SQLite opsional"""
+
+    def __init__(self, fingerprint, maxsize=DEFAULT_MAXSIZE, cache_path=None):
+        self.fingerprint = fingerprint
+        self.maxsize = maxsize
+        self.cache_path = cache_path
+        self._salt = fingerprint.encode('utf-8') + b'\x00'
+        self._memory = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.batch_dedup = 0
+
+    def key(self, text):
+        if _is_missing(text):
+            payload = _MISSING_KEY
+        else:
+            payload = str(text).encode('utf-8', 'surrogatepass')
+        return hashlib.blake2b(self._salt + payload, digest_size=16).digest()
+
+    # ---------- disk ----------
+    def _get_db(self):
+        if self._db is None and self.cache_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+            db = sqlite3.connect(self.cache_path, timeout=SQLITE_TIMEOUT, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS preprocess (key BLOB PRIMARY KEY, value BLOB NOT NULL)')
+            db.commit()
+            self._db = db
+        return self._db
+
+    def _disk_get(self, key):
+        value = self._pending.get(key)
+        if value is not None:
+            return value
+        db = self._get_db()
+        if db is None:
+            return None
+        try:
+            row = db.execute('SELECT value FROM preprocess WHERE key = ?', (key,)).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return pickle.loads(row[0]) if row else None
+
+    def flush(self):
+        """Tulis entri baru yang masih di memori ke cache disk"""
+        with self._lock:
+            db = self._get_db()
+            if db is None or not self._pending:
+                self._pending.clear()
+                return 0
+            items = [(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL)) for key, value in self._pending.items()]
+            try:
+                db.executemany('INSERT OR REPLACE INTO preprocess (key, value) VALUES (?, ?)', items)
+                db.commit()
+            except sqlite3.OperationalError:
+                # Database sedang dikunci proses lain: coba lagi di flush berikutnya
+                db.rollback()
+                return 0
+            self._pending.clear()
+        return len(items)
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ---------- API ----------
+    def get(self, text):
+        """Ambil hasil untuk `text`, atau None jika belum ada di cache"""
+        key = self.key(text)
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+            value = self._disk_get(key)
+            if value is not None:
+                self.disk_hits += 1
+                self._remember(key, value)
+                return value
+            self.misses += 1
+        return None
+
+    def put(self, text, value):
+        key = self.key(text)
+        with self._lock:
+            self._remember(key, value)
+            if self.cache_path:
+                self._pending[key] = value
+                should_flush = len(self._pending) >= FLUSH_EVERY
+            else:
+                should_flush = False
+        if should_flush:
+            self.flush()
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def get_or_compute(self, text, compute):
+        """Hasil dari cache, atau `compute(text)` lalu disimpan"""
+        value = self.get(text)
+        if value is None:
+            value = compute(text)
+            self.put(text, value)
+        return value
+
+    def map_columns(self, texts, compute_batch, columns):
+        """Versi batch untuk pipeline yang menghasilkan beberapa kolom.
+
+        `compute_batch(list_teks)` mengembalikan dict {kolom: list nilai}; hanya dipanggil
+        untuk teks unik yang belum ada di cache. Hasil dikembalikan dalam bentuk yang sama
+        dan urutan yang sama dengan `texts`.
+        """
+        texts = list(texts)
+        rows = [None] * len(texts)
+        missing = {}
+        for index, text in enumerate(texts):
+            if text in missing:
+                # duplikat dalam batch yang sama: tidak diproses ulang, tapi bukan hit cache
+                missing[text].append(index)
+                with self._lock:
+                    self.batch_dedup += 1
+                continue
+            value = self.get(text)
+            if value is None:
+                missing[text] = [index]
+            else:
+                rows[index] = value
+
+        if missing:
+            computed = compute_batch(list(missing))
+            for position, (text, indices) in enumerate(missing.items()):
+                value = tuple(computed[name][position] for name in columns)
+                self.put(text, value)
+                for index in indices:
+                    rows[index] = value
+            self.flush()
+
+        result = {}
+        for position, name in enumerate(columns):
+            # list (token) disalin agar baris dengan teks sama tidak berbagi objek
+            result[name] = [row[position][:] if isinstance(row[position], list) else row[position] for row in rows]
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._pending.clear()
+            self.hits = self.disk_hits = self.misses = self.batch_dedup = 0
+
+    def stats(self, since=None):
+        """Statistik cache: hits (memori), disk_hits, misses, batch_dedup, hit_rate, size.
+
+        `hit_rate` hanya menghitung lookup ke cache; duplikat dalam satu batch yang tidak
+        diproses ulang dilaporkan terpisah sebagai `batch_dedup`.
+        Jika `since` (hasil `stats()` sebelumnya) diberikan, hitungan adalah selisihnya.
+        """
+        hits, disk_hits, misses, batch_dedup = self.hits, self.disk_hits, self.misses, self.batch_dedup
+        if since is not None:
+            hits -= since['hits']
+            disk_hits -= since['disk_hits']
+            misses -= since['misses']
+            batch_dedup -= since['batch_dedup']
+        lookups = hits + disk_hits + misses
+        return {
+            'hits': hits,
+            'disk_hits': disk_hits,
+            'misses': misses,
+            'batch_dedup': batch_dedup,
+            'hit_rate': (hits + disk_hits) / lookups if lookups else 0.0,
+            'size': len(self._memory),
+            'maxsize': self.maxsize,
+        }
+
+
+_caches = OrderedDict()
+_caches_lock = threading.Lock()
+
+
+def get_preprocess_cache(fingerprint, cache_path=None, maxsize=DEFAULT_MAXSIZE):
+    """Instance PreprocessCache bersama per (fingerprint, cache_path) untuk satu proses.
+
+    Registry dibatasi MAX_CACHES; cache yang paling lama tidak dipakai di-flush dan dibuang
+    sehingga total entri di memori paling banyak MAX_CACHES x maxsize.
+    """
+    registry_key = (fingerprint, cache_path)
+    evicted = []
+    with _caches_lock:
+        cache = _caches.get(registry_key)
+        if cache is None:
+            cache = _caches[registry_key] = PreprocessCache(fingerprint, maxsize=maxsize, cache_path=cache_path)
+        _caches.move_to_end(registry_key)
+        while len(_caches) > MAX_CACHES:
+            evicted.append(_caches.popitem(last=False)[1])
+    for old_cache in evicted:
+        old_cache.close()
+    return cache
+
+
+class PredictionCache:
+    """LRU hasil prediksi di memori, kunci (model_id, versi model, teks), dengan TTL"""
+
+    def __init__(self, maxsize=DEFAULT_PREDICTION_MAXSIZE, ttl=DEFAULT_PREDICTION_TTL, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    def get(self, model_id, model_version, text):
+        """Hasil tersimpan, atau None jika belum ada / sudah kedaluwarsa"""
+        key = (model_id, model_version, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expired += 1
+            self.misses += 1
+        return None
+
+    def put(self, model_id, model_version, text, value):
+        key = (model_id, model_version, text)
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.expired = 0
+
+    def stats(self):
+        """Statistik: hits, misses (termasuk yang kedaluwarsa), expired, hit_rate, size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'expired': self.expired,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'ttl': self.ttl,
+        }
+
+
+_prediction_cache = None
+
+
+def get_prediction_cache():
+    """PredictionCache bersama untuk semua sesi di satu proses"""
+    global _prediction_cache
+    with _caches_lock:
+        if _prediction_cache is None:
+            _prediction_cache = PredictionCache()
+        return _prediction_cache
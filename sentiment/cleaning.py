@@ -0,0 +1,79 @@
+"""Engine pembersihan teks (versi cepat dari `remove_noise` di app.py).
+
+Semua pola regex dikompilasi sekali saat import. Output dijaga identik byte-per-byte
+dengan implementasi lama:
+
+    URL -> mention -> hashtag -> email -> angka -> punctuation -> whitespace
+
+Urutan URL -> mention/hashtag -> email tetap dipertahankan karena hapus satu pola bisa
+mengubah hasil pola berikutnya (contoh: `user@gmail.com`). Angka dan punctuation
+dihapus per karakter: angka ASCII + punctuation lewat `bytes.translate`, sisa angka
+Unicode (`\d`) lewat regex hanya untuk teks yang tidak murni ASCII.
+"""
+import re
+import string
+
+import pandas as pd
+
+_URL_RE = re.compile(r'http\S+|www\S+|https\S+', flags=re.MULTILINE)
+# `@\w+` lalu `#\w+` secara berurutan setara dengan satu pass `[@#]\w+`
+_MENTION_HASHTAG_RE = re.compile(r'[@#]\w+')
+_EMAIL_RE = re.compile(r'\S+@\S+')
+# Byte ASCII tidak pernah muncul di dalam karakter multi-byte UTF-8, jadi aman dihapus
+_ASCII_DELETE = (string.punctuation + string.digits).encode('ascii')
+_UNICODE_DIGIT_RE = re.compile(r'\d+')
+
+# Pemisah antar review untuk mode batch; semua pola di atas berhenti di whitespace
+_BATCH_SEP = '\n'
+
+
+def _strip_noise(text):
+    """Hapus URL, mention, hashtag, dan email (hanya jika karakter pemicunya ada)"""
+    if 'http' in text or 'www' in text:
+        text = _URL_RE.sub('', text)
+    if '@' in text or '#' in text:
+        text = _MENTION_HASHTAG_RE.sub('', text)
+        if '@' in text:
+            text = _EMAIL_RE.sub('', text)
+    return text
+
+
+def _strip_digits_punct(text):
+    """Hapus angka (`\\d`) dan string.punctuation"""
+    text = text.encode('utf-8', 'surrogatepass').translate(None, _ASCII_DELETE).decode('utf-8', 'surrogatepass')
+    return text if text.isascii() else _UNICODE_DIGIT_RE.sub('', text)
+
+
+def clean_text(text):
+    """Bersihkan satu teks review (hasil sama persis dengan `remove_noise`)"""
+    if pd.isna(text):
+        return ""
+    text = _strip_digits_punct(_strip_noise(str(text)))
+    # str.split() memakai definisi whitespace yang sama dengan `\s` pada regex
+    return ' '.join(text.split())
+
+
+def clean_series(series):
+    """Versi batch `clean_text` untuk satu pandas Series.
+
+    Semua review digabung menjadi satu string sehingga tiap regex hanya berjalan
+    sekali untuk seluruh batch, lalu dipecah kembali dengan index yang sama.
+    """
+    series = pd.Series(series)
+    if series.empty:
+        return pd.Series([], index=series.index, name=series.name, dtype=object)
+
+    na_mask = series.isna().to_numpy()
+    texts = [
+        "" if is_na else str(value).replace(_BATCH_SEP, ' ')
+        for value, is_na in zip(series.tolist(), na_mask)
+    ]
+
+    joined = _strip_noise(_BATCH_SEP.join(texts))
+    joined = joined.encode('utf-8', 'surrogatepass').translate(None, _ASCII_DELETE).decode('utf-8', 'surrogatepass')
+
+    cleaned = [
+        ' '.join((part if part.isascii() else _UNICODE_DIGIT_RE.sub('', part)).split())
+        for part in joined.split(_BATCH_SEP)
+    ]
+    return pd.Series(cleaned, index=series.index, name=series.name, dtype=object)
@@ -0,0 +1,100 @@
+"""Penyimpanan kolumnar (Parquet) untuk dataset ulasan berlabel.
+
+Parse CSV dataset berlabel adalah biaya terbesar saat aplikasi start, padahal setiap
+halaman hanya memakai beberapa kolom (`content`, `final_text`, `polarity`). CSV
+dikonversi sekali ke Parquet di `.cache/dataset/`; pembacaan berikutnya hanya membaca
+kolom yang diminta dan kolom teks memakai string dtype berbasis Arrow:
+
+    df = load_labelled_dataset(columns=('final_text', 'polarity'))
+
+Parquet dibuat ulang otomatis jika CSV lebih baru. Tanpa pyarrow, atau jika konversi
+gagal, dataset dibaca langsung dari CSV (hanya kolom yang diminta).
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from sentiment.stemming import BASE_DIR, CACHE_DIR
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow opsional: tanpa pyarrow dataset dibaca dari CSV
+    pa = pq = None
+
+LABELLED_CSV_PATH = os.path.join(BASE_DIR, 'data', 'ulasan_aplikasi_labelled.csv')
+DATASET_CACHE_DIR = os.path.join(CACHE_DIR, 'dataset')
+
+
+def parquet_path_for(csv_path, cache_dir=DATASET_CACHE_DIR):
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(cache_dir, f'{stem}.parquet')
+
+
+def arrow_string_dtype():
+    """String dtype berbasis Arrow dengan NaN untuk nilai kosong (perilaku sama dengan object)"""
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan)
+    except TypeError:
+        pass
+    try:
+        # pandas 2.1 / 2.2
+        return pd.StringDtype('pyarrow_numpy')
+    except ValueError:
+        # pandas 2.0: nilai kosong menjadi pd.NA
+        return pd.StringDtype('pyarrow')
+
+
+def parquet_stale(csv_path, parquet_path):
+    """True jika Parquet belum ada atau CSV lebih baru"""
+    if not os.path.exists(parquet_path):
+        return True
+    if not os.path.exists(csv_path):
+        return False
+    return os.path.getmtime(csv_path) > os.path.getmtime(parquet_path)
+
+
+def _project(columns, available):
+    if columns is None:
+        return None
+    return [column for column in columns if column in available]
+
+
+def convert_to_parquet(csv_path, parquet_path):
+    """Parse CSV penuh sekali lalu tulis Parquet (atomik); mengembalikan DataFrame hasil parse"""
+    df = pd.read_csv(csv_path)
+    os.makedirs(os.path.dirname(parquet_path), exist_ok=True)
+    tmp_path = f'{parquet_path}.{os.getpid()}.tmp'
+    try:
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_path)
+        os.replace(tmp_path, parquet_path)
+    except (pa.ArrowException, OSError, ValueError):
+        # kolom campuran yang tidak bisa dikonversi / disk penuh: tetap pakai hasil parse CSV
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return df
+
+
+def read_parquet_columns(parquet_path, columns=None):
+    """Baca hanya `columns` (yang ada di file) dari Parquet, string sebagai Arrow string dtype"""
+    available = pq.read_schema(parquet_path).names
+    table = pq.read_table(parquet_path, columns=_project(columns, available))
+    string_dtype = arrow_string_dtype()
+    return table.to_pandas(types_mapper={pa.string(): string_dtype, pa.large_string(): string_dtype}.get)
+
+
+def load_labelled_dataset(csv_path=LABELLED_CSV_PATH, columns=None, cache_dir=DATASET_CACHE_DIR):
+    """Dataset berlabel, hanya kolom `columns` (None = semua; kolom yang tidak ada dilewati).
+
+    FileNotFoundError jika CSV maupun Parquet-nya tidak ada.
+    """
+    if pq is None:
+        return pd.read_csv(csv_path, usecols=None if columns is None else lambda c: c in columns)
+    parquet_path = parquet_path_for(csv_path, cache_dir)
+    if parquet_stale(csv_path, parquet_path):
+        df = convert_to_parquet(csv_path, parquet_path)
+        if parquet_stale(csv_path, parquet_path):
+            # konversi gagal: pakai hasil parse CSV
+            return df if columns is None else df[_project(columns, df.columns)]
+    return read_parquet_columns(parquet_path, columns)
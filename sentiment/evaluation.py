@@ -0,0 +1,360 @@
+"""Evaluasi model bawaan pada data berlabel, dengan cache hasil di memori dan disk.
+
+Halaman Evaluasi Model menghitung ulang preprocessing, split, transform TF-IDF, prediksi
+kedua model, metrik, confusion matrix, dan kurva ROC di setiap rerun. Hasilnya hanya
+bergantung pada:
+    - isi dataset (kolom teks dan label) + konfigurasi `preprocess_text`,
+    - checksum model (sha256 pickle sumber, lihat `sentiment.artifacts.model_version`),
+    - seed dan ukuran split,
+jadi hasil evaluasi disimpan dengan kunci gabungan ketiganya. Dua tingkat cache:
+    - dict di memori (dibatasi jumlah entri),
+    - file `.npz` di `.cache/evaluation/` agar tetap ada setelah restart.
+
+Hasil evaluasi adalah dict berisi array numpy (skalar disimpan sebagai array 0-dimensi)
+supaya bisa ditulis ke `.npz` tanpa pickle.
+
+Saat training (templates/Model.py) versi ringkas hasil evaluasi ditulis sebagai laporan
+`model/evaluation_report.npz`: metrik per kelas, confusion matrix, titik ROC yang sudah
+di-downsample, dan indeks data uji, tanpa prediksi/skor per baris. Halaman Evaluasi
+merender laporan itu secara default selama checksum model di dalamnya masih cocok.
+"""
+import datetime
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from sentiment.artifacts import MODEL_DIR
+from sentiment.cache import config_fingerprint
+from sentiment.stemming import CACHE_DIR
+
+EVAL_TEST_SIZE = 0.2
+EVAL_SPLIT_SEED = 42
+EVALUATION_CACHE_DIR = os.path.join(CACHE_DIR, 'evaluation')
+# Jumlah hasil evaluasi yang disimpan di memori per proses
+MAX_MEMORY_ENTRIES = 8
+# Naikkan jika isi hasil evaluasi berubah (entri cache lama tidak terpakai)
+EVALUATION_VERSION = 2
+METRIC_NAMES = ('accuracy', 'precision', 'recall', 'f1')
+CLASS_METRIC_NAMES = ('precision', 'recall', 'f1', 'support')
+MODEL_PREFIXES = ('svm', 'pipeline')
+# Pickle yang menentukan hasil evaluasi (kunci cache dan checksum laporan)
+EVALUATION_MODEL_NAMES = ('svm', 'tfidf', 'pipeline', 'le')
+
+REPORT_PATH = os.path.join(MODEL_DIR, 'evaluation_report.npz')
+# Naikkan jika isi laporan berubah
+REPORT_VERSION = 2
+# Jumlah maksimum titik ROC per model di laporan
+REPORT_ROC_POINTS = 200
+# Array per baris yang tidak ikut disimpan di laporan
+_ROW_ARRAYS = tuple(f'{prefix}_{name}' for prefix in MODEL_PREFIXES for name in ('pred', 'scores'))
+
+
+def dataset_fingerprint(texts, labels, *parts):
+    """Hash isi kolom teks + label (urutan baris ikut dihitung) dan konfigurasi `parts`"""
+    digest = hashlib.blake2b(digest_size=16)
+    for column in (texts, labels):
+        values = pd.util.hash_pandas_object(pd.Series(column).reset_index(drop=True), index=False).values
+        digest.update(np.ascontiguousarray(values).tobytes())
+    digest.update(config_fingerprint(*parts).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def evaluation_key(dataset_fp, model_checksum, seed=EVAL_SPLIT_SEED, test_size=EVAL_TEST_SIZE):
+    """Kunci cache evaluasi: (fingerprint dataset, checksum model, seed split)"""
+    return config_fingerprint('evaluation', EVALUATION_VERSION, dataset_fp, model_checksum, seed, test_size)
+
+
+def split_test_index(y_encoded, seed=EVAL_SPLIT_SEED, test_size=EVAL_TEST_SIZE):
+    """Indeks baris data uji; split sama dengan train_test_split(X, y, stratify=y) di halaman Evaluasi"""
+    from sklearn.model_selection import train_test_split
+
+    _, test_index = train_test_split(
+        np.arange(len(y_encoded)), test_size=test_size, random_state=seed, stratify=y_encoded,
+    )
+    return test_index
+
+
+def classification_metrics(y_true, y_pred, n_classes):
+    """(array [accuracy, precision, recall, f1] weighted, confusion matrix, metrik per kelas).
+
+    Metrik per kelas: array n_kelas x 4, kolom urut CLASS_METRIC_NAMES.
+    """
+    from sklearn.metrics import (
+        accuracy_score, confusion_matrix, f1_score, precision_recall_fscore_support, precision_score, recall_score,
+    )
+
+    metrics = np.array([
+        accuracy_score(y_true, y_pred),
+        precision_score(y_true, y_pred, average='weighted', zero_division=0),
+        recall_score(y_true, y_pred, average='weighted', zero_division=0),
+        f1_score(y_true, y_pred, average='weighted', zero_division=0),
+    ])
+    labels = range(n_classes)
+    class_metrics = np.column_stack(
+        precision_recall_fscore_support(y_true, y_pred, labels=labels, zero_division=0)
+    ).astype(np.float64)
+    return metrics, confusion_matrix(y_true, y_pred, labels=labels), class_metrics
+
+
+def _encode_labels(values, label_encoder):
+    """Label string -> kode label_encoder; kode numerik dikembalikan apa adanya"""
+    values = np.asarray(values)
+    if len(values) and isinstance(values[0], str):
+        return label_encoder.transform(values)
+    return values
+
+
+def predict_models(X_test, svm_model, tfidf_vectorizer, pipeline_model, label_encoder):
+    """Prediksi kedua model untuk teks uji yang sudah di-preprocess.
+
+    Mengembalikan {prefix: (prediksi terenkode, skor, kode kelas tiap kolom skor)}; skor SVM
+    dari decision_function, skor LR dari predict_proba.
+    """
+    X_test_tfidf = tfidf_vectorizer.transform(X_test)
+    return {
+        'svm': (
+            _encode_labels(svm_model.predict(X_test_tfidf), label_encoder),
+            np.asarray(svm_model.decision_function(X_test_tfidf)),
+            _encode_labels(svm_model.classes_, label_encoder),
+        ),
+        'pipeline': (
+            _encode_labels(pipeline_model.predict(X_test), label_encoder),
+            np.asarray(pipeline_model.predict_proba(X_test)),
+            # kelas pipeline bisa string / angka
+            _encode_labels(pipeline_model.classes_, label_encoder),
+        ),
+    }
+
+
+def score_positives(y_encoded, class_codes, scores):
+    """(mask positif n x k, skor n x k) untuk ROC micro-average one-vs-rest"""
+    scores, class_codes = np.asarray(scores), np.asarray(class_codes)
+    if scores.ndim == 1:
+        # skor biner satu kolom adalah skor kelas kedua
+        scores, class_codes = scores.reshape(-1, 1), class_codes[1:]
+    return np.asarray(y_encoded)[:, None] == class_codes[None, :], scores
+
+
+def micro_roc(positive, scores):
+    """ROC micro-average (semua kelas di-flatten): (fpr, tpr, auc)"""
+    from sklearn.metrics import auc, roc_curve
+
+    fpr, tpr, _ = roc_curve(positive.ravel(), scores.ravel())
+    return fpr, tpr, auc(fpr, tpr)
+
+
+def downsample_roc(fpr, tpr, max_points=REPORT_ROC_POINTS):
+    """Titik ROC yang diambil merata sepanjang kurva (titik awal dan akhir selalu ikut)"""
+    fpr, tpr = np.asarray(fpr), np.asarray(tpr)
+    if len(fpr) <= max_points:
+        return fpr, tpr
+    keep = np.unique(np.linspace(0, len(fpr) - 1, max_points).round().astype(np.intp))
+    return fpr[keep], tpr[keep]
+
+
+def evaluate_models(texts, y_encoded, svm_model, tfidf_vectorizer, pipeline_model, label_encoder,
+                    preprocess=None, seed=EVAL_SPLIT_SEED, test_size=EVAL_TEST_SIZE, test_index=None):
+    """Prediksi, metrik, confusion matrix, dan ROC kedua model pada split uji.
+
+    `test_index` (posisi baris) dipakai apa adanya jika diberikan, misalnya split dari
+    training; selain itu split dibuat dengan `seed` dan `test_size`.
+    Kunci hasil: `label_classes`, `test_index`, `y_test`, lalu per model (`svm_`, `pipeline_`):
+    `pred`, `scores` (decision_function SVM / predict_proba LR), `metrics` (urut METRIC_NAMES),
+    `class_metrics` (n_kelas x CLASS_METRIC_NAMES), `cm`, `roc_fpr`, `roc_tpr`, `auc`, dan
+    `roc_error` (pesan, kosong jika ROC berhasil).
+    """
+    y_encoded = np.asarray(y_encoded)
+    if test_index is None:
+        test_index = split_test_index(y_encoded, seed, test_size)
+    X_test = pd.Series(texts).iloc[test_index].fillna('')
+    if preprocess is not None:
+        X_test = X_test.apply(preprocess)
+    y_test = y_encoded[test_index]
+    n_classes = len(label_encoder.classes_)
+    result = {
+        'label_classes': np.asarray(label_encoder.classes_).astype(str),
+        'test_index': np.asarray(test_index),
+        'y_test': y_test,
+    }
+
+    predictions = predict_models(X_test, svm_model, tfidf_vectorizer, pipeline_model, label_encoder)
+    for prefix in MODEL_PREFIXES:
+        pred, scores, class_codes = predictions[prefix]
+        result[f'{prefix}_pred'], result[f'{prefix}_scores'] = pred, scores
+        result[f'{prefix}_metrics'], result[f'{prefix}_cm'], result[f'{prefix}_class_metrics'] = classification_metrics(
+            y_test, pred, n_classes,
+        )
+        try:
+            fpr, tpr, auc_value = micro_roc(*score_positives(y_test, class_codes, scores))
+            error = ''
+        except Exception as e:
+            fpr, tpr, auc_value, error = np.empty(0), np.empty(0), np.nan, str(e)
+        result[f'{prefix}_roc_fpr'], result[f'{prefix}_roc_tpr'] = fpr, tpr
+        result[f'{prefix}_auc'] = np.float64(auc_value)
+        result[f'{prefix}_roc_error'] = np.str_(error)
+    return result
+
+
+def metrics_dict(result, prefix):
+    """{accuracy, precision, recall, f1} (float) untuk model `prefix` dari hasil evaluasi"""
+    return dict(zip(METRIC_NAMES, (float(value) for value in result[f'{prefix}_metrics'])))
+
+
+def class_metrics_frame(result, prefix):
+    """DataFrame metrik per kelas (baris = label) untuk model `prefix`"""
+    frame = pd.DataFrame(result[f'{prefix}_class_metrics'], columns=CLASS_METRIC_NAMES,
+                         index=[str(label) for label in result['label_classes']])
+    frame['support'] = frame['support'].astype(int)
+    return frame
+
+
+def build_report(result, model_checksum, dataset_fp='', max_roc_points=REPORT_ROC_POINTS):
+    """Laporan ringkas dari hasil `evaluate_models`: tanpa array per baris, ROC di-downsample"""
+    report = {name: value for name, value in result.items() if name not in _ROW_ARRAYS}
+    for prefix in MODEL_PREFIXES:
+        report[f'{prefix}_roc_fpr'], report[f'{prefix}_roc_tpr'] = downsample_roc(
+            result[f'{prefix}_roc_fpr'], result[f'{prefix}_roc_tpr'], max_roc_points,
+        )
+    report['test_index'] = np.asarray(result['test_index'], dtype=np.int64)
+    report['report_version'] = np.int64(REPORT_VERSION)
+    report['created_at'] = np.str_(datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'))
+    report['model_checksum'] = np.str_(model_checksum)
+    report['dataset_fingerprint'] = np.str_(dataset_fp)
+    return report
+
+
+def write_report(report, path=REPORT_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez_compressed(f, **report)
+    os.replace(tmp_path, path)
+
+
+def read_report(path=REPORT_PATH):
+    """Laporan evaluasi (dict array), atau None jika belum ada / versinya tidak cocok"""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            report = {name: data[name] for name in data.files}
+    except (OSError, ValueError):
+        return None
+    if report.get('report_version') != REPORT_VERSION:
+        return None
+    return report
+
+
+def report_stale(report, model_checksum):
+    """True jika laporan dibuat untuk model lain (pickle berubah sejak training)"""
+    return str(report['model_checksum']) != model_checksum
+
+
+class EvaluationCache:
+    """Hasil evaluasi per kunci: dict di memori + file .npz di `cache_dir` (opsional)"""
+
+    def __init__(self, cache_dir=EVALUATION_CACHE_DIR, max_entries=MAX_MEMORY_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.npz')
+
+    def _disk_get(self, key):
+        if not self.cache_dir:
+            return None
+        try:
+            with np.load(self._path(key), allow_pickle=False) as data:
+                return {name: data[name] for name in data.files}
+        except (OSError, ValueError):
+            # belum ada, atau file rusak / setengah tertulis: hitung ulang
+            return None
+
+    def _disk_put(self, key, result):
+        if not self.cache_dir:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, **result)
+            os.replace(tmp_path, path)
+        except OSError:
+            # cache disk opsional: gagal menulis tidak menggagalkan evaluasi
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _remember(self, key, result):
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Hasil tersimpan, atau None"""
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return result
+        result = self._disk_get(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, result)
+        return result
+
+    def put(self, key, result):
+        with self._lock:
+            self._remember(key, result)
+        self._disk_put(key, result)
+
+    def get_or_compute(self, key, compute):
+        """Hasil dari cache, atau `compute()` lalu disimpan"""
+        result = self.get(key)
+        if result is None:
+            result = compute()
+            self.put(key, result)
+        return result
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if disk and self.cache_dir and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.npz'):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'size': len(self._memory),
+            'max_entries': self.max_entries,
+        }
+
+
+_evaluation_cache = None
+_evaluation_cache_lock = threading.Lock()
+
+
+def get_evaluation_cache():
+    """EvaluationCache bersama untuk semua sesi di satu proses"""
+    global _evaluation_cache
+    with _evaluation_cache_lock:
+        if _evaluation_cache is None:
+            _evaluation_cache = EvaluationCache()
+        return _evaluation_cache
@@ -0,0 +1,46 @@
+"""Pilihan vectorizer untuk training: TF-IDF (ber-vocabulary) atau hashing (stateless).
+
+`HashingVectorizer` memetakan token ke kolom lewat hash, sehingga tidak ada vocabulary
+yang perlu di-fit, disimpan di pickle, atau dikirim ke worker: setiap chunk data bisa
+di-featurize sendiri-sendiri dan hasilnya identik. Gantinya tidak ada bobot idf dan
+beberapa token bisa bertabrakan di kolom yang sama (jarang pada 2**14 kolom untuk
+ulasan pendek). `alternate_sign=False` menjaga fitur tetap non-negatif agar SelectKBest
+chi2 di pipeline LR tetap bisa dipakai.
+
+    vectorizer = make_vectorizer(use_hashing, max_features=3000, ngram_range=(1, 2), min_df=3)
+"""
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+
+HASHING_N_FEATURES = 2 ** 14
+# Parameter HashingVectorizer yang dibutuhkan untuk transform (disimpan di manifest artefak)
+HASHING_PARAMS = (
+    'alternate_sign', 'analyzer', 'binary', 'decode_error', 'encoding', 'input', 'lowercase',
+    'n_features', 'ngram_range', 'norm', 'strip_accents', 'token_pattern',
+)
+
+
+def make_hashing_vectorizer(ngram_range=(1, 1), n_features=HASHING_N_FEATURES):
+    return HashingVectorizer(
+        n_features=n_features, ngram_range=ngram_range, alternate_sign=False, norm='l2', lowercase=True,
+    )
+
+
+def make_vectorizer(use_hashing, ngram_range=(1, 1), n_features=HASHING_N_FEATURES, **tfidf_params):
+    """HashingVectorizer jika `use_hashing`, selain itu TfidfVectorizer(`tfidf_params`).
+
+    Parameter yang hanya berlaku untuk TF-IDF (max_features, min_df, sublinear_tf, ...)
+    diabaikan pada mode hashing.
+    """
+    if use_hashing:
+        return make_hashing_vectorizer(ngram_range=ngram_range, n_features=n_features)
+    return TfidfVectorizer(ngram_range=ngram_range, **tfidf_params)
+
+
+def is_hashing(vectorizer):
+    return isinstance(vectorizer, HashingVectorizer)
+
+
+def active_feature_count(X):
+    """Jumlah kolom yang pernah terisi di matriks sparse `X` (ukuran 'vocabulary' mode hashing)"""
+    return int(np.unique(X.indices).size) if X.nnz else 0
@@ -0,0 +1,143 @@
+"""Cache chart matplotlib/seaborn yang sudah di-render (bytes PNG/SVG).
+
+Setiap rerun Streamlit membangun ulang figure walaupun datanya tidak berubah; render
+(layout teks, rasterisasi) adalah bagian besar latensi halaman. Chart disimpan sebagai
+bytes hasil `savefig` dengan kunci hash dari nama chart, parameternya, dan data yang
+digambar, sehingga chart yang sama langsung dikirim tanpa menyentuh matplotlib:
+
+    key = figure_key('confusion_matrix', cm, labels=class_names, cmap='Blues')
+    st.image(figure_cache.get_or_render(key, draw), use_container_width=True)
+
+`draw()` hanya dipanggil saat cache miss dan harus mengembalikan Figure; figure ditutup
+setelah di-render. Cache dibatasi total ukuran bytes (LRU), bukan jumlah entri.
+Default render mengikuti `st.pyplot` (PNG, dpi 200, bbox_inches='tight').
+"""
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from sentiment.cache import config_fingerprint
+
+# Naikkan jika cara menggambar chart berubah tanpa perubahan data/parameter
+FIGURE_VERSION = 1
+DEFAULT_FIGURE_FORMAT = 'png'
+DEFAULT_FIGURE_DPI = 200
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _data_bytes(value):
+    """Bytes stabil untuk data chart (array/Series di-hash isinya, bukan repr yang terpotong)"""
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes()
+    if isinstance(value, pd.Index):
+        return pd.util.hash_pandas_object(value).to_numpy().tobytes()
+    if isinstance(value, np.ndarray):
+        header = f'{value.dtype.str}{value.shape}'.encode('utf-8')
+        if value.dtype == object:
+            return header + pd.util.hash_pandas_object(pd.Series(value.ravel()), index=False).to_numpy().tobytes()
+        return header + np.ascontiguousarray(value).tobytes()
+    return config_fingerprint(value).encode('utf-8')
+
+
+def figure_key(chart, *data, **params):
+    """Kunci cache untuk chart `chart` dari data (`data`) dan parameter tampilan (`params`)"""
+    digest = hashlib.blake2b(config_fingerprint(FIGURE_VERSION, chart, params).encode('utf-8'), digest_size=16)
+    for value in data:
+        digest.update(b'\x00')
+        digest.update(_data_bytes(value))
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """LRU bytes gambar per kunci di memori, dibatasi total `max_bytes`"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, fmt=DEFAULT_FIGURE_FORMAT, dpi=DEFAULT_FIGURE_DPI):
+        self.max_bytes = max_bytes
+        self.format = fmt
+        self.dpi = dpi
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, figure):
+        """Bytes `figure` dalam format cache, lalu figure ditutup"""
+        buffer = io.BytesIO()
+        try:
+            figure.savefig(buffer, format=self.format, dpi=self.dpi, bbox_inches='tight')
+        finally:
+            plt.close(figure)
+        return buffer.getvalue()
+
+    def get(self, key):
+        """Bytes tersimpan, atau None"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            # lebih besar dari seluruh cache: tidak disimpan
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size_bytes -= len(old)
+            self._entries[key] = data
+            self.size_bytes += len(data)
+            while self.size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted)
+                self.evictions += 1
+
+    def get_or_render(self, key, draw):
+        """Bytes dari cache, atau render `draw()` lalu disimpan"""
+        data = self.get(key)
+        if data is None:
+            data = self.render(draw())
+            self.put(key, data)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Statistik: hits, misses, hit_rate, evictions, size (entri), bytes, max_bytes"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'bytes': self.size_bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+
+_figure_cache = None
+_figure_cache_lock = threading.Lock()
+
+
+def get_figure_cache():
+    """FigureCache bersama untuk semua sesi di satu proses"""
+    global _figure_cache
+    with _figure_cache_lock:
+        if _figure_cache is None:
+            _figure_cache = FigureCache()
+        return _figure_cache
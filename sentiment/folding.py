@@ -0,0 +1,113 @@
+"""Kompilasi pipeline TF-IDF -> SelectKBest -> TruncatedSVD -> LogisticRegression.
+
+Semua tahap setelah TF-IDF linear:
+    skor = ((X[:, S] @ components_.T) @ coef_.T) + intercept_
+         = X[:, S] @ (coef_ @ components_).T + intercept_
+sehingga matriks bobot gabungan `coef_ @ components_` (n_kelas x k kolom terpilih) cukup
+dihitung sekali. Bobot itu disebar ke indeks kolom TF-IDF terpilih (kolom lain bernilai
+nol), jadi prediksi menjadi satu perkalian sparse x dense ditambah softmax, tanpa
+matriks SVD dense 300 kolom per request.
+
+    python -m sentiment.folding   # uji paritas terhadap model/pipeline_best.pkl
+"""
+import os
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PARITY_DATA_PATH = os.path.join(BASE_DIR, 'data', 'data_ujicoba_upload.csv')
+PARITY_TOLERANCE = 1e-9
+
+
+def fold_weights(select_mask, svd_components, coef):
+    """Bobot gabungan (n_fitur_tfidf x n_kelas); baris kolom yang tidak terpilih bernilai nol"""
+    select_mask = np.asarray(select_mask, dtype=bool)
+    selected_weights = np.asarray(coef) @ np.asarray(svd_components)
+    weights = np.zeros((select_mask.shape[0], selected_weights.shape[0]), dtype=np.float64)
+    weights[select_mask] = selected_weights.T
+    return weights
+
+
+class FoldedLinearPipeline:
+    """Pipeline TF-IDF + bobot linear gabungan dengan API predict / predict_proba sklearn"""
+
+    def __init__(self, vectorizer, weights, intercept, classes):
+        self.vectorizer = vectorizer
+        self.weights = weights
+        self.intercept_ = np.asarray(intercept, dtype=np.float64)
+        self.classes_ = np.asarray(classes)
+
+    @classmethod
+    def from_arrays(cls, vectorizer, select_mask, svd_components, coef, intercept, classes):
+        return cls(vectorizer, fold_weights(select_mask, svd_components, coef), intercept, classes)
+
+    @classmethod
+    def from_pipeline(cls, pipeline):
+        """Kompilasi sklearn Pipeline (vect, select, svd, clf) yang sudah di-fit"""
+        steps = dict(pipeline.steps)
+        if list(steps) != ['vect', 'select', 'svd', 'clf']:
+            raise ValueError(f"Pipeline tidak bisa dikompilasi: {list(steps)}")
+        clf = steps['clf']
+        if getattr(clf, 'multi_class', 'auto') == 'ovr' and len(clf.classes_) > 2:
+            raise ValueError("LogisticRegression one-vs-rest tidak didukung, hanya multinomial")
+        return cls.from_arrays(
+            steps['vect'], steps['select'].get_support(), steps['svd'].components_,
+            clf.coef_, clf.intercept_, clf.classes_,
+        )
+
+    def decision_function(self, raw_documents):
+        X = self.vectorizer.transform(raw_documents)
+        scores = np.asarray(X @ self.weights) + self.intercept_
+        return scores.ravel() if scores.shape[1] == 1 else scores
+
+    def predict_proba(self, raw_documents):
+        scores = self.decision_function(raw_documents)
+        if scores.ndim == 1:
+            positive = 1.0 / (1.0 + np.exp(-scores))
+            return np.column_stack([1.0 - positive, positive])
+        scores = scores - scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    def predict(self, raw_documents):
+        scores = self.decision_function(raw_documents)
+        if scores.ndim == 1:
+            return self.classes_[(scores > 0).astype(np.intp)]
+        return self.classes_[scores.argmax(axis=1)]
+
+
+def check_parity(pipeline, texts, engine=None, tolerance=PARITY_TOLERANCE):
+    """Bandingkan FoldedLinearPipeline dengan pipeline sklearn aslinya pada `texts`.
+
+    Mengembalikan dict: n, predict_mismatch, proba_max_abs_diff, ok.
+    """
+    engine = engine or FoldedLinearPipeline.from_pipeline(pipeline)
+    mismatch = int((engine.predict(texts) != pipeline.predict(texts)).sum())
+    diff = float(np.abs(engine.predict_proba(texts) - pipeline.predict_proba(texts)).max()) if len(texts) else 0.0
+    return {
+        'n': len(texts),
+        'predict_mismatch': mismatch,
+        'proba_max_abs_diff': diff,
+        'ok': mismatch == 0 and diff <= tolerance,
+    }
+
+
+def check_bundled_parity(path=PARITY_DATA_PATH, model_dir=None):
+    """Uji paritas model/pipeline_best.pkl pada data/data_ujicoba_upload.csv (kolom Review)"""
+    import joblib
+    import pandas as pd
+
+    model_dir = model_dir or os.path.join(BASE_DIR, 'model')
+    pipeline = joblib.load(os.path.join(model_dir, 'pipeline_best.pkl'))
+    texts = pd.read_csv(path)['Review'].fillna('').astype(str).tolist()
+    return check_parity(pipeline, texts)
+
+
+if __name__ == '__main__':
+    import json
+    import sys
+
+    result = check_bundled_parity(*sys.argv[1:2])
+    print(json.dumps(result, indent=2))
+    sys.exit(0 if result['ok'] else 1)
@@ -0,0 +1,109 @@
+"""Ingest CSV secara streaming untuk upload berukuran besar.
+
+File dibaca per chunk dengan `pd.read_csv(chunksize=...)` dan hanya kolom yang
+dibutuhkan yang di-parse (`content`, plus `at` jika ada). Duplikat dibuang lintas chunk
+memakai hash 64-bit dari teks review, sehingga yang disimpan hanya 8 byte per review
+unik. Setiap chunk langsung diteruskan ke preprocessing dan labeling; yang tersisa di
+memori hanya kolom hasil, bukan beberapa salinan penuh dari file mentah.
+"""
+import numpy as np
+import pandas as pd
+
+DEFAULT_INGEST_CHUNK_SIZE = 50_000
+CONTENT_COLUMN = 'content'
+OPTIONAL_COLUMNS = ('at',)
+
+
+def read_csv_columns(file):
+    """Baca header CSV saja lalu kembalikan posisi file ke awal"""
+    columns = list(pd.read_csv(file, nrows=0).columns)
+    file.seek(0)
+    return columns
+
+
+def iter_csv_chunks(file, chunk_size=DEFAULT_INGEST_CHUNK_SIZE, columns=None):
+    """Iterasi DataFrame per chunk, hanya untuk kolom `content` (+ kolom opsional yang ada)"""
+    if columns is None:
+        header = read_csv_columns(file)
+        columns = [CONTENT_COLUMN] + [c for c in OPTIONAL_COLUMNS if c in header]
+    yield from pd.read_csv(file, usecols=columns, chunksize=chunk_size, dtype={CONTENT_COLUMN: object})
+
+
+class ContentDeduplicator:
+    """Buang baris kosong dan duplikat `content` lintas chunk memakai hash 64-bit"""
+
+    def __init__(self, column=CONTENT_COLUMN):
+        self.column = column
+        self._seen = np.empty(0, dtype=np.uint64)  # hash unik, selalu terurut
+
+    def __len__(self):
+        return len(self._seen)
+
+    def _is_seen(self, hashes):
+        if not len(self._seen):
+            return np.zeros(len(hashes), dtype=bool)
+        positions = np.searchsorted(self._seen, hashes)
+        positions[positions == len(self._seen)] = 0
+        return self._seen[positions] == hashes
+
+    def __call__(self, chunk):
+        chunk = chunk[chunk[self.column].notna()]
+        if chunk.empty:
+            return chunk
+        hashes = pd.util.hash_pandas_object(chunk[self.column], index=False).to_numpy()
+        keep = ~pd.Series(hashes).duplicated().to_numpy() & ~self._is_seen(hashes)
+        self._seen = np.union1d(self._seen, hashes[keep])
+        return chunk[keep]
+
+
+def stream_preprocess(file, preprocessor, label_fn=None, chunk_size=DEFAULT_INGEST_CHUNK_SIZE,
+                      progress_callback=None):
+    """Baca, dedupe, preprocess, dan label CSV per chunk.
+
+    `preprocessor` adalah objek dengan method `run(texts)` dan atribut `columns`
+    (mis. ParallelPreprocessor),
+    `label_fn(frame)` menambah kolom label ke frame hasil satu chunk.
+    `progress_callback(rows_read, fraction)` dipanggil setiap chunk; `fraction` adalah
+    perkiraan posisi baca di file (None jika ukuran file tidak diketahui).
+
+    Mengembalikan (DataFrame hasil, dict statistik).
+    """
+    total_bytes = getattr(file, 'size', None)
+    deduplicator = ContentDeduplicator()
+    stats = {'chunks': 0, 'rows_read': 0, 'rows_empty': 0, 'rows_duplicate': 0, 'rows_kept': 0}
+    frames = []
+
+    for chunk in iter_csv_chunks(file, chunk_size):
+        stats['chunks'] += 1
+        stats['rows_read'] += len(chunk)
+        non_empty = int(chunk[CONTENT_COLUMN].notna().sum())
+        stats['rows_empty'] += len(chunk) - non_empty
+        chunk = deduplicator(chunk)
+        stats['rows_duplicate'] += non_empty - len(chunk)
+
+        if not chunk.empty:
+            chunk = chunk.reset_index(drop=True)
+            for column_name, column_values in preprocessor.run(chunk[CONTENT_COLUMN]).items():
+                chunk[column_name] = column_values
+            if label_fn is not None:
+                chunk = label_fn(chunk)
+            frames.append(chunk)
+            stats['rows_kept'] += len(chunk)
+
+        if progress_callback is not None:
+            fraction = None
+            if total_bytes:
+                try:
+                    fraction = min(1.0, file.tell() / total_bytes)
+                except (AttributeError, OSError, ValueError):
+                    fraction = None
+            progress_callback(stats['rows_read'], fraction)
+
+    if frames:
+        result = pd.concat(frames, ignore_index=True)
+    else:
+        result = pd.DataFrame(columns=[CONTENT_COLUMN, *preprocessor.columns])
+        if label_fn is not None:
+            # Frame kosong tetap punya kolom label agar kode setelahnya tidak KeyError
+            result = label_fn(result)
+    return result, stats
@@ -0,0 +1,93 @@
+"""Pelabelan lexicon secara batch dengan matriks sparse.
+
+Skor satu ulasan = jumlah bobot positif + bobot negatif setiap token (sama seperti
+`sentiment_analysis_lexicon_indonesia`). Untuk satu batch:
+    1. semua token dipetakan ke indeks kosakata lexicon (lookup hash tervektorisasi),
+    2. dibangun satu matriks dokumen-term CSR (dokumen x kosakata lexicon),
+    3. skor = X @ w, dengan w = bobot positif + bobot negatif per kata,
+    4. polaritas = tanda skor -> 'negative' / 'neutral' / 'positive'.
+
+Untuk teks (`score_texts`), setiap teks unik hanya diskor sekali lalu hasilnya dipetakan
+kembali, karena ulasan yang sama sangat sering berulang.
+"""
+import threading
+from itertools import chain, repeat
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from sentiment.lexicon import DEFAULT_LEXICON_PATH, get_lexicon
+
+POLARITY_LABELS = np.array(['negative', 'neutral', 'positive'], dtype=object)
+
+
+class LexiconScorer:
+    """Skor polaritas batch dari lexicon positif & negatif"""
+
+    def __init__(self, lexicon_positive, lexicon_negative):
+        vocabulary = list(dict.fromkeys(chain(lexicon_positive, lexicon_negative)))
+        self.vocabulary = {word: index for index, word in enumerate(vocabulary)}
+        # Kata yang ada di kedua lexicon mendapat kedua bobot, sama seperti versi per baris
+        self.weights = np.array(
+            [lexicon_positive.get(word, 0) + lexicon_negative.get(word, 0) for word in vocabulary],
+            dtype=np.int64,
+        )
+
+    def document_term_matrix(self, token_lists):
+        """Matriks CSR jumlah kemunculan (dokumen x kosakata lexicon); token di luar lexicon diabaikan"""
+        token_lists = list(token_lists)
+        lengths = np.fromiter((len(tokens) for tokens in token_lists), dtype=np.int64, count=len(token_lists))
+        total = int(lengths.sum())
+        lookup = self.vocabulary.get
+        columns = np.fromiter(
+            map(lookup, chain.from_iterable(token_lists), repeat(-1)), dtype=np.intp, count=total
+        )
+        rows = np.repeat(np.arange(len(token_lists)), lengths)
+        known = columns >= 0
+        data = np.ones(int(known.sum()), dtype=np.int64)
+        return sp.csr_matrix(
+            (data, (rows[known], columns[known])),
+            shape=(len(token_lists), len(self.vocabulary)),
+        )
+
+    def score(self, token_lists):
+        """(skor int64, polaritas) untuk setiap list token"""
+        scores = self.document_term_matrix(token_lists) @ self.weights
+        polarity = POLARITY_LABELS[np.sign(scores) + 1]
+        return scores, polarity
+
+    def score_texts(self, texts):
+        """Seperti `score`, untuk teks yang tokennya dipisah spasi (mis. final_text)"""
+        codes, uniques = pd.factorize(pd.Series(texts, dtype=object).fillna('').astype(str))
+        unique_scores, unique_polarity = self.score(text.split() for text in uniques)
+        return unique_scores[codes], unique_polarity[codes]
+
+    def label_frame(self, frame):
+        """Tambah kolom `polarity_score` & `polarity` ke frame.
+
+        Memakai `final_text` (= ' '.join(filtered_tokens)) agar ulasan duplikat diskor
+        sekali; jika tidak ada, memakai `filtered_tokens`.
+        """
+        if 'final_text' in frame:
+            scores, polarity = self.score_texts(frame['final_text'])
+        else:
+            scores, polarity = self.score(frame['filtered_tokens'])
+        frame['polarity_score'] = scores
+        frame['polarity'] = polarity
+        return frame
+
+
+_scorers = {}
+_lock = threading.Lock()
+
+
+def get_lexicon_scorer(path=DEFAULT_LEXICON_PATH):
+    """LexiconScorer bersama untuk store lexicon di `path` (dibangun sekali per proses)"""
+    lexicons = get_lexicon(path)
+    with _lock:
+        cached = _scorers.get(path)
+        # Dibangun ulang jika lexicon di-refresh (objek dict baru)
+        if cached is None or cached[0] is not lexicons:
+            _scorers[path] = cached = (lexicons, LexiconScorer(*lexicons))
+        return cached[1]
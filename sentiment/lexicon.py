@@ -0,0 +1,202 @@
+"""Penyimpanan lexicon sentimen (InSet positif/negatif) yang offline-first.
+
+Lexicon disimpan di repo dalam format biner ringkas (`data/lexicon/inset_lexicon.npz`):
+    - `<polaritas>_words`  : kata-kata UTF-8 digabung dengan '\\n' (array uint8)
+    - `<polaritas>_scores` : skor per kata (int16)
+tanpa pickle, ditambah `manifest.json` berisi versi, checksum sha256, jumlah kata, dan
+sumber data. Lexicon dimuat sekali per proses lewat `get_lexicon()` dan dipakai bersama
+oleh app.py dan templates/Model.py, sehingga labeling tidak lagi butuh akses internet.
+
+Jika store belum ada, `get_lexicon()` mengunduhnya sekali dari sumber default lalu
+menyimpannya. Refresh store yang sudah ada hanya dilakukan secara eksplisit:
+
+    python -m sentiment.lexicon refresh [url_positif url_negatif]
+    python -m sentiment.lexicon import lexicon_positive.csv lexicon_negative.csv
+"""
+import csv
+import datetime
+import hashlib
+import json
+import os
+import threading
+from io import StringIO
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LEXICON_DIR = os.path.join(BASE_DIR, 'data', 'lexicon')
+DEFAULT_LEXICON_PATH = os.path.join(LEXICON_DIR, 'inset_lexicon.npz')
+MANIFEST_NAME = 'manifest.json'
+
+DEFAULT_SOURCES = {
+    'positive': 'https://raw.githubusercontent.com/angelmetanosaa/dataset/main/lexicon_positive.csv',
+    'negative': 'https://raw.githubusercontent.com/angelmetanosaa/dataset/main/lexicon_negative.csv',
+}
+POLARITIES = ('positive', 'negative')
+
+
+def _manifest_path(path):
+    return os.path.join(os.path.dirname(os.path.abspath(path)), MANIFEST_NAME)
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def parse_lexicon_csv(text):
+    """Parse CSV `kata,skor` menjadi dict; baris yang skornya bukan angka (mis. header) dilewati"""
+    lexicon = {}
+    for row in csv.reader(StringIO(text), delimiter=','):
+        if len(row) < 2:
+            continue
+        try:
+            lexicon[row[0]] = int(row[1])
+        except ValueError:
+            continue
+    return lexicon
+
+
+def read_manifest(path=DEFAULT_LEXICON_PATH):
+    """Manifest store (dict), atau None jika belum ada"""
+    manifest_path = _manifest_path(path)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_lexicon(positive, negative, path=DEFAULT_LEXICON_PATH, sources=None):
+    """Tulis lexicon ke store biner + manifest; versi dinaikkan setiap kali disimpan"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    arrays = {}
+    for name, lexicon in zip(POLARITIES, (positive, negative)):
+        words = list(lexicon)
+        arrays[f'{name}_words'] = np.frombuffer('\n'.join(words).encode('utf-8'), dtype=np.uint8)
+        arrays[f'{name}_scores'] = np.array([lexicon[word] for word in words], dtype=np.int16)
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez_compressed(f, **arrays)
+    os.replace(tmp_path, path)
+
+    previous = read_manifest(path) or {}
+    manifest = {
+        'version': int(previous.get('version', 0)) + 1,
+        'file': os.path.basename(path),
+        'sha256': _sha256(path),
+        'counts': {'positive': len(positive), 'negative': len(negative)},
+        'sources': sources or previous.get('sources') or {},
+        'updated_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+    }
+    with open(_manifest_path(path), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+    return manifest
+
+
+def read_lexicon(path=DEFAULT_LEXICON_PATH):
+    """Baca store dari disk (tanpa cache); checksum dicocokkan dengan manifest jika ada"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"Lexicon store tidak ditemukan: {path}. "
+            "Jalankan `python -m sentiment.lexicon refresh` atau `python -m sentiment.lexicon import ...`."
+        )
+    manifest = read_manifest(path)
+    if manifest is not None and manifest.get('sha256') != _sha256(path):
+        raise ValueError(f"Checksum lexicon store tidak cocok dengan {MANIFEST_NAME}: {path}")
+
+    lexicons = []
+    with np.load(path, allow_pickle=False) as data:
+        for name in POLARITIES:
+            raw = data[f'{name}_words'].tobytes().decode('utf-8')
+            words = raw.split('\n') if raw else []
+            scores = data[f'{name}_scores'].tolist()
+            lexicons.append(dict(zip(words, scores)))
+    return tuple(lexicons)
+
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def get_lexicon(path=DEFAULT_LEXICON_PATH, fetch_missing=True):
+    """(lexicon_positive, lexicon_negative) yang dimuat sekali per proses.
+
+    Jika store belum ada dan `fetch_missing`, lexicon diunduh dari DEFAULT_SOURCES dan
+    disimpan ke `path`; FileNotFoundError jika unduhan gagal.
+    Dict yang dikembalikan dipakai bersama; jangan diubah di tempat.
+    """
+    lexicons = _loaded.get(path)
+    if lexicons is not None:
+        return lexicons
+    if fetch_missing and not os.path.exists(path):
+        try:
+            refresh_lexicon(path=path)
+        except OSError as e:
+            raise FileNotFoundError(
+                f"Lexicon store tidak ditemukan: {path} dan gagal diunduh dari sumber default ({e}). "
+                "Jalankan `python -m sentiment.lexicon refresh` atau `python -m sentiment.lexicon import ...`."
+            ) from e
+    with _lock:
+        if path not in _loaded:
+            _loaded[path] = read_lexicon(path)
+        return _loaded[path]
+
+
+def lexicon_version(path=DEFAULT_LEXICON_PATH):
+    """Versi store dari manifest (0 jika belum ada manifest)"""
+    manifest = read_manifest(path)
+    return int(manifest['version']) if manifest else 0
+
+
+def _reload(path):
+    with _lock:
+        _loaded.pop(path, None)
+
+
+def refresh_lexicon(positive_url=DEFAULT_SOURCES['positive'], negative_url=DEFAULT_SOURCES['negative'],
+                    path=DEFAULT_LEXICON_PATH, timeout=10):
+    """Unduh ulang lexicon dari URL lalu tulis ke store"""
+    import requests
+
+    lexicons = []
+    for url in (positive_url, negative_url):
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+        lexicon = parse_lexicon_csv(response.text)
+        if not lexicon:
+            raise ValueError(f"Lexicon kosong / format tidak dikenali: {url}")
+        lexicons.append(lexicon)
+    manifest = save_lexicon(*lexicons, path=path, sources={'positive': positive_url, 'negative': negative_url})
+    _reload(path)
+    return manifest
+
+
+def import_lexicon_csv(positive_path, negative_path, path=DEFAULT_LEXICON_PATH):
+    """Bangun store dari file CSV lokal"""
+    lexicons = []
+    for csv_path in (positive_path, negative_path):
+        with open(csv_path, encoding='utf-8') as f:
+            lexicons.append(parse_lexicon_csv(f.read()))
+    manifest = save_lexicon(*lexicons, path=path, sources={'positive': positive_path, 'negative': negative_path})
+    _reload(path)
+    return manifest
+
+
+if __name__ == '__main__':
+    import sys
+
+    command = sys.argv[1] if len(sys.argv) > 1 else 'info'
+    if command == 'refresh':
+        print(json.dumps(refresh_lexicon(*sys.argv[2:4]), indent=2))
+    elif command == 'import' and len(sys.argv) == 4:
+        print(json.dumps(import_lexicon_csv(sys.argv[2], sys.argv[3]), indent=2))
+    elif command == 'info':
+        print(json.dumps(read_manifest(), indent=2))
+    else:
+        print("Pemakaian: python -m sentiment.lexicon [info | refresh [url_pos url_neg] | import pos.csv neg.csv]")
+        sys.exit(1)
@@ -0,0 +1,169 @@
+"""Eksekusi paralel pipeline preprocessing dengan process pool.
+
+DataFrame dipecah menjadi chunk, setiap chunk diproses penuh (semua langkah) oleh satu
+worker, lalu hasilnya disusun kembali sesuai urutan asli. Progres dilaporkan per chunk
+lewat callback `progress_callback(selesai, total)` sehingga bisa dihubungkan ke
+`st.progress`.
+
+Jika stemming aktif, worker tidak menyentuh cache stem di disk: kata unik dikumpulkan di
+proses utama, yang sudah ada di cache diambil dari sana, sisanya di-stem paralel oleh
+worker (cache memori saja) lalu disimpan oleh proses utama. Dengan begitu hanya ada satu
+penulis ke file SQLite.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from sentiment.stemming import StemmingService, get_stemming_service
+
+DEFAULT_CHUNK_SIZE = 5_000
+# 'spawn' lebih aman daripada fork untuk proses server yang multi-thread (Streamlit)
+DEFAULT_START_METHOD = 'spawn'
+
+_worker_pipeline = None
+_worker_stemmer = None
+
+
+def default_workers():
+    """Jumlah worker default: semua core yang tersedia untuk proses ini"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _init_worker(pipeline):
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+
+def _run_chunk(chunk_index, texts):
+    # Stemming dikerjakan terpisah lewat _stem_chunk (lihat ParallelPreprocessor._stem)
+    return chunk_index, _worker_pipeline.run(texts, stem=False)
+
+
+def _stem_chunk(words):
+    global _worker_stemmer
+    if _worker_stemmer is None:
+        _worker_stemmer = StemmingService(cache_path=None)
+    return {word: _worker_stemmer.stem_word(word) for word in words}
+
+
+def _split_chunks(values, chunk_size):
+    return [values[start:start + chunk_size] for start in range(0, len(values), chunk_size)]
+
+
+def _merge_results(results, column_names):
+    columns = {name: [] for name in column_names}
+    for result in results:
+        for name in column_names:
+            columns[name].extend(result[name])
+    return columns
+
+
+class ParallelPreprocessor:
+    """Process pool yang bisa dipakai ulang untuk beberapa batch (mis. mode streaming).
+
+    Pool baru dibuat saat pertama kali dibutuhkan dan ditutup lewat `close()` atau
+    blok `with`. Jika `workers` <= 1 atau batch hanya satu chunk, pipeline dijalankan
+    langsung di proses ini tanpa pool. Jika `cache` (PreprocessCache) diberikan, hanya
+    teks unik yang belum ada di cache yang dikirim ke worker.
+    """
+
+    def __init__(self, pipeline, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, start_method=DEFAULT_START_METHOD,
+                 cache=None):
+        self.pipeline = pipeline
+        self.cache = cache
+        self.workers = int(workers or default_workers())
+        self.chunk_size = max(1, int(chunk_size))
+        self.start_method = start_method
+        self._executor = None
+
+    @property
+    def columns(self):
+        """Kolom yang dihasilkan pipeline"""
+        return self.pipeline.columns
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_init_worker,
+                initargs=(self.pipeline,),
+            )
+        return self._executor
+
+    def run(self, texts, progress_callback=None):
+        """Jalankan `pipeline.run` per chunk; kembalikan dict {kolom: list nilai} sesuai urutan `texts`"""
+        if self.cache is not None:
+            return self.cache.map_columns(
+                texts, lambda missing: self._run(missing, progress_callback), self.columns
+            )
+        return self._run(texts, progress_callback)
+
+    def _run(self, texts, progress_callback):
+        chunks = _split_chunks(list(texts), self.chunk_size)
+        total = len(chunks)
+
+        if self.workers <= 1 or total <= 1:
+            results = []
+            for index, chunk in enumerate(chunks):
+                results.append(self.pipeline.run(chunk))
+                if progress_callback is not None:
+                    progress_callback(index + 1, total)
+            return _merge_results(results, self.columns)
+
+        executor = self._get_executor()
+        results = [None] * total
+        futures = [executor.submit(_run_chunk, index, chunk) for index, chunk in enumerate(chunks)]
+        for done, future in enumerate(as_completed(futures), start=1):
+            index, result = future.result()
+            results[index] = result
+            if progress_callback is not None:
+                progress_callback(done, total)
+        merged = _merge_results(results, self.columns)
+        if self.pipeline.use_stemming:
+            merged = self._stem(merged)
+        return merged
+
+    def _stem(self, merged):
+        """Stem kata unik hasil worker; proses utama satu-satunya penulis cache stem di disk"""
+        if 'filtered_tokens' in merged:
+            words = {token for row in merged['filtered_tokens'] for token in row}
+        else:
+            words = {token for text in merged['final_text'] for token in text.split()}
+        stemming_service = get_stemming_service()
+        stems = stemming_service.lookup_cached(words)
+        missing = sorted(words - stems.keys())
+        if missing:
+            executor = self._get_executor()
+            word_chunk_size = max(1, -(-len(missing) // self.workers))
+            futures = [executor.submit(_stem_chunk, chunk) for chunk in _split_chunks(missing, word_chunk_size)]
+            new_stems = {}
+            for future in as_completed(futures):
+                new_stems.update(future.result())
+            stemming_service.add_stems(new_stems)
+            stems.update(new_stems)
+        return self.pipeline.apply_stems(merged, stems)
+
+
+def parallel_preprocess(texts, pipeline, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                        progress_callback=None, start_method=DEFAULT_START_METHOD, cache=None):
+    """Jalankan `pipeline.run` per chunk di process pool (sekali pakai).
+
+    Mengembalikan dict {kolom: list nilai} dengan urutan yang sama seperti `texts`.
+    """
+    with ParallelPreprocessor(pipeline, workers, chunk_size, start_method, cache) as preprocessor:
+        return preprocessor.run(texts, progress_callback)
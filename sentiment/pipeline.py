@@ -0,0 +1,93 @@
+"""Rantai preprocessing notebook (halaman Upload CSV) dalam bentuk objek yang bisa di-pickle.
+
+Urutan langkah sama dengan halaman Upload CSV di app.py:
+
+    remove_noise -> lowercase -> normalisasi slang -> tokenisasi -> stopword
+    -> (stemming, opsional) -> rekonstruksi teks
+
+Karena semua konfigurasi (kamus slang, daftar stopword, mode tokenizer) disimpan di
+objek, pipeline ini bisa dikirim ke worker process (lihat sentiment.parallel).
+
+Mode fused (`columns=FUSED_COLUMNS`): langkah antara tetap dihitung per batch, tetapi
+hanya `filtered_tokens` dan `final_text` yang dikembalikan. Kolom antara
+(`cleaned_text`, `lowercased_text`, ...) tidak pernah disimpan untuk seluruh korpus,
+sehingga DataFrame hasil jauh lebih kecil untuk upload besar.
+"""
+import pandas as pd
+
+from sentiment.cache import config_fingerprint
+from sentiment.cleaning import clean_series
+from sentiment.slang import SlangNormalizer
+from sentiment.stemming import get_stemming_service
+from sentiment.stopwords import get_stopwords
+from sentiment.tokenizer import DEFAULT_TOKENIZER_MODE, TOKENIZER_VERSION, tokenize_series
+
+PIPELINE_COLUMNS = ('cleaned_text', 'lowercased_text', 'normalized_text', 'tokens', 'filtered_tokens', 'final_text')
+FUSED_COLUMNS = ('filtered_tokens', 'final_text')
+
+
+class NotebookPipeline:
+    """Pipeline preprocessing Upload CSV"""
+
+    def __init__(self, slang_mapping, stopword_list='notebook', tokenizer_mode=DEFAULT_TOKENIZER_MODE,
+                 use_stemming=False, columns=PIPELINE_COLUMNS):
+        unknown = set(columns) - set(PIPELINE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Kolom pipeline tidak dikenal: {sorted(unknown)}")
+        # Urutan kolom output selalu mengikuti PIPELINE_COLUMNS
+        self.columns = tuple(name for name in PIPELINE_COLUMNS if name in columns)
+        self.slang_normalizer = SlangNormalizer(slang_mapping)
+        self.stopword_list = stopword_list
+        # Diresolve di proses utama agar worker memakai daftar yang sama persis
+        self.stop_words = get_stopwords(stopword_list)
+        self.tokenizer_mode = tokenizer_mode
+        self.use_stemming = use_stemming
+
+    def fingerprint(self):
+        """Fingerprint konfigurasi untuk kunci cache preprocessing"""
+        return config_fingerprint(
+            'notebook', self.slang_normalizer.mapping, self.stop_words, self.tokenizer_mode, TOKENIZER_VERSION,
+            self.use_stemming, self.columns
+        )
+
+    def run(self, texts, stem=None):
+        """Jalankan seluruh rantai untuk satu batch; kembalikan dict {kolom: list nilai} untuk `self.columns`.
+
+        `stem=False` melewati stemming walaupun `use_stemming` aktif; dipakai worker pool
+        agar stemming dikerjakan lewat `apply_stems` di proses utama.
+        """
+        texts = pd.Series(texts).reset_index(drop=True)
+        stop_words = self.stop_words
+
+        cleaned = clean_series(texts)
+        lowercased = cleaned.str.lower()
+        normalized = self.slang_normalizer.normalize_series(lowercased)
+        tokens = tokenize_series(normalized, self.tokenizer_mode)
+        filtered = [[token for token in row if token not in stop_words] for row in tokens]
+        if self.use_stemming if stem is None else stem:
+            stemming_service = get_stemming_service()
+            filtered = [stemming_service.stem_tokens(row) for row in filtered]
+            stemming_service.flush()
+        final = [' '.join(row) for row in filtered]
+
+        outputs = {
+            'cleaned_text': cleaned,
+            'lowercased_text': lowercased,
+            'normalized_text': normalized,
+            'tokens': tokens,
+            'filtered_tokens': filtered,
+            'final_text': final,
+        }
+        return {name: list(outputs[name]) for name in self.columns}
+
+    def apply_stems(self, result, stems):
+        """Ganti token di hasil `run(..., stem=False)` dengan stem dari dict {kata: stem}"""
+        if 'filtered_tokens' in result:
+            filtered = [[stems[token] for token in row] for row in result['filtered_tokens']]
+            result['filtered_tokens'] = filtered
+        else:
+            # Token tidak mengandung spasi, jadi final_text bisa dipecah kembali menjadi token
+            filtered = [[stems[token] for token in text.split()] for text in result['final_text']]
+        if 'final_text' in result:
+            result['final_text'] = [' '.join(row) for row in filtered]
+        return result
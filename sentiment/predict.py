@@ -0,0 +1,179 @@
+"""Prediksi sentimen batch untuk model bawaan (SVM + TF-IDF dan pipeline LR).
+
+Satu batch diproses sekaligus: preprocessing hanya untuk teks unik, satu `transform`
+untuk seluruh batch, lalu satu `predict` / `decision_function` / `predict_proba`.
+Hasil per baris: label sentimen, probabilitas setiap kelas, dan confidence (= probabilitas
+tertinggi). Untuk SVM, probabilitas adalah softmax dari `decision_function`, sama seperti
+prediksi teks tunggal di halaman Prediksi.
+
+Jika diberi `PredictionCache`, hasil per teks unik disimpan dengan kunci
+(model_id, model_version, teks hasil preprocessing) dan hanya teks yang belum ada di cache
+yang diprediksi ulang.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from sentiment.cache import _is_missing, config_fingerprint, get_preprocess_cache
+from sentiment.stopwords import get_stopwords
+from sentiment.tokenizer import tokenize
+
+DEFAULT_PREDICT_BATCH_SIZE = 10_000
+# Di bawah ukuran ini teks unik dicari dengan dict, bukan pd.factorize
+SMALL_BATCH_SIZE = 256
+LABEL_COLUMN = 'sentiment'
+CONFIDENCE_COLUMN = 'confidence'
+
+_URL_RE = re.compile(r'http\S+|www\S+|https\S+', flags=re.MULTILINE)
+_EMAIL_RE = re.compile(r'\S+@\S+')
+_NON_LETTER_RE = re.compile(r'[^a-zA-Z\s]')
+
+
+def _preprocess_text_uncached(text):
+    # Convert to lowercase
+    text = str(text).lower()
+    # Remove URLs
+    text = _URL_RE.sub('', text)
+    # Remove email addresses
+    text = _EMAIL_RE.sub('', text)
+    # Remove special characters
+    text = _NON_LETTER_RE.sub('', text)
+    # Tokenize
+    tokens = tokenize(text, 'nltk')
+    # Remove stopwords
+    stop_words = get_stopwords('english')
+    tokens = [token for token in tokens if token not in stop_words and len(token) > 2]
+    return ' '.join(tokens)
+
+
+_preprocess_text_cache = None
+
+
+def preprocess_fingerprint():
+    """Fingerprint konfigurasi `preprocess_text` (berubah jika stopword / versi pipeline berubah)"""
+    return config_fingerprint('preprocess_text', get_stopwords('english'))
+
+
+def preprocess_text(text):
+    """Preprocessing input model (halaman Prediksi/Evaluasi dan server HTTP), di-cache per teks"""
+    global _preprocess_text_cache
+    if isinstance(text, float):
+        return ""
+    if _preprocess_text_cache is None:
+        _preprocess_text_cache = get_preprocess_cache(preprocess_fingerprint())
+    return _preprocess_text_cache.get_or_compute(text, _preprocess_text_uncached)
+
+
+def softmax(scores):
+    scores = np.asarray(scores, dtype=np.float64)
+    scores = scores - scores.max(axis=1, keepdims=True)
+    np.exp(scores, out=scores)
+    scores /= scores.sum(axis=1, keepdims=True)
+    return scores
+
+
+class BatchPredictor:
+    """Prediksi batch dengan satu model.
+
+    `vectorizer` diisi untuk model yang menerima matriks fitur (SVM + TF-IDF); kosongkan
+    untuk model yang menerima teks mentah (pipeline LR). `preprocess` dipanggil sekali
+    per teks unik sebelum vektorisasi. `model_version` harus berubah setiap kali bobot
+    model berubah agar entri cache lama tidak terpakai.
+    """
+
+    def __init__(self, model, label_encoder, vectorizer=None, preprocess=None,
+                 cache=None, model_id=None, model_version=None):
+        self.model = model
+        self.vectorizer = vectorizer
+        self.preprocess = preprocess
+        self.cache = cache
+        self.model_id = model_id or type(model).__name__
+        self.model_version = model_version
+        self.labels = np.asarray(label_encoder.inverse_transform(model.classes_), dtype=object)
+        self.probability_columns = [f'prob_{label}' for label in self.labels]
+
+    def _preprocess(self, texts):
+        if len(texts) <= SMALL_BATCH_SIZE and not isinstance(texts, pd.Series):
+            # batch kecil (request tunggal): dedup dengan dict, overhead pandas lebih besar dari kerjanya
+            positions = {}
+            codes = np.fromiter(
+                (positions.setdefault('' if _is_missing(text) else str(text), len(positions)) for text in texts),
+                dtype=np.intp, count=len(texts),
+            )
+            uniques = list(positions)
+        else:
+            codes, uniques = pd.factorize(pd.Series(texts, dtype=object).fillna('').astype(str))
+        if self.preprocess is not None:
+            uniques = [self.preprocess(text) for text in uniques]
+        return np.asarray(uniques, dtype=object), codes
+
+    def _predict_uniques(self, texts):
+        if self.vectorizer is not None:
+            X = self.vectorizer.transform(texts)
+            scores = self.model.decision_function(X)
+            if scores.ndim == 1:
+                scores = np.column_stack([-scores, scores])
+            probabilities = softmax(scores)
+            # label mengikuti `predict` model (voting one-vs-one), bukan argmax softmax
+            predicted = np.searchsorted(self.model.classes_, self.model.predict(X))
+        else:
+            probabilities = np.asarray(self.model.predict_proba(texts))
+            predicted = probabilities.argmax(axis=1)
+        return predicted, probabilities
+
+    def predict_proba(self, texts):
+        """(indeks kelas per teks, matriks probabilitas n_teks x n_kelas)"""
+        uniques, codes = self._preprocess(texts)
+        if not len(uniques):
+            return np.empty(0, dtype=np.intp), np.empty((0, len(self.labels)))
+        if self.cache is None:
+            predicted, probabilities = self._predict_uniques(uniques)
+            return predicted[codes], probabilities[codes]
+
+        predicted = np.empty(len(uniques), dtype=np.intp)
+        probabilities = np.empty((len(uniques), len(self.labels)))
+        missing = []
+        for position, text in enumerate(uniques):
+            cached = self.cache.get(self.model_id, self.model_version, text)
+            if cached is None:
+                missing.append(position)
+            else:
+                predicted[position], probabilities[position] = cached
+        if missing:
+            computed_predicted, computed_probabilities = self._predict_uniques(uniques[missing])
+            predicted[missing] = computed_predicted
+            probabilities[missing] = computed_probabilities
+            for position, label_index, row in zip(missing, computed_predicted, computed_probabilities):
+                row = row.copy()
+                row.flags.writeable = False
+                self.cache.put(self.model_id, self.model_version, uniques[position], (int(label_index), row))
+        return predicted[codes], probabilities[codes]
+
+    def predict_rows(self, texts):
+        """List (indeks kelas, probabilitas) per teks; bentuk hasil untuk `MicroBatcher`"""
+        predicted, probabilities = self.predict_proba(texts)
+        return list(zip(predicted.tolist(), probabilities))
+
+    def predict_frame(self, texts, index=None):
+        """DataFrame kolom `sentiment`, `prob_<label>`..., `confidence` untuk `texts`"""
+        predicted, probabilities = self.predict_proba(texts)
+        frame = pd.DataFrame(probabilities, columns=self.probability_columns, index=index)
+        frame.insert(0, LABEL_COLUMN, self.labels[predicted])
+        frame[CONFIDENCE_COLUMN] = probabilities.max(axis=1) if len(probabilities) else []
+        return frame
+
+    def iter_predict_csv(self, chunks, text_column, progress_callback=None):
+        """Prediksi setiap chunk DataFrame lalu hasilkan potongan CSV (header hanya di awal).
+
+        Kolom asli dipertahankan dan kolom prediksi ditambahkan di belakangnya.
+        `progress_callback(jumlah_baris_selesai)` dipanggil setelah setiap chunk.
+        """
+        done = 0
+        for position, chunk in enumerate(chunks):
+            predictions = self.predict_frame(chunk[text_column], index=chunk.index)
+            chunk = chunk.drop(columns=[c for c in predictions.columns if c in chunk.columns])
+            yield pd.concat([chunk, predictions], axis=1).to_csv(index=False, header=position == 0)
+            done += len(chunk)
+            if progress_callback is not None:
+                progress_callback(done)
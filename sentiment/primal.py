@@ -0,0 +1,149 @@
+"""Inferensi primal untuk SVC berkernel linear.
+
+`SVC(kernel='linear')` menyimpan semua support vector (16 ribu baris untuk model bawaan)
+dan libsvm menghitung kernel ke setiap support vector saat prediksi. Untuk kernel
+linear, setiap klasifier one-vs-one (i, j) bisa diringkas menjadi satu vektor bobot:
+
+    w_ij = sum_k dual_coef_k * sv_k      (= `SVC.coef_`)
+    dec_ij(x) = w_ij . x + intercept_ij
+
+sehingga semua nilai keputusan satu batch cukup dihitung dengan satu perkalian
+matriks sparse `X @ W.T`. `PrimalLinearSVC` mereproduksi `predict` (voting libsvm)
+dan `decision_function` (bentuk 'ovr' atau 'ovo') dari SVC aslinya.
+
+    python -m sentiment.primal   # uji paritas terhadap model/svm_model.pkl
+"""
+import os
+
+import numpy as np
+import scipy.sparse as sp
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PARITY_DATA_PATH = os.path.join(BASE_DIR, 'data', 'data_ujicoba_upload.csv')
+PARITY_TOLERANCE = 1e-9
+
+
+def collapse_linear_svc(model):
+    """Bobot primal (dict array + konfigurasi) dari SVC berkernel linear yang sudah di-fit"""
+    if getattr(model, 'kernel', None) != 'linear':
+        raise ValueError(f"Hanya SVC dengan kernel='linear' yang bisa diringkas, bukan {model.kernel!r}")
+    coef = model.coef_
+    if sp.issparse(coef):
+        coef = coef.toarray()
+    return {
+        'coef': np.ascontiguousarray(coef, dtype=np.float64),
+        'intercept': np.asarray(model.intercept_, dtype=np.float64),
+        'classes': np.asarray(model.classes_),
+        'decision_function_shape': model.decision_function_shape,
+        'break_ties': bool(model.break_ties),
+    }
+
+
+def ovr_decision_function(predictions, confidences, n_classes):
+    """Ubah keputusan one-vs-one menjadi skor per kelas (sama seperti sklearn)"""
+    votes = np.zeros((predictions.shape[0], n_classes))
+    sum_of_confidences = np.zeros((predictions.shape[0], n_classes))
+    k = 0
+    for i in range(n_classes):
+        for j in range(i + 1, n_classes):
+            sum_of_confidences[:, i] -= confidences[:, k]
+            sum_of_confidences[:, j] += confidences[:, k]
+            votes[predictions[:, k] == 0, i] += 1
+            votes[predictions[:, k] == 1, j] += 1
+            k += 1
+    # confidence ditransformasi ke (-1/3, 1/3) agar hanya memecah seri voting
+    return votes + sum_of_confidences / (3 * (np.abs(sum_of_confidences) + 1))
+
+
+class PrimalLinearSVC:
+    """`predict` / `decision_function` SVC linear dengan satu perkalian matriks"""
+
+    def __init__(self, coef, intercept, classes, decision_function_shape='ovr', break_ties=False):
+        self.coef_ = coef
+        self.intercept_ = intercept
+        self.classes_ = np.asarray(classes)
+        self.decision_function_shape = decision_function_shape
+        self.break_ties = break_ties
+        n_classes = len(self.classes_)
+        expected = 1 if n_classes == 2 else n_classes * (n_classes - 1) // 2
+        if coef.shape[0] != expected or intercept.shape[0] != expected:
+            raise ValueError(f"Bobot untuk {n_classes} kelas harus punya {expected} baris, bukan {coef.shape[0]}")
+        # Pasangan kelas (i, j) per baris bobot, urutan sama dengan libsvm
+        pairs = [(i, j) for i in range(n_classes) for j in range(i + 1, n_classes)]
+        self._pair_i = np.array([i for i, _ in pairs], dtype=np.intp)
+        self._pair_j = np.array([j for _, j in pairs], dtype=np.intp)
+
+    @classmethod
+    def from_svc(cls, model):
+        return cls(**collapse_linear_svc(model))
+
+    def _ovo_decision(self, X):
+        scores = X @ self.coef_.T
+        return np.asarray(scores) + self.intercept_
+
+    def decision_function(self, X):
+        dec = self._ovo_decision(X)
+        if len(self.classes_) == 2:
+            return dec.ravel()
+        if self.decision_function_shape == 'ovr':
+            return ovr_decision_function(dec < 0, -dec, len(self.classes_))
+        return dec
+
+    def predict(self, X):
+        dec = self._ovo_decision(X)
+        if len(self.classes_) == 2:
+            return self.classes_[(dec.ravel() > 0).astype(np.intp)]
+        if self.break_ties and self.decision_function_shape == 'ovr':
+            return self.classes_[ovr_decision_function(dec < 0, -dec, len(self.classes_)).argmax(axis=1)]
+        # Voting libsvm: dec > 0 -> kelas i, selain itu kelas j; seri -> indeks kelas terkecil
+        winners = np.where(dec > 0, self._pair_i, self._pair_j)
+        votes = np.zeros((dec.shape[0], len(self.classes_)), dtype=np.intp)
+        for k in range(winners.shape[1]):
+            np.add.at(votes, (np.arange(dec.shape[0]), winners[:, k]), 1)
+        return self.classes_[votes.argmax(axis=1)]
+
+
+def _reference_svc(model):
+    # Pickle dari sklearn < 1.9 belum punya atribut ini, padahal dibutuhkan decision_function
+    if not hasattr(model, '_effective_probability'):
+        model._effective_probability = model.probability
+    return model
+
+
+def check_parity(model, vectorizer, texts, engine=None, tolerance=PARITY_TOLERANCE):
+    """Bandingkan PrimalLinearSVC dengan SVC aslinya pada `texts`.
+
+    Mengembalikan dict: n, predict_mismatch, decision_max_abs_diff, ok.
+    """
+    model = _reference_svc(model)
+    engine = engine or PrimalLinearSVC.from_svc(model)
+    X = vectorizer.transform(texts)
+    mismatch = int((engine.predict(X) != model.predict(X)).sum())
+    diff = float(np.abs(engine.decision_function(X) - model.decision_function(X)).max()) if X.shape[0] else 0.0
+    return {
+        'n': X.shape[0],
+        'predict_mismatch': mismatch,
+        'decision_max_abs_diff': diff,
+        'ok': mismatch == 0 and diff <= tolerance,
+    }
+
+
+def check_bundled_parity(path=PARITY_DATA_PATH, model_dir=None):
+    """Uji paritas model/svm_model.pkl pada data/data_ujicoba_upload.csv (kolom Review)"""
+    import joblib
+    import pandas as pd
+
+    model_dir = model_dir or os.path.join(BASE_DIR, 'model')
+    model = joblib.load(os.path.join(model_dir, 'svm_model.pkl'))
+    vectorizer = joblib.load(os.path.join(model_dir, 'tfidf_vectorizer.pkl'))
+    texts = pd.read_csv(path)['Review'].fillna('').astype(str).tolist()
+    return check_parity(model, vectorizer, texts)
+
+
+if __name__ == '__main__':
+    import json
+    import sys
+
+    result = check_bundled_parity(*sys.argv[1:2])
+    print(json.dumps(result, indent=2))
+    sys.exit(0 if result['ok'] else 1)
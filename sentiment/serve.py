@@ -0,0 +1,319 @@
+"""Server HTTP lokal untuk prediksi sentimen dengan model bawaan.
+
+Hanya memakai standard library (tanpa layanan eksternal). Model dimuat dengan cara yang
+sama seperti `load_models` di app.py: artefak memory-mapped di `model/artifacts` jika ada
+dan tidak basi, selain itu pickle di `model/` (SVM diringkas ke bobot primal, pipeline LR
+dilipat jadi satu matriks). Teks diproses dengan `preprocess_text` yang sama, dan hasil
+prediksi di-cache per (model, versi model, teks hasil preprocessing). Request `/predict`
+tunggal yang datang bersamaan digabung menjadi satu batch oleh `MicroBatcher`
+(jendela `--batch-window-ms`, default 2 ms, maks `--max-batch-size` teks).
+
+Endpoint (JSON):
+    GET  /health          -> status, model tersedia, versi model
+    GET  /stats           -> statistik cache prediksi dan micro-batch worker yang melayani
+    POST /predict         {"text": "...", "model": "svm" | "lr"}
+    POST /predict/batch   {"texts": ["...", ...], "model": "svm" | "lr"}
+
+Setiap worker adalah proses terpisah yang bind ke port yang sama (SO_REUSEPORT, Linux),
+sehingga kernel membagi koneksi antar worker; di dalam satu worker request dilayani
+per thread.
+
+    python -m sentiment.serve --host 127.0.0.1 --port 8000 --workers 4
+"""
+import argparse
+import json
+import multiprocessing as mp
+import os
+import socket
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import joblib
+
+from sentiment.artifacts import (
+    DEFAULT_ARTIFACT_DIR, MODEL_DIR, SOURCE_FILES, artifacts_stale, load_artifacts, model_version,
+)
+from sentiment.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT, MicroBatcher
+from sentiment.cache import get_prediction_cache
+from sentiment.folding import FoldedLinearPipeline
+from sentiment.predict import BatchPredictor, preprocess_text
+from sentiment.primal import PrimalLinearSVC
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+DEFAULT_MODEL = 'svm'
+MODEL_ALIASES = {'svm': 'svm', 'lr': 'pipeline', 'pipeline': 'pipeline'}
+# Batas ukuran body request (byte) dan jumlah teks per batch
+MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_BATCH_TEXTS = 10_000
+
+
+def load_predictors(model_dir=MODEL_DIR, artifact_dir=None):
+    """{'svm': BatchPredictor, 'pipeline': BatchPredictor} dari artefak, atau pickle jika tidak ada/basi.
+
+    `artifact_dir` default `<model_dir>/artifacts`, sehingga artefak dan pickle yang
+    dicek kebasiannya berasal dari folder model yang sama.
+    """
+    if artifact_dir is None:
+        artifact_dir = os.path.join(model_dir, os.path.basename(DEFAULT_ARTIFACT_DIR))
+    try:
+        artifacts = load_artifacts(artifact_dir)
+        if artifacts_stale(artifacts.manifest, model_dir):
+            print("⚠️ Artefak model lebih lama dari pickle, memakai pickle", file=sys.stderr)
+            artifacts = None
+    except FileNotFoundError:
+        artifacts = None
+    except ValueError as e:
+        print(f"⚠️ Artefak model tidak valid, memakai pickle: {e}", file=sys.stderr)
+        artifacts = None
+
+    if artifacts is not None:
+        label_encoder = artifacts.label_encoder()
+        svm_model, tfidf_vectorizer = artifacts.svm_model(), artifacts.tfidf_vectorizer()
+        pipeline_model = artifacts.pipeline_model()
+        manifest = artifacts.manifest
+    else:
+        def load(name):
+            return joblib.load(os.path.join(model_dir, SOURCE_FILES[name]))
+        label_encoder = load('le')
+        svm_model, tfidf_vectorizer = load('svm'), load('tfidf')
+        pipeline_model = load('pipeline')
+        # Sama seperti app.py: model asli dipakai jika tidak bisa diringkas / dilipat
+        try:
+            svm_model = PrimalLinearSVC.from_svc(svm_model)
+        except (AttributeError, ValueError):
+            pass  # kernel non-linear: pakai SVC asli
+        try:
+            pipeline_model = FoldedLinearPipeline.from_pipeline(pipeline_model)
+        except (AttributeError, ValueError):
+            pass
+        manifest = None
+
+    cache = get_prediction_cache()
+    return {
+        'svm': BatchPredictor(
+            svm_model, label_encoder, vectorizer=tfidf_vectorizer, preprocess=preprocess_text,
+            cache=cache, model_id='svm', model_version=model_version(('svm', 'tfidf'), manifest, model_dir),
+        ),
+        'pipeline': BatchPredictor(
+            pipeline_model, label_encoder, preprocess=preprocess_text,
+            cache=cache, model_id='pipeline', model_version=model_version(('pipeline',), manifest, model_dir),
+        ),
+    }
+
+
+class RequestError(Exception):
+    """Request tidak valid; dikirim ke client sebagai JSON {"error": ...}"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def prediction_to_json(labels, label_index, row):
+    """Dict {sentiment, confidence, probabilities} untuk satu baris hasil prediksi"""
+    return {
+        'sentiment': labels[label_index],
+        'confidence': float(row.max()),
+        'probabilities': dict(zip(labels, row.tolist())),
+    }
+
+
+def predictions_to_json(predictor, texts):
+    """List dict {sentiment, confidence, probabilities} untuk setiap teks"""
+    predicted, probabilities = predictor.predict_proba(texts)
+    labels = [str(label) for label in predictor.labels]
+    return [prediction_to_json(labels, label_index, row) for label_index, row in zip(predicted, probabilities)]
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 agar koneksi keep-alive bisa dipakai ulang oleh load tester / service lain
+    protocol_version = 'HTTP/1.1'
+    server_version = 'SentimentServe/1.0'
+    # Header dan body ditulis terpisah; tanpa TCP_NODELAY, Nagle + delayed ACK menambah ~40 ms
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            raise RequestError(400, "Header Content-Length tidak valid")
+        if length > MAX_BODY_BYTES:
+            raise RequestError(413, f"Body terlalu besar (maks {MAX_BODY_BYTES} byte)")
+        try:
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise RequestError(400, f"JSON tidak valid: {e}")
+        if not isinstance(payload, dict):
+            raise RequestError(400, "Body harus berupa objek JSON")
+        return payload
+
+    def _predictor(self, payload):
+        name = payload.get('model', DEFAULT_MODEL)
+        key = MODEL_ALIASES.get(name) if isinstance(name, str) else None
+        if key is None:
+            raise RequestError(400, f"Model tidak dikenal: {name!r} (pilih: {', '.join(MODEL_ALIASES)})")
+        return name, key
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {
+                'status': 'ok',
+                'models': sorted(MODEL_ALIASES),
+                'versions': {key: predictor.model_version for key, predictor in self.server.predictors.items()},
+                'pid': os.getpid(),
+            })
+        elif self.path == '/stats':
+            self._send_json(200, {
+                'pid': os.getpid(),
+                'prediction_cache': get_prediction_cache().stats(),
+                'micro_batching': {key: batcher.stats() for key, batcher in self.server.batchers.items()},
+            })
+        else:
+            self._send_json(404, {'error': f"Path tidak ditemukan: {self.path}"})
+
+    def do_POST(self):
+        try:
+            if self.path == '/predict':
+                payload = self._read_json()
+                name, key = self._predictor(payload)
+                text = payload.get('text')
+                if not isinstance(text, str):
+                    raise RequestError(400, "Field 'text' (string) wajib diisi")
+                predictor = self.server.predictors[key]
+                batcher = self.server.batchers.get(key)
+                if batcher is None:
+                    result = predictions_to_json(predictor, [text])[0]
+                else:
+                    label_index, row = batcher.predict(text)
+                    result = prediction_to_json([str(label) for label in predictor.labels], label_index, row)
+                self._send_json(200, {'model': name, **result})
+            elif self.path == '/predict/batch':
+                payload = self._read_json()
+                name, key = self._predictor(payload)
+                predictor = self.server.predictors[key]
+                texts = payload.get('texts')
+                if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                    raise RequestError(400, "Field 'texts' (list string) wajib diisi")
+                if len(texts) > MAX_BATCH_TEXTS:
+                    raise RequestError(413, f"Maksimal {MAX_BATCH_TEXTS} teks per batch")
+                self._send_json(200, {'model': name, 'predictions': predictions_to_json(predictor, texts)})
+            else:
+                raise RequestError(404, f"Path tidak ditemukan: {self.path}")
+        except RequestError as e:
+            if e.status in (400, 413):
+                # body mungkin belum terbaca habis, jadi koneksi tidak dipakai ulang
+                self.close_connection = True
+            self._send_json(e.status, {'error': str(e)})
+        except Exception as e:
+            # error prediksi: tetap balas JSON agar client tidak menerima koneksi terputus
+            print(f"⚠️ Prediksi gagal ({self.path}): {type(e).__name__}: {e}", file=sys.stderr)
+            self._send_json(500, {'error': f"Prediksi gagal: {type(e).__name__}: {e}"})
+
+
+class PredictionServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Backlog lebih besar dari default (5) untuk ratusan koneksi bersamaan
+    request_queue_size = 128
+
+    def __init__(self, address, predictors, reuse_port=False, verbose=False,
+                 batch_window=DEFAULT_MAX_WAIT, max_batch_size=DEFAULT_MAX_BATCH_SIZE):
+        self.predictors = predictors
+        # batch_window 0 mematikan micro-batching (setiap request diprediksi sendiri)
+        self.batchers = {
+            key: MicroBatcher(predictor.predict_rows, max_batch_size=max_batch_size, max_wait=batch_window)
+            for key, predictor in predictors.items()
+        } if batch_window > 0 else {}
+        self.reuse_port = reuse_port
+        self.verbose = verbose
+        super().__init__(address, PredictionHandler)
+
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def server_close(self):
+        super().server_close()
+        for batcher in self.batchers.values():
+            batcher.close()
+
+
+def _serve_worker(host, port, reuse_port, verbose, batch_window, max_batch_size):
+    predictors = load_predictors()
+    # Pemanasan: memicu pemuatan data NLTK/stopword sebelum request pertama
+    for predictor in predictors.values():
+        predictor.predict_proba(['aplikasi bagus'])
+    get_prediction_cache().clear()
+    server = PredictionServer(
+        (host, port), predictors, reuse_port=reuse_port, verbose=verbose,
+        batch_window=batch_window, max_batch_size=max_batch_size,
+    )
+    print(f"Worker {os.getpid()} melayani http://{host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=1, verbose=False,
+          batch_window=DEFAULT_MAX_WAIT, max_batch_size=DEFAULT_MAX_BATCH_SIZE):
+    """Jalankan server; `workers` > 1 memakai beberapa proses yang berbagi port (SO_REUSEPORT)"""
+    if workers > 1 and not hasattr(socket, 'SO_REUSEPORT'):
+        print("⚠️ SO_REUSEPORT tidak tersedia di platform ini, memakai 1 worker", file=sys.stderr)
+        workers = 1
+    if workers <= 1:
+        _serve_worker(host, port, False, verbose, batch_window, max_batch_size)
+        return
+    if port == 0:
+        raise ValueError("Port 0 tidak bisa dipakai bersama beberapa worker; pilih port tetap")
+
+    ctx = mp.get_context('spawn')
+    processes = [
+        ctx.Process(target=_serve_worker, args=(host, port, True, verbose, batch_window, max_batch_size), daemon=True)
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Server HTTP prediksi sentimen (model bawaan)")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=1, help="Jumlah proses worker (default 1)")
+    parser.add_argument('--verbose', action='store_true', help="Log setiap request")
+    parser.add_argument('--batch-window-ms', type=float, default=DEFAULT_MAX_WAIT * 1000,
+                        help="Jendela micro-batch /predict dalam ms (default 2; 0 = nonaktif)")
+    parser.add_argument('--max-batch-size', type=int, default=DEFAULT_MAX_BATCH_SIZE,
+                        help="Maksimal teks per micro-batch (default 256)")
+    args = parser.parse_args(argv)
+    serve(args.host, args.port, args.workers, args.verbose, args.batch_window_ms / 1000, args.max_batch_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""Normalisasi slang berbasis token-trie (mendukung key multi-kata).
+
+Kamus slang dikompilasi sekali menjadi trie per token, lalu teks dipindai satu kali
+dari kiri ke kanan dengan longest match. Dengan begitu key multi-kata seperti
+"au ah" atau "gak papa" ikut diganti, dan waktu normalisasi tidak bertambah seiring
+ukuran kamus (hanya bergantung pada jumlah token dan panjang key terpanjang).
+
+Perilaku untuk key satu kata sama dengan versi lama: pencocokan memakai `word.lower()`,
+token yang tidak cocok dibiarkan apa adanya, dan hasil digabung dengan satu spasi.
+"""
+import pandas as pd
+
+# Kamus slang dari notebook (dipakai pipeline halaman Upload CSV)
+NOTEBOOK_SLANGWORDS = {
+    "gk": "tidak", "ga": "tidak", "gak": "tidak", "ngga": "tidak", "nggak": "tidak",
+    "udah": "sudah", "udh": "sudah", "dah": "sudah",
+    "tp": "tapi", "tapi": "tetapi",
+    "bgt": "banget", "banget": "sangat",
+    "bgus": "bagus", "bgs": "bagus",
+    "jelek": "buruk", "jlek": "buruk",
+    "mantap": "bagus", "mantul": "bagus",
+    "keren": "bagus", "ok": "oke", "oke": "baik",
+    "thx": "terima kasih", "thanks": "terima kasih", "makasih": "terima kasih",
+    "plz": "tolong", "pls": "tolong",
+    "yg": "yang", "dgn": "dengan", "utk": "untuk", "sdh": "sudah",
+    "hrs": "harus", "tdk": "tidak", "blm": "belum", "krn": "karena",
+    "gmn": "bagaimana", "gimana": "bagaimana",
+    "knp": "kenapa", "knapa": "kenapa",
+    "emg": "memang", "emang": "memang",
+    "cuma": "hanya", "cm": "hanya",
+    "sih": "", "nih": "", "dong": "", "deh": "", "lah": "", "kah": "",
+    "@": "di", "abis": "habis", "wtb": "beli", "masi": "masih", "wts": "jual", "wtt": "tukar",
+    "maks": "maksimal", "plisss": "tolong", "bgttt": "banget", "indo": "indonesia", "bgtt": "banget",
+    "ad": "ada", "rv": "redvelvet", "plis": "tolong", "pls": "tolong", "cr": "sumber",
+    "cod": "bayar ditempat", "adlh": "adalah", "afaik": "as far as i know", "ahaha": "haha",
+    "aj": "saja", "ajep-ajep": "dunia gemerlap", "ak": "saya", "akika": "aku", "akkoh": "aku",
+    "akuwh": "aku", "alay": "norak", "alow": "halo", "ambilin": "ambilkan", "ancur": "hancur",
+    "anjrit": "anjing", "anter": "antar", "ap2": "apa-apa", "apasih": "apa sih", "apes": "sial",
+    "aps": "apa", "aq": "saya", "aquwh": "aku", "asbun": "asal bunyi", "aseekk": "asyik",
+    "asekk": "asyik", "asem": "asam", "astul": "asal tulis", "ato": "atau",
+    "au ah": "tidak mau tahu", "awak": "saya", "ay": "sayang", "ayank": "sayang",
+    "b4": "sebelum", "bakalan": "akan", "bangedh": "banget", "begajulan": "nakal",
+    "beliin": "belikan", "bencong": "banci", "bentar": "sebentar", "ber3": "bertiga",
+    "beresin": "membereskan", "bete": "bosan", "beud": "banget", "bg": "abang",
+    "bgmn": "bagaimana", "bijimane": "bagaimana", "bkl": "akan", "bknnya": "bukannya",
+    "blegug": "bodoh", "blh": "boleh", "bln": "bulan", "blum": "belum", "bnci": "benci",
+    "bnran": "yang benar", "bodor": "lucu", "bokap": "ayah", "boker": "buang air besar",
+    "bokis": "bohong", "boljug": "boleh juga", "boyeh": "boleh", "br": "baru",
+    "brg": "bareng", "bro": "saudara laki-laki", "bru": "baru", "bs": "bisa",
+    "bsen": "bosan", "bt": "buat", "btw": "ngomong-ngomong", "buaya": "tidak setia",
+    "bubbu": "tidur", "bubu": "tidur", "bw": "bawa", "bwt": "buat", "byk": "banyak",
+    "byrin": "bayarkan", "cabal": "sabar", "cadas": "keren", "can": "belum",
+    "capcus": "pergi", "caper": "cari perhatian", "ce": "cewek", "cemen": "penakut",
+    "cengengesan": "tertawa", "cepet": "cepat", "cew": "cewek", "chuyunk": "sayang",
+    "cimeng": "ganja", "ciyh": "sih", "ckepp": "cakep", "ckp": "cakep",
+    "cmiiw": "correct me if i'm wrong", "cmpur": "campur", "cong": "banci",
+    "cowwyy": "maaf", "cp": "siapa", "cpe": "capek", "cppe": "capek", "cucok": "cocok",
+    "cuex": "cuek", "cumi": "Cuma miscall", "cups": "culun", "cwek": "cewek",
+    "cyin": "cinta", "d": "di", "dah": "deh", "dapet": "dapat", "de": "adik",
+    "dek": "adik", "demen": "suka", "deyh": "deh", "dgn": "dengan", "diancurin": "dihancurkan",
+    "dimaafin": "dimaafkan", "dimintak": "diminta", "disono": "di sana", "dket": "dekat",
+    "dkk": "dan kawan-kawan", "dll": "dan lain-lain", "dlu": "dulu", "dngn": "dengan",
+    "dodol": "bodoh", "doku": "uang", "dongs": "dong", "dpt": "dapat", "dri": "dari",
+    "drmn": "darimana", "drtd": "dari tadi", "dst": "dan seterusnya", "dtg": "datang",
+    "duh": "aduh", "duren": "durian", "ed": "edisi", "egp": "emang gue pikirin",
+    "eke": "aku", "elu": "kamu", "emangnya": "memangnya", "emng": "memang", "endak": "tidak",
+    "enggak": "tidak", "envy": "iri", "ex": "mantan", "fax": "facsimile",
+    "fifo": "first in first out", "folbek": "follow back", "fyi": "sebagai informasi",
+    "gaada": "tidak ada uang", "gag": "tidak", "gaje": "tidak jelas", "gak papa": "tidak apa-apa",
+    "gan": "juragan", "gaptek": "gagap teknologi", "gatek": "gagap teknologi", "gawe": "kerja",
+    "gbs": "tidak bisa", "gebetan": "orang yang disuka", "geje": "tidak jelas",
+    "gile": "gila", "gino": "gigi nongol", "githu": "gitu", "gj": "tidak jelas",
+    "gmana": "bagaimana", "gn": "begini", "goblok": "bodoh", "gowes": "mengayuh sepeda",
+    "gpny": "tidak punya", "gr": "gede rasa", "gretongan": "gratisan", "gtau": "tidak tahu",
+    "gua": "saya", "guoblok": "goblok", "gw": "saya"
+}
+
+# Penanda akhir key di dalam trie (bukan string agar tidak bentrok dengan token)
+_END = object()
+
+
+class SlangNormalizer:
+    """Normalizer slang yang dikompilasi dari dict {slang: kata baku}"""
+
+    def __init__(self, mapping):
+        self.mapping = dict(mapping)
+        self._trie = {}
+        self.max_words = 0
+        for key, value in self.mapping.items():
+            words = key.split()
+            if not words:
+                continue
+            node = self._trie
+            for word in words:
+                node = node.setdefault(word, {})
+            node[_END] = value
+            self.max_words = max(self.max_words, len(words))
+
+    def __reduce__(self):
+        # Trie memakai sentinel _END milik modul ini; bangun ulang dari mapping saat unpickle
+        return (SlangNormalizer, (self.mapping,))
+
+    def normalize_tokens(self, tokens):
+        """Normalisasi list token, kembalikan list token baru"""
+        trie = self._trie
+        lowered = [token.lower() for token in tokens]
+        result = []
+        i = 0
+        n = len(tokens)
+        while i < n:
+            node = trie.get(lowered[i])
+            match_value = None
+            match_end = i
+            j = i
+            while node is not None:
+                if _END in node:
+                    match_value = node[_END]
+                    match_end = j + 1
+                j += 1
+                if j >= n:
+                    break
+                node = node.get(lowered[j])
+            if match_end > i:
+                result.append(match_value)
+                i = match_end
+            else:
+                result.append(tokens[i])
+                i += 1
+        return result
+
+    def normalize(self, text):
+        """Normalisasi satu teks"""
+        return ' '.join(self.normalize_tokens(text.split()))
+
+    __call__ = normalize
+
+    def normalize_series(self, series):
+        """Normalisasi seluruh Series; teks yang sama hanya diproses sekali"""
+        series = pd.Series(series)
+        normalized = {text: self.normalize(text) for text in pd.unique(series.astype(str))}
+        return series.astype(str).map(normalized)
@@ -0,0 +1,188 @@
+"""Layanan stemming Sastrawi dengan cache per kata.
+
+Stemmer Sastrawi cukup mahal dibuat (memuat kamus kata dasar) dan mahal dipanggil,
+sedangkan kosakata ulasan sangat berulang. Layanan ini:
+    - membuat satu instance stemmer saja (lazy, thread-safe),
+    - meng-cache hasil per kata unik di LRU memori yang dibatasi ukurannya,
+    - menyimpan hasil ke SQLite di disk agar tetap ada setelah restart,
+    - bisa di-seed dari kosakata `tfidf_vectorizer.pkl`.
+"""
+import functools
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(BASE_DIR, '.cache')
+DEFAULT_STEM_CACHE_PATH = os.path.join(CACHE_DIR, 'stem_cache.sqlite3')
+DEFAULT_VECTORIZER_PATH = os.path.join(BASE_DIR, 'model', 'tfidf_vectorizer.pkl')
+
+DEFAULT_MAXSIZE = 200_000
+# Beberapa proses (worker pool) bisa menulis ke file yang sama; tunggu lock cukup lama
+SQLITE_TIMEOUT = 30
+# Jumlah stem baru yang dikumpulkan sebelum ditulis ke disk
+FLUSH_EVERY = 1_000
+
+
+class StemmingService:
+    """Stemming per kata unik dengan LRU memori + cache SQLite opsional"""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, cache_path=DEFAULT_STEM_CACHE_PATH):
+        self.cache_path = cache_path
+        self._stemmer = None
+        self._lock = threading.Lock()
+        self._db = None
+        self._pending = {}
+        self._stem_cached = functools.lru_cache(maxsize=maxsize)(self._stem_uncached)
+
+    # ---------- stemmer & disk ----------
+    def _get_stemmer(self):
+        if self._stemmer is None:
+            with self._lock:
+                if self._stemmer is None:
+                    from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
+                    stemmer = StemmerFactory().create_stemmer()
+                    # CachedStemmer bawaan Sastrawi punya cache tanpa batas; pakai stemmer intinya saja
+                    self._stemmer = getattr(stemmer, 'delegatedStemmer', stemmer)
+        return self._stemmer
+
+    def _get_db(self):
+        if self._db is None and self.cache_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+            db = sqlite3.connect(self.cache_path, timeout=SQLITE_TIMEOUT, check_same_thread=False)
+            # WAL: pembaca tidak memblokir penulis, penulis dari proses lain cukup antre
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS stems (word TEXT PRIMARY KEY, stem TEXT NOT NULL)')
+            db.commit()
+            self._db = db
+        return self._db
+
+    def _disk_get(self, word):
+        with self._lock:
+            stem = self._pending.get(word)
+            if stem is not None:
+                return stem
+            db = self._get_db()
+            if db is None:
+                return None
+            try:
+                row = db.execute('SELECT stem FROM stems WHERE word = ?', (word,)).fetchone()
+            except sqlite3.OperationalError:
+                return None
+        return row[0] if row else None
+
+    def _stem_uncached(self, word):
+        stem = self._disk_get(word)
+        if stem is None:
+            stem = self._get_stemmer().stem(word)
+            if self.cache_path:
+                with self._lock:
+                    self._pending[word] = stem
+                    should_flush = len(self._pending) >= FLUSH_EVERY
+                if should_flush:
+                    self.flush()
+        return stem
+
+    def flush(self):
+        """Tulis stem baru yang masih di memori ke cache disk"""
+        with self._lock:
+            db = self._get_db()
+            if db is None or not self._pending:
+                return 0
+            items = list(self._pending.items())
+            try:
+                db.executemany('INSERT OR REPLACE INTO stems (word, stem) VALUES (?, ?)', items)
+                db.commit()
+            except sqlite3.OperationalError:
+                # Database sedang dikunci proses lain: simpan di _pending dan coba lagi di flush berikutnya
+                db.rollback()
+                return 0
+            self._pending.clear()
+        return len(items)
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ---------- API ----------
+    def stem_word(self, word):
+        """Stem satu kata (memoized)"""
+        return self._stem_cached(word)
+
+    def stem_tokens(self, tokens):
+        """Stem list token"""
+        stem_word = self._stem_cached
+        return [stem_word(token) for token in tokens]
+
+    def stem_text(self, text):
+        """Stem teks yang dipisah spasi (pengganti stemmingText)"""
+        return ' '.join(self.stem_tokens(text.split()))
+
+    def stem_series(self, series):
+        """Stem seluruh Series teks; setiap kata unik hanya di-stem sekali"""
+        series = pd.Series(series)
+        split_texts = [str(text).split() for text in series.fillna('').tolist()]
+        unique_words = {word for words in split_texts for word in words}
+        mapping = {word: self._stem_cached(word) for word in unique_words}
+        self.flush()
+        stemmed = [' '.join(mapping[word] for word in words) for words in split_texts]
+        return pd.Series(stemmed, index=series.index, name=series.name, dtype=object)
+
+    def lookup_cached(self, words):
+        """Stem yang sudah ada di cache disk untuk `words` (tanpa memanggil Sastrawi)"""
+        found = {}
+        for word in words:
+            stem = self._disk_get(word)
+            if stem is not None:
+                found[word] = stem
+        return found
+
+    def add_stems(self, stems):
+        """Simpan stem yang dihitung di tempat lain (mis. worker pool) ke cache disk"""
+        if not self.cache_path:
+            return 0
+        with self._lock:
+            self._pending.update(stems)
+        return self.flush()
+
+    def seed_from_vectorizer(self, vectorizer_path=DEFAULT_VECTORIZER_PATH):
+        """Isi cache disk dari kosakata vectorizer (kata-kata dari unigram/n-gram)"""
+        import joblib
+        vectorizer = joblib.load(vectorizer_path)
+        vocabulary = getattr(vectorizer, 'vocabulary_', {})
+        words = {word for term in vocabulary for word in term.split()}
+        for word in words:
+            self._stem_cached(word)
+        self.flush()
+        return len(words)
+
+    def cache_info(self):
+        """Statistik LRU (hits, misses, maxsize, currsize)"""
+        return self._stem_cached.cache_info()
+
+
+_default_service = None
+_default_lock = threading.Lock()
+
+
+def get_stemming_service():
+    """Instance StemmingService bersama untuk satu proses"""
+    global _default_service
+    if _default_service is None:
+        with _default_lock:
+            if _default_service is None:
+                _default_service = StemmingService()
+    return _default_service
+
+
+if __name__ == '__main__':
+    # python -m sentiment.stemming  -> seed cache dari model/tfidf_vectorizer.pkl
+    service = get_stemming_service()
+    count = service.seed_from_vectorizer()
+    service.close()
+    print(f"Seeded {count} kata ke {service.cache_path}")
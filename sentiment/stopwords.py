@@ -0,0 +1,71 @@
+"""Registry stopword yang dibangun sekali dan dipakai bersama semua pipeline preprocessing.
+
+Setiap daftar dibangun lazy saat pertama kali diminta lalu disimpan sebagai frozenset,
+sehingga korpus NLTK hanya dibaca sekali per proses (bukan sekali per review).
+
+Daftar bawaan:
+    - 'indonesian' / 'english' : stopwords NLTK
+    - 'notebook'  : NLTK Indonesia + kata tambahan notebook (remove_stopwords di app.py)
+    - 'training'  : NLTK Indonesia + Inggris + kata tambahan (templates/Model.py)
+    - 'custom'    : daftar Indonesia manual + NLTK Inggris (remove_stopwords_custom)
+"""
+import threading
+
+# Kata tambahan dari notebook
+NOTEBOOK_EXTRA_STOPWORDS = (
+    'iya', 'yaa', 'gak', 'nya', 'na', 'sih', 'ku', 'di', 'ga', 'ya', 'gaa', 'loh', 'kah', 'woi', 'woii', 'woy'
+)
+
+# Stopwords Indonesia manual untuk full_preprocess_pipeline
+CUSTOM_INDONESIAN_STOPWORDS = (
+    'yang', 'untuk', 'pada', 'ke', 'para', 'namun', 'menurut', 'antara', 'dia', 'dua',
+    'ia', 'seperti', 'jika', 'jika', 'sehingga', 'kembali', 'dan', 'tidak', 'ini', 'karena',
+    'oleh', 'itu', 'dalam', 'dari', 'dengan', 'di', 'ada', 'akan', 'sudah', 'bisa', 'dapat',
+    'saat', 'hanya', 'atau', 'juga', 'setelah', 'mereka', 'saya', 'kamu', 'kami', 'kita'
+)
+
+
+def _nltk_stopwords(language):
+    from nltk.corpus import stopwords
+    return stopwords.words(language)
+
+
+_BUILDERS = {
+    'indonesian': lambda: _nltk_stopwords('indonesian'),
+    'english': lambda: _nltk_stopwords('english'),
+    'notebook': lambda: get_stopwords('indonesian') | set(NOTEBOOK_EXTRA_STOPWORDS),
+    'training': lambda: get_stopwords('indonesian') | get_stopwords('english') | set(NOTEBOOK_EXTRA_STOPWORDS),
+    'custom': lambda: get_stopwords('english') | set(CUSTOM_INDONESIAN_STOPWORDS),
+}
+
+_registry = {}
+_lock = threading.RLock()
+
+
+def get_stopwords(name):
+    """Ambil daftar stopword (frozenset) berdasarkan nama, dibangun sekali saat pertama dipakai"""
+    words = _registry.get(name)
+    if words is not None:
+        return words
+    with _lock:
+        if name not in _registry:
+            if name not in _BUILDERS:
+                raise KeyError(f"Daftar stopword tidak dikenal: {name!r}")
+            _registry[name] = frozenset(_BUILDERS[name]())
+        return _registry[name]
+
+
+def register_stopwords(name, words):
+    """Daftarkan (atau ganti) daftar stopword dengan nama tertentu"""
+    words = frozenset(words)
+    with _lock:
+        _BUILDERS[name] = lambda: words
+        # daftar turunan (mis. 'notebook') dibangun ulang dari daftar yang baru
+        _registry.clear()
+    return words
+
+
+def filter_tokens(tokens, name):
+    """Buang token yang ada di daftar stopword `name`"""
+    stop_words = get_stopwords(name)
+    return [token for token in tokens if token not in stop_words]
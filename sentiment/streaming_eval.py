@@ -0,0 +1,253 @@
+"""Evaluasi streaming: prediksi per chunk dengan akumulasi metrik inkremental.
+
+`evaluate_models` memegang matriks TF-IDF, semua prediksi, dan semua skor data uji sekaligus.
+Di sini data uji diproses per chunk (default 50.000 baris) dan yang disimpan antar chunk
+hanya:
+    - confusion matrix per model (n_kelas x n_kelas),
+    - histogram skor kelas positif/negatif per model (`RocHistogram`, jumlah bin tetap),
+sehingga memori tidak bergantung pada jumlah baris. Metrik weighted dan per kelas dihitung
+dari confusion matrix (hasilnya sama persis dengan sklearn). ROC/AUC micro-average dihitung
+dari histogram: skor dalam bin yang sama dianggap seri, jadi selisih AUC terhadap hitungan
+exact dibatasi oleh proporsi pasangan positif-negatif yang jatuh di bin yang sama (~1e-5
+dengan 65.536 bin). Skor dipetakan ke (0, 1) dengan arctan sebelum di-bin (probabilitas LR
+di-logit dulu agar skor yang menumpuk di dekat 0 dan 1 tersebar ke banyak bin); pemetaan
+monoton tidak mengubah urutan skor, jadi tidak mengubah ROC.
+
+Hasil memakai kunci yang sama dengan `evaluate_models` (tanpa array per baris), sehingga
+bisa di-cache dan dirender dengan cara yang sama.
+
+    python -m sentiment.streaming_eval data/ulasan_aplikasi_labelled.csv --chunk-size 50000 --check
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from sentiment.evaluation import (
+    EVAL_SPLIT_SEED, EVAL_TEST_SIZE, MODEL_PREFIXES, predict_models, score_positives, split_test_index,
+)
+
+DEFAULT_EVAL_CHUNK_SIZE = 50_000
+DEFAULT_ROC_BINS = 2 ** 16
+# Halaman Evaluasi memakai evaluasi streaming jika data uji lebih besar dari ini
+STREAMING_EVAL_MIN_ROWS = 100_000
+
+
+def metrics_from_confusion(cm):
+    """(array [accuracy, precision, recall, f1] weighted, metrik per kelas n_kelas x 4).
+
+    Sama dengan `classification_metrics` (sklearn, zero_division=0) tapi hanya dari
+    confusion matrix.
+    """
+    cm = np.asarray(cm, dtype=np.float64)
+    true_positive = np.diag(cm)
+    predicted = cm.sum(axis=0)
+    support = cm.sum(axis=1)
+    total = support.sum()
+    zeros = np.zeros_like(true_positive)
+    precision = np.divide(true_positive, predicted, out=zeros.copy(), where=predicted > 0)
+    recall = np.divide(true_positive, support, out=zeros.copy(), where=support > 0)
+    f1 = np.divide(2 * precision * recall, precision + recall, out=zeros.copy(), where=(precision + recall) > 0)
+    weights = support / total if total else zeros
+    metrics = np.array([
+        true_positive.sum() / total if total else 0.0,
+        (precision * weights).sum(),
+        (recall * weights).sum(),
+        (f1 * weights).sum(),
+    ])
+    return metrics, np.column_stack([precision, recall, f1, support])
+
+
+class RocHistogram:
+    """Histogram skor sampel positif/negatif (one-vs-rest) untuk ROC micro-average.
+
+    `probability=True` untuk skor probabilitas [0, 1]: skor di-logit sebelum dipetakan.
+    """
+
+    def __init__(self, bins=DEFAULT_ROC_BINS, probability=False):
+        self.bins = bins
+        self.probability = probability
+        self.positive = np.zeros(bins, dtype=np.int64)
+        self.negative = np.zeros(bins, dtype=np.int64)
+
+    def _bin_index(self, scores):
+        scores = np.asarray(scores, dtype=np.float64)
+        if self.probability:
+            with np.errstate(divide='ignore'):
+                # logit; probabilitas 0 / 1 menjadi -inf / inf (bin pertama / terakhir)
+                scores = np.log(scores) - np.log1p(-scores)
+        unit = 0.5 + np.arctan(scores) / np.pi
+        return np.clip((unit * self.bins).astype(np.intp), 0, self.bins - 1)
+
+    def update(self, positive, scores):
+        positive = np.asarray(positive, dtype=bool).ravel()
+        index = self._bin_index(np.asarray(scores).ravel())
+        self.positive += np.bincount(index[positive], minlength=self.bins)
+        self.negative += np.bincount(index[~positive], minlength=self.bins)
+
+    def curve(self):
+        """(fpr, tpr, auc) dengan threshold turun dari bin tertinggi; bin kosong dilewati"""
+        n_positive, n_negative = self.positive.sum(), self.negative.sum()
+        if not n_positive or not n_negative:
+            raise ValueError("ROC membutuhkan sampel positif dan negatif")
+        positive, negative = self.positive[::-1], self.negative[::-1]
+        keep = np.concatenate([[True], (positive + negative) > 0])
+        tpr = np.concatenate([[0], np.cumsum(positive)])[keep] / n_positive
+        fpr = np.concatenate([[0], np.cumsum(negative)])[keep] / n_negative
+        # trapesium: sampel seri dalam satu bin dihitung setengah
+        auc_value = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+        return fpr, tpr, auc_value
+
+
+class StreamingEvaluator:
+    """Akumulasi confusion matrix dan histogram ROC kedua model, satu chunk per `update`"""
+
+    def __init__(self, svm_model, tfidf_vectorizer, pipeline_model, label_encoder, preprocess=None,
+                 bins=DEFAULT_ROC_BINS):
+        self.svm_model = svm_model
+        self.tfidf_vectorizer = tfidf_vectorizer
+        self.pipeline_model = pipeline_model
+        self.label_encoder = label_encoder
+        self.preprocess = preprocess
+        self.n_classes = len(label_encoder.classes_)
+        self.confusion = {prefix: np.zeros((self.n_classes, self.n_classes), dtype=np.int64) for prefix in MODEL_PREFIXES}
+        # skor SVM dari decision_function, skor LR dari predict_proba
+        self.roc = {'svm': RocHistogram(bins), 'pipeline': RocHistogram(bins, probability=True)}
+        self.n_rows = 0
+
+    def update(self, texts, y_encoded):
+        """Prediksi satu chunk (teks mentah + label terenkode) lalu tambahkan ke akumulator"""
+        y_encoded = np.asarray(y_encoded, dtype=np.intp)
+        if not len(y_encoded):
+            return
+        texts = pd.Series(texts).fillna('')
+        if self.preprocess is not None:
+            texts = texts.apply(self.preprocess)
+        predictions = predict_models(texts, self.svm_model, self.tfidf_vectorizer, self.pipeline_model, self.label_encoder)
+        n = self.n_classes
+        for prefix in MODEL_PREFIXES:
+            pred, scores, class_codes = predictions[prefix]
+            cells = y_encoded * n + np.asarray(pred, dtype=np.intp)
+            self.confusion[prefix] += np.bincount(cells, minlength=n * n).reshape(n, n)
+            self.roc[prefix].update(*score_positives(y_encoded, class_codes, scores))
+        self.n_rows += len(y_encoded)
+
+    def result(self):
+        """Hasil dengan kunci yang sama seperti `evaluate_models`, tanpa array per baris"""
+        result = {
+            'label_classes': np.asarray(self.label_encoder.classes_).astype(str),
+            'n_test': np.int64(self.n_rows),
+        }
+        for prefix in MODEL_PREFIXES:
+            cm = self.confusion[prefix].copy()
+            result[f'{prefix}_cm'] = cm
+            result[f'{prefix}_metrics'], result[f'{prefix}_class_metrics'] = metrics_from_confusion(cm)
+            try:
+                fpr, tpr, auc_value = self.roc[prefix].curve()
+                error = ''
+            except ValueError as e:
+                fpr, tpr, auc_value, error = np.empty(0), np.empty(0), np.nan, str(e)
+            result[f'{prefix}_roc_fpr'], result[f'{prefix}_roc_tpr'] = fpr, tpr
+            result[f'{prefix}_auc'] = np.float64(auc_value)
+            result[f'{prefix}_roc_error'] = np.str_(error)
+        return result
+
+
+def evaluate_models_streaming(texts, y_encoded, svm_model, tfidf_vectorizer, pipeline_model, label_encoder,
+                              preprocess=None, seed=EVAL_SPLIT_SEED, test_size=EVAL_TEST_SIZE, test_index=None,
+                              chunk_size=DEFAULT_EVAL_CHUNK_SIZE, bins=DEFAULT_ROC_BINS, progress_callback=None):
+    """Versi streaming `evaluate_models`: split uji yang sama, diprediksi per `chunk_size` baris.
+
+    `progress_callback(jumlah_baris_selesai, total)` dipanggil setelah setiap chunk.
+    """
+    y_encoded = np.asarray(y_encoded)
+    if test_index is None:
+        test_index = split_test_index(y_encoded, seed, test_size)
+    texts = pd.Series(texts)
+    evaluator = StreamingEvaluator(svm_model, tfidf_vectorizer, pipeline_model, label_encoder, preprocess, bins)
+    for start in range(0, len(test_index), chunk_size):
+        index = test_index[start:start + chunk_size]
+        evaluator.update(texts.iloc[index], y_encoded[index])
+        if progress_callback is not None:
+            progress_callback(evaluator.n_rows, len(test_index))
+    return evaluator.result()
+
+
+def evaluate_csv(path, svm_model, tfidf_vectorizer, pipeline_model, label_encoder, preprocess=None,
+                 text_column='final_text', label_column='polarity', chunk_size=DEFAULT_EVAL_CHUNK_SIZE,
+                 bins=DEFAULT_ROC_BINS):
+    """Evaluasi semua baris CSV berlabel; file dibaca per chunk, hanya dua kolom yang diparse"""
+    evaluator = StreamingEvaluator(svm_model, tfidf_vectorizer, pipeline_model, label_encoder, preprocess, bins)
+    chunks = pd.read_csv(path, usecols=[text_column, label_column], dtype=str, chunksize=chunk_size)
+    for chunk in chunks:
+        chunk = chunk.dropna(subset=[label_column])
+        evaluator.update(chunk[text_column], label_encoder.transform(chunk[label_column]))
+    return evaluator.result()
+
+
+def _load_bundled_models(model_dir):
+    import joblib
+
+    from sentiment.artifacts import SOURCE_FILES
+    from sentiment.folding import FoldedLinearPipeline
+    from sentiment.primal import PrimalLinearSVC
+
+    def load(name):
+        return joblib.load(os.path.join(model_dir, SOURCE_FILES[name]))
+    return (
+        PrimalLinearSVC.from_svc(load('svm')), load('tfidf'),
+        FoldedLinearPipeline.from_pipeline(load('pipeline')), load('le'),
+    )
+
+
+def _summary(result):
+    summary = {'n_test': int(result.get('n_test', len(result.get('y_test', []))))}
+    for prefix in MODEL_PREFIXES:
+        summary[prefix] = {
+            'metrics': result[f'{prefix}_metrics'].tolist(),
+            'auc': float(result[f'{prefix}_auc']),
+            'confusion_matrix': result[f'{prefix}_cm'].tolist(),
+        }
+    return summary
+
+
+def main(argv=None):
+    from sentiment.artifacts import MODEL_DIR
+    from sentiment.predict import preprocess_text
+
+    parser = argparse.ArgumentParser(description="Evaluasi streaming model bawaan pada CSV berlabel")
+    parser.add_argument('path', help="CSV berlabel (kolom final_text dan polarity)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_EVAL_CHUNK_SIZE)
+    parser.add_argument('--bins', type=int, default=DEFAULT_ROC_BINS, help="Jumlah bin histogram ROC")
+    parser.add_argument('--model-dir', default=MODEL_DIR)
+    parser.add_argument('--check', action='store_true',
+                        help="Bandingkan dengan evaluasi exact (memuat seluruh data ke memori)")
+    args = parser.parse_args(argv)
+
+    models = _load_bundled_models(args.model_dir)
+    result = evaluate_csv(args.path, *models, preprocess=preprocess_text, chunk_size=args.chunk_size, bins=args.bins)
+    output = {'streaming': _summary(result)}
+    if args.check:
+        from sentiment.evaluation import evaluate_models
+
+        frame = pd.read_csv(args.path, usecols=['final_text', 'polarity'], dtype=str).dropna(subset=['polarity'])
+        labels = models[3].transform(frame['polarity'])
+        exact = evaluate_models(frame['final_text'], labels, *models, preprocess=preprocess_text,
+                                test_index=np.arange(len(frame)))
+        output['exact'] = _summary(exact)
+        output['max_abs_diff'] = {
+            prefix: {
+                'metrics': float(np.abs(result[f'{prefix}_metrics'] - exact[f'{prefix}_metrics']).max()),
+                'auc': float(abs(result[f'{prefix}_auc'] - exact[f'{prefix}_auc'])),
+                'confusion_matrix': int(np.abs(result[f'{prefix}_cm'] - exact[f'{prefix}_cm']).max()),
+            }
+            for prefix in MODEL_PREFIXES
+        }
+    print(json.dumps(output, indent=2))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
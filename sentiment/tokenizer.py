@@ -0,0 +1,155 @@
+"""Tokenizer cepat sebagai alternatif `nltk.word_tokenize`.
+
+Di pipeline aplikasi, tokenisasi dijalankan setelah `remove_noise`, jadi sebagian besar
+teks tidak lagi berisi punctuation ASCII. Pengecualiannya berasal dari kamus slang yang
+bisa memasukkan punctuation kembali ("cmiiw" -> "correct me if i'm wrong",
+"otw" -> "on the way, sedang di jalan"). Mode yang tersedia:
+
+    - 'nltk'  : `nltk.word_tokenize` (perilaku lama, default)
+    - 'regex' : teks tanpa punctuation ASCII: aturan NLTKWordTokenizer yang masih relevan
+                (kutip/dash Unicode dan kontraksi seperti "cannot", "gonna"), lalu split
+                di whitespace. Teks dengan punctuation ASCII: dipecah per kalimat di
+                `.`/`!`/`?` lalu diproses NLTKWordTokenizer (koma, titik, kontraksi
+                Treebank `'m`, `'s`, `n't`, ...), seperti `word_tokenize` tanpa model Punkt
+    - 'split' : `str.split()` murni
+
+Gunakan `check_parity` untuk melihat perbedaan token terhadap `word_tokenize` pada
+korpus sendiri sebelum berpindah mode.
+"""
+import re
+import string
+
+import pandas as pd
+
+TOKENIZER_MODES = ('nltk', 'regex', 'split')
+# Naikkan jika hasil tokenizer berubah (masuk fingerprint cache preprocessing)
+TOKENIZER_VERSION = 2
+DEFAULT_TOKENIZER_MODE = 'nltk'
+
+# Karakter yang dipisah NLTKWordTokenizer walaupun tidak ada punctuation ASCII
+_UNICODE_PUNCT_RE = re.compile('[«“‘„»”’‒-―]')
+_UNICODE_PUNCT_CHARS = frozenset('«“‘„»”’‒–—―')
+_ASCII_PUNCT_CHARS = frozenset(string.punctuation)
+# Batas kalimat versi sederhana dari Punkt: spasi setelah tanda akhir kalimat
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Kontraksi MacIntyre (CONTRACTIONS2) yang tidak memakai apostrof, digabung jadi satu regex
+_CONTRACTION_RE = re.compile(
+    r'(?i)\b(?:(can)(not)\b|(gim)(me)\b|(gon)(na)\b|(got)(ta)\b|(lem)(me)\b|(wan)(na)(?=\s|$))'
+)
+
+
+def _split_contraction(match):
+    return ' ' + ' '.join(part for part in match.groups() if part) + ' '
+
+
+def _nltk_tokenize(text):
+    from nltk.tokenize import word_tokenize
+    return word_tokenize(text)
+
+
+_treebank_tokenizer = None
+
+
+def _treebank_tokenize(text):
+    global _treebank_tokenizer
+    if _treebank_tokenizer is None:
+        from nltk.tokenize.destructive import NLTKWordTokenizer
+        _treebank_tokenizer = NLTKWordTokenizer()
+    return [token for sentence in _SENTENCE_END_RE.split(text) for token in _treebank_tokenizer.tokenize(sentence)]
+
+
+def _regex_tokenize(text):
+    if not _ASCII_PUNCT_CHARS.isdisjoint(text):
+        # jarang (punctuation dari kamus slang): pakai aturan Treebank lengkap
+        return _treebank_tokenize(text)
+    if not text.isascii() and not _UNICODE_PUNCT_CHARS.isdisjoint(text):
+        text = _UNICODE_PUNCT_RE.sub(r' \g<0> ', text)
+    return _CONTRACTION_RE.sub(_split_contraction, text).split()
+
+
+def _split_tokenize(text):
+    return text.split()
+
+
+_TOKENIZERS = {
+    'nltk': _nltk_tokenize,
+    'regex': _regex_tokenize,
+    'split': _split_tokenize,
+}
+
+
+def get_tokenizer(mode=DEFAULT_TOKENIZER_MODE):
+    """Ambil fungsi tokenizer untuk mode tertentu"""
+    try:
+        return _TOKENIZERS[mode]
+    except KeyError:
+        raise ValueError(f"Mode tokenizer tidak dikenal: {mode!r} (pilihan: {', '.join(TOKENIZER_MODES)})")
+
+
+def tokenize(text, mode=DEFAULT_TOKENIZER_MODE):
+    """Tokenisasi satu teks"""
+    return get_tokenizer(mode)(text)
+
+
+def tokenize_series(series, mode=DEFAULT_TOKENIZER_MODE):
+    """Tokenisasi seluruh Series; teks yang sama hanya ditokenisasi sekali"""
+    tokenizer = get_tokenizer(mode)
+    series = pd.Series(series)
+    cache = {}
+    tokens = []
+    for text in series.tolist():
+        result = cache.get(text)
+        if result is None:
+            result = cache[text] = tokenizer(text)
+        # list baru per baris agar perubahan di satu baris tidak bocor ke baris lain
+        tokens.append(list(result))
+    return pd.Series(tokens, index=series.index, name=series.name, dtype=object)
+
+
+def check_parity(texts, mode='regex', max_examples=20):
+    """Bandingkan tokenizer `mode` dengan `word_tokenize` pada korpus `texts`.
+
+    Mengembalikan dict berisi jumlah teks, jumlah teks yang berbeda, dan DataFrame
+    contoh perbedaan (kolom: text, nltk_tokens, fast_tokens).
+    """
+    fast = get_tokenizer(mode)
+    total = 0
+    mismatches = 0
+    examples = []
+    for text in texts:
+        text = str(text)
+        total += 1
+        expected = _nltk_tokenize(text)
+        actual = fast(text)
+        if expected != actual:
+            mismatches += 1
+            if len(examples) < max_examples:
+                examples.append({'text': text, 'nltk_tokens': expected, 'fast_tokens': actual})
+    return {
+        'mode': mode,
+        'total': total,
+        'mismatches': mismatches,
+        'match_rate': (total - mismatches) / total if total else 1.0,
+        'examples': pd.DataFrame(examples, columns=['text', 'nltk_tokens', 'fast_tokens']),
+    }
+
+
+if __name__ == '__main__':
+    # python -m sentiment.tokenizer data.csv [kolom] [mode]
+    import sys
+
+    from sentiment.cleaning import clean_series
+    from sentiment.slang import NOTEBOOK_SLANGWORDS, SlangNormalizer
+
+    path = sys.argv[1]
+    column = sys.argv[2] if len(sys.argv) > 2 else 'content'
+    mode = sys.argv[3] if len(sys.argv) > 3 else 'regex'
+    # Urutan sama dengan pipeline Upload CSV: clean -> lower -> slang -> tokenize
+    corpus = clean_series(pd.read_csv(path, usecols=[column])[column]).str.lower()
+    corpus = SlangNormalizer(NOTEBOOK_SLANGWORDS).normalize_series(corpus)
+    report = check_parity(corpus, mode=mode)
+    print(f"Mode {report['mode']}: {report['total'] - report['mismatches']}/{report['total']} teks identik "
+          f"({report['match_rate']:.2%})")
+    if report['mismatches']:
+        print(report['examples'].to_string())